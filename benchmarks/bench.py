@@ -0,0 +1,348 @@
+"""
+Performance benchmarks of tim-gui against a local fake tim backend. Every inventory size runs in its
+own process, under the Qt offscreen platform, so the peak RSS of each one is measured apart.
+
+    $ python -m benchmarks.bench --sizes 1000 10000 100000 --output results.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+SEARCH_QUERIES = ["i", "it", "ite", "item", "item ", "item 1", "item 12", "item 123", "000", "descr", "zzz"]
+
+
+def percentile(values: list[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, round(percent / 100 * (len(values) - 1)))]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Summary of `samples`, in milliseconds
+    """
+    return {
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def spin_until(app, predicate: Callable[[], bool], timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("the benchmark timed out")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def bench_api_items(url: str, size: int, page_size: int, trusted: bool) -> dict[str, Any]:
+    from tim_gui.api import Request, TimAPI
+    from tim_gui.api.decoding import Decoder
+
+    api = TimAPI(Request(url), Decoder(trusted=trusted))
+    start = time.perf_counter()
+    items = []
+    while True:
+        page = api.items(skip=len(items), limit=page_size)
+        items.extend(page)
+        if len(page) < page_size:
+            break
+    elapsed = time.perf_counter() - start
+    api.request.close()
+
+    assert len(items) == size
+    return {"page_size": page_size, "seconds": elapsed, "items_per_second": size / elapsed}
+
+
+def bench_refresh_traffic(url: str, inventory, page_size: int, changes: int) -> dict[str, Any]:
+    """
+    Bytes downloaded to bring every item up to date after `changes` changes on the server, by fetching
+    every page again or only what changed since the last sync
+    """
+    from tim_gui.api import Request, TimAPI
+    from tim_gui.api.decoding import Decoder
+
+    api = TimAPI(Request(url), Decoder(trusted=True))
+    cursor = api.changes().revision
+    with inventory.lock:
+        ids = sorted(inventory.items)
+        for n in range(changes):
+            inventory.update_item(ids[n * 7919 % len(ids)], {"quantity": n})
+
+    histogram = api.request.histogram()
+    start = time.perf_counter()
+    skip = 0
+    while len(api.items(skip=skip, limit=page_size)) == page_size:
+        skip += page_size
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    delta = api.changes(cursor)
+    delta_seconds = time.perf_counter() - start
+    api.request.close()
+
+    endpoints = histogram.endpoints()
+    full_bytes = endpoints[("GET", "/items/")].response_bytes
+    delta_bytes = endpoints[("GET", "/changes/")].response_bytes
+    return {
+        "changes": changes,
+        "changed_items": len(delta.items),
+        "full_refresh": {"bytes": full_bytes, "seconds": full_seconds},
+        "delta_sync": {"bytes": delta_bytes, "seconds": delta_seconds},
+        "bytes_ratio": full_bytes / delta_bytes,
+    }
+
+
+def bench_login_to_first_paint(app, url: str) -> dict[str, Any]:
+    """
+    Time from clicking "Sign in" until the items list of the main window is painted with items in it
+    """
+    from PySide6 import QtCore
+
+    from tim_gui.api import Request, TimAPI
+    from tim_gui.api.decoding import Decoder
+    from tim_gui.gui.windows import LoginWindow
+
+    painted_at = []
+
+    class PaintSpy(QtCore.QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QtCore.QEvent.Paint and not painted_at and len(main_window.items_list):
+                painted_at.append(time.perf_counter())
+            return False
+
+    login = LoginWindow(TimAPI(Request(url), Decoder(trusted=True)))
+    login.show()
+    login.login_le.setText("admin")
+    login.password_le.le.setText("admin")
+
+    start = time.perf_counter()
+    login.signin()
+    spin_until(app, lambda: hasattr(login, "main_window"))
+    main_window = login.main_window
+    spy = PaintSpy()
+    main_window.items_list.viewport().installEventFilter(spy)
+    spin_until(app, lambda: bool(painted_at))
+
+    main_window.items_list.viewport().removeEventFilter(spy)
+    return {"seconds": painted_at[0] - start, "main_window": main_window}
+
+
+def bench_add_items(app, items: list, repeat: int) -> dict[str, Any]:
+    from tim_gui.gui.items_view import ItemsList
+
+    samples = []
+    for _ in range(repeat):
+        items_list = ItemsList([])
+        items_list.resize(800, 600)
+        items_list.show()
+        app.processEvents()
+
+        start = time.perf_counter()
+        items_list.add_items(items)
+        # the rows are added over several iterations of the event loop
+        spin_until(app, lambda: not items_list.pending())
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+
+        items_list.close()
+        items_list.deleteLater()
+        app.processEvents()
+
+    return summarize(samples)
+
+
+def bench_item_memory(app, url: str, size: int, page_size: int) -> dict[str, Any]:
+    """
+    Memory kept by the store, the items list and the response cache, the pages being fetched one at a time
+    through a `Request` with the cache `load_api` sets up, as the pager does
+    """
+    from tim_gui.api import Request, TimAPI
+    from tim_gui.api.cache import ResponseCache
+    from tim_gui.api.decoding import Decoder
+    from tim_gui.gui.items_view import ItemsList
+    from tim_gui.gui.store import EntityStore
+
+    tracemalloc.start()
+    api = TimAPI(Request(url, response_cache=ResponseCache()), Decoder(trusted=True))
+    api.login(username="admin", password="admin")
+    store, items_list = EntityStore(), ItemsList([])
+    store.itemsAdded.connect(items_list.add_items)
+    for skip in range(0, size, page_size):
+        store.put_items(api.items(skip, page_size))
+    items_list.flush()
+    gc.collect()
+    size_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    api.request.close()
+    items_list.deleteLater()
+    app.processEvents()
+    return {"mb": size_bytes / 1e6, "bytes_per_item": size_bytes / max(size, 1)}
+
+
+def bench_search(app, main_window, repeat: int) -> dict[str, Any]:
+    """
+    Latency of each keystroke of the search queries, including the repaint of the items list
+    """
+    samples = []
+    for _ in range(repeat):
+        for query in SEARCH_QUERIES:
+            for end in range(1, len(query) + 1):
+                start = time.perf_counter()
+                main_window.search(query[:end])
+                main_window.items_list.viewport().repaint()
+                samples.append(time.perf_counter() - start)
+            main_window.search("")
+            app.processEvents()
+
+    return {"keystrokes": len(samples), **summarize(samples)}
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """
+    Self and cumulative microseconds of every module in the output of `python -X importtime`
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def bench_startup(repeat: int) -> dict[str, Any]:
+    """
+    Time to import `tim_gui.gui`, all that is imported before the login window is shown, in a fresh
+    interpreter, with the slowest modules of the last run
+    """
+    samples = []
+    for _ in range(repeat):
+        command = [sys.executable, "-X", "importtime", "-c", "import tim_gui.gui"]
+        stderr = subprocess.run(command, cwd=ROOT_DIR, check=True, capture_output=True, text=True).stderr
+        modules = parse_importtime(stderr)
+        samples.append(modules["tim_gui.gui"][1] / 1_000_000)
+
+    slowest = sorted(modules.items(), key=lambda module: module[1][0], reverse=True)[:10]
+    return {
+        "import_tim_gui_gui": summarize(samples),
+        "slowest_imports_ms": {name: self_us / 1000 for name, (self_us, _) in slowest},
+    }
+
+
+def run_size(size: int, latency: float, description_size: int, page_size: int, repeat: int) -> dict[str, Any]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6 import QtWidgets
+
+    from benchmarks.fake_tim import Inventory, serve
+    from tim_gui.gui import icons
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    icons.preload()
+
+    result: dict[str, Any] = {"inventory_size": size}
+    inventory = Inventory.generate(size, description_size)
+    with serve(inventory, latency) as server:
+        result["api_items"] = {
+            "validated": bench_api_items(server.url, size, page_size, trusted=False),
+            "trusted": bench_api_items(server.url, size, page_size, trusted=True),
+        }
+
+        login = bench_login_to_first_paint(app, server.url)
+        main_window = login.pop("main_window")
+        result["login_to_first_paint"] = login
+
+        from tim_gui.api import Request, TimAPI
+        from tim_gui.api.decoding import Decoder
+
+        api = TimAPI(Request(server.url), Decoder(trusted=True))
+        items = api.items(skip=0, limit=size)
+        result["add_items"] = bench_add_items(app, items, repeat)
+        result["item_memory"] = bench_item_memory(app, server.url, size, page_size)
+
+        main_window.store.put_items(items)
+        app.processEvents()
+        result["search"] = bench_search(app, main_window, repeat)
+        # changes the inventory, so it runs last
+        result["refresh_traffic"] = bench_refresh_traffic(server.url, inventory, page_size, changes=min(300, size))
+
+        main_window.close()
+        app.processEvents()
+
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def environment() -> dict[str, Any]:
+    import PySide6
+    import pydantic
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pyside6": PySide6.__version__,
+        "pydantic": pydantic.VERSION,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the tim-gui performance benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="inventory sizes")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--description-size", type=int, default=64, help="length of the item descriptions")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="file to write the JSON results to, stdout by default")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        result = run_size(args.sizes[0], args.latency, args.description_size, args.page_size, args.repeat)
+        json.dump(result, sys.stdout)
+        return
+
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "single")}
+    results = []
+    for size in args.sizes:
+        command = [sys.executable, "-m", "benchmarks.bench", "--single", "--sizes", str(size)]
+        for key in ("latency", "description_size", "page_size", "repeat"):
+            command += [f"--{key.replace('_', '-')}", str(config[key])]
+        output = subprocess.run(command, cwd=ROOT_DIR, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(output))
+
+    report = json.dumps(
+        {"environment": environment(), "config": config, "startup": bench_startup(args.repeat), "results": results},
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
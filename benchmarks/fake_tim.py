@@ -0,0 +1,573 @@
+"""
+Local stand-in for the tim REST API, serving a synthetic inventory from memory
+"""
+import json
+import re
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.utils import formatdate, parsedate_to_datetime
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# how many of the last changes are kept for "/events/"
+EVENT_LOG_SIZE = 10_000
+
+
+@dataclass
+class Inventory:
+    """
+    The data served by the fake backend. Every change is recorded as an event of the next revision,
+    `modified` is set and the requests waiting for `changes` are woken up.
+    """
+
+    items: dict[int, dict[str, Any]] = field(default_factory=dict)
+    users: dict[int, dict[str, Any]] = field(default_factory=dict)
+    revision: int = 0
+    modified: float = field(default_factory=time.time)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # the events of the last revisions, one per revision
+    events: deque = field(default_factory=lambda: deque(maxlen=EVENT_LOG_SIZE), repr=False)
+    # notified on every change
+    changes: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @classmethod
+    def generate(cls, size: int, description_size: int = 64, users: int = 10) -> "Inventory":
+        inventory = cls()
+        for id in range(1, users + 1):
+            inventory.users[id] = {"id": id, "name": f"User {id}", "email": f"user{id}@tim.com", "is_admin": id == 1}
+        for id in range(1, size + 1):
+            inventory.items[id] = {
+                "id": id,
+                "owner_id": id % users + 1,
+                "title": f"Item {id}",
+                "bar_code": f"{id:013d}",
+                "description": f"Description of item {id} ".ljust(description_size, "x")[:description_size],
+                "price": round(1 + id % 1000 / 10, 2),
+                "image_path": None,
+                "quantity": id % 50,
+            }
+        return inventory
+
+    def record(self, kind: str, action: str, data: dict[str, Any]):
+        """
+        Records that the item or user `data` was "changed" or "deleted"
+        """
+        self.revision += 1
+        self.modified = time.time()
+        self.events.append(
+            {
+                "revision": self.revision,
+                "kind": kind,
+                "action": action,
+                "id": data["id"],
+                kind: data if action == "changed" else None,
+            }
+        )
+        with self.changes:
+            self.changes.notify_all()
+
+    def events_after(self, revision: int) -> Optional[list[dict[str, Any]]]:
+        """
+        The events after `revision`, `None` if some of them were dropped from the log
+        """
+        first = self.events[0]["revision"] if self.events else self.revision + 1
+        if not first - 1 <= revision <= self.revision:
+            return None
+        return list(self.events)[revision - first + 1 :]
+
+    def next_item_id(self) -> int:
+        return max(self.items, default=0) + 1
+
+    def user_with_items(self, id: int) -> dict[str, Any]:
+        return {**self.users[id], "items": [item for item in self.items.values() if item["owner_id"] == id]}
+
+    def update_item(self, id: int, changes: dict[str, Any]) -> dict[str, Any]:
+        item = self.items.get(id)
+        if item is None:
+            raise NotFound
+        item.update(changes)
+        item["price"] = float(item["price"])
+        self.record("item", "changed", item)
+        return item
+
+    def withdraw_item(self, id: int, quantity: int) -> dict[str, Any]:
+        item = self.items.get(id)
+        if item is None:
+            raise NotFound
+        if quantity > item["quantity"]:
+            raise BadRequest("Not enough items")
+        item["quantity"] -= quantity
+        self.record("item", "changed", item)
+        return item
+
+    def delete_item(self, id: int) -> dict[str, Any]:
+        item = self.items.pop(id, None)
+        if item is None:
+            raise NotFound
+        self.record("item", "deleted", item)
+        return item
+
+
+# the sort and filters of "GET /items/", see `tim_gui.api.query.ItemQuery`
+ITEM_SORT_KEYS = {
+    "price": lambda item: float(item["price"]),
+    "quantity": lambda item: item["quantity"],
+    "title": lambda item: item["title"].casefold(),
+    "bar_code": lambda item: item["bar_code"],
+}
+ITEM_FILTERS = {
+    "min_price": ("price", float.__ge__),
+    "max_price": ("price", float.__le__),
+    "min_quantity": ("quantity", float.__ge__),
+    "max_quantity": ("quantity", float.__le__),
+    "owner_id": ("owner_id", float.__eq__),
+}
+
+
+class NotFound(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+class FakeTimHandler(BaseHTTPRequestHandler):
+    server: "FakeTimServer"
+    protocol_version = "HTTP/1.1"
+
+    ROUTES = [
+        ("POST", r"/login/access-token", "login"),
+        ("GET", r"/items/", "list_items"),
+        ("GET", r"/items/withdraw/(\d+)", "withdraw_item"),
+        ("PUT", r"/items/update/(\d+)", "update_item"),
+        ("DELETE", r"/items/delete/(\d+)", "delete_item"),
+        ("GET", r"/items/([^/]+)", "get_item"),
+        ("POST", r"/users/(\d+)/items/", "create_item"),
+        ("POST", r"/items/batch", "batch_items"),
+        ("GET", r"/users/", "list_users"),
+        ("GET", r"/users/me", "get_user_me"),
+        ("POST", r"/users/register", "create_user"),
+        ("PUT", r"/users/update/me", "update_user_me"),
+        ("PUT", r"/users/update/(\d+)", "update_user"),
+        ("DELETE", r"/users/delete/(\d+)", "delete_user"),
+        ("GET", r"/users/(\d+)", "get_user"),
+        ("GET", r"/changes/", "list_changes"),
+    ]
+    # answered outside of the lock of the inventory, as they wait for the changes
+    EVENTS_PATH = "/events/"
+
+    def log_message(self, format: str, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def dispatch(self, method: str):
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self.body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if method == "GET" and url.path == self.EVENTS_PATH and self.server.events:
+            self.events()
+            return
+
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = re.fullmatch(pattern, url.path)
+            if route_method == method and match:
+                try:
+                    with self.server.inventory.lock:
+                        status, data = getattr(self, handler_name)(*map(unquote, match.groups()))
+                except NotFound:
+                    status, data = 404, {"detail": "Not found"}
+                except BadRequest as e:
+                    status, data = 400, {"detail": str(e)}
+                break
+        else:
+            status, data = 404, {"detail": "Not Found"}
+
+        validators = {}
+        if method == "GET" and status == 200 and self.server.validators:
+            validators = self.validators()
+            if self.not_modified(validators):
+                status, data = 304, None
+
+        self.send_json(status, data, validators)
+
+    def validators(self) -> dict[str, str]:
+        # every change bumps the revision, so it validates any resource
+        inventory = self.server.inventory
+        return {"ETag": f'"{inventory.revision}"', "Last-Modified": formatdate(inventory.modified, usegmt=True)}
+
+    def not_modified(self, validators: dict[str, str]) -> bool:
+        if "If-None-Match" in self.headers:
+            return self.headers["If-None-Match"] == validators["ETag"]
+        if "If-Modified-Since" in self.headers:
+            since = parsedate_to_datetime(self.headers["If-Modified-Since"]).timestamp()
+            return int(self.server.inventory.modified) <= since
+        return False
+
+    def send_json(self, status: int, data: Any, headers: Optional[dict[str, str]] = None):
+        body = b"" if status == 304 else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def json_body(self) -> dict[str, Any]:
+        return json.loads(self.body or b"{}")
+
+    def write_event(self, event: str, id: int, data: Any):
+        self.write_chunk(f"id: {id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode())
+
+    def write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    # Events
+
+    def events(self):
+        """
+        The changes after the revision `after` (by default the current one): streamed as Server-Sent
+        Events when asked with "Accept: text/event-stream", else long-polled, waiting up to `timeout`
+        seconds for one. A 410 means some of them aren't in the log anymore.
+        """
+        inventory = self.server.inventory
+        with inventory.lock:
+            after = int(self.query.get("after", inventory.revision))
+            if inventory.events_after(after) is None:
+                self.send_json(410, {"detail": "The changes since this revision are gone"})
+                return
+
+        if self.server.event_stream and "text/event-stream" in self.headers.get("Accept", ""):
+            self.stream_events(after)
+            return
+
+        with inventory.changes:
+            inventory.changes.wait_for(
+                lambda: inventory.revision > after or self.server.closing, float(self.query.get("timeout", 25))
+            )
+        with inventory.lock:
+            events = inventory.events_after(after)
+            revision = inventory.revision
+        if events is None:
+            self.send_json(410, {"detail": "The changes since this revision are gone"})
+        else:
+            self.send_json(200, {"revision": revision, "events": events})
+
+    def stream_events(self, after: int):
+        inventory = self.server.inventory
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            # tells the client where the stream starts, for when it reconnects
+            self.write_event("revision", after, {"revision": after})
+            max_stream_time = self.server.max_stream_time
+            end = time.monotonic() + (max_stream_time if max_stream_time is not None else float("inf"))
+            while True:
+                with inventory.changes:
+                    inventory.changes.wait_for(
+                        lambda: inventory.revision > after or self.server.closing,
+                        min(self.server.ping_interval, max(0.0, end - time.monotonic())),
+                    )
+                with inventory.lock:
+                    events = inventory.events_after(after)
+                if self.server.closing or events is None or time.monotonic() >= end:
+                    break
+                if not events:
+                    self.write_chunk(b": ping\n\n")
+                for event in events:
+                    self.write_event("change", event["revision"], event)
+                    after = event["revision"]
+            self.write_chunk(b"")
+        except OSError:
+            # the client is gone
+            pass
+
+    # Routes
+
+    def login(self):
+        return 200, {"access_token": "fake-token", "token_type": "bearer"}
+
+    def list_items(self):
+        skip, limit = int(self.query.get("skip", 0)), int(self.query.get("limit", 100))
+        items = [item for _, item in sorted(self.server.inventory.items.items()) if self.__item_matches(item)]
+        # "sort=-price,title": a stable sort per field, from the last one to the first
+        for field in reversed([field for field in self.query.get("sort", "").split(",") if field]):
+            name = field.lstrip("-")
+            if name not in ITEM_SORT_KEYS:
+                raise BadRequest(f'Items can\'t be sorted by "{name}"')
+            items.sort(key=ITEM_SORT_KEYS[name], reverse=field.startswith("-"))
+        return 200, items[skip : skip + limit]
+
+    def __item_matches(self, item: dict[str, Any]) -> bool:
+        for name, value in self.query.items():
+            if name in ITEM_FILTERS:
+                field, compare = ITEM_FILTERS[name]
+                if not compare(float(item[field]), float(value)):
+                    return False
+        return True
+
+    def get_item(self, title: str):
+        for item in self.server.inventory.items.values():
+            if item["title"] == title:
+                return 200, item
+        raise NotFound
+
+    def create_item(self, user_id: str):
+        inventory = self.server.inventory
+        item = {"description": None, "image_path": None, **self.json_body()}
+        item.update(id=inventory.next_item_id(), owner_id=int(user_id), price=float(item["price"]))
+        inventory.items[item["id"]] = item
+        inventory.record("item", "changed", item)
+        return 200, item
+
+    def update_item(self, id: str):
+        return 200, self.server.inventory.update_item(int(id), self.json_body())
+
+    def withdraw_item(self, id: str):
+        return 200, self.server.inventory.withdraw_item(int(id), int(self.query.get("quantity", 1)))
+
+    def delete_item(self, id: str):
+        return 200, self.server.inventory.delete_item(int(id))
+
+    def batch_items(self):
+        if not self.server.batch_endpoint:
+            return 404, {"detail": "Not Found"}
+
+        inventory = self.server.inventory
+        results = []
+        for operation in self.json_body()["operations"]:
+            try:
+                if operation["op"] == "delete":
+                    item = inventory.delete_item(operation["id"])
+                elif operation["op"] == "update":
+                    item = inventory.update_item(operation["id"], {"quantity": operation["quantity"]})
+                else:
+                    item = inventory.withdraw_item(operation["id"], operation["quantity"])
+                results.append({"id": operation["id"], "item": item})
+            except NotFound:
+                results.append({"id": operation["id"], "detail": "Not found"})
+            except BadRequest as e:
+                results.append({"id": operation["id"], "detail": str(e)})
+        return 200, results
+
+    def list_changes(self):
+        """
+        The items and users changed or deleted after the revision `since`, as they are now. Without
+        `since` only the current revision, a 410 when the log doesn't go back that far.
+        """
+        if not self.server.events:
+            raise NotFound
+        inventory = self.server.inventory
+        events = inventory.events_after(int(self.query.get("since", inventory.revision)))
+        if events is None:
+            return 410, {"detail": "The changes since this revision are gone"}
+
+        changes = {
+            "revision": inventory.revision,
+            "items": [],
+            "deleted_item_ids": [],
+            "users": [],
+            "deleted_user_ids": [],
+        }
+        # only the last change of each item or user matters
+        latest = {(event["kind"], event["id"]): event["action"] for event in events}
+        for (kind, id), action in latest.items():
+            if action == "deleted":
+                changes[f"deleted_{kind}_ids"].append(id)
+            elif kind == "item":
+                changes["items"].append(inventory.items[id])
+            else:
+                changes["users"].append(inventory.user_with_items(id))
+        return 200, changes
+
+    def list_users(self):
+        skip, limit = int(self.query.get("skip", 0)), int(self.query.get("limit", 100))
+        inventory = self.server.inventory
+        return 200, [inventory.user_with_items(id) for id in sorted(inventory.users)[skip : skip + limit]]
+
+    def get_user(self, id: str):
+        if int(id) not in self.server.inventory.users:
+            raise NotFound
+        return 200, self.server.inventory.user_with_items(int(id))
+
+    def get_user_me(self):
+        return self.get_user("1")
+
+    def create_user(self):
+        inventory = self.server.inventory
+        user = self.json_body()
+        user.pop("password", None)
+        user["id"] = max(inventory.users, default=0) + 1
+        inventory.users[user["id"]] = user
+        inventory.record("user", "changed", inventory.user_with_items(user["id"]))
+        return 200, inventory.user_with_items(user["id"])
+
+    def update_user(self, id: str):
+        user = self.server.inventory.users.get(int(id))
+        if user is None:
+            raise NotFound
+        changes = self.json_body()
+        changes.pop("password", None)
+        user.update(changes)
+        self.server.inventory.record("user", "changed", self.server.inventory.user_with_items(int(id)))
+        return 200, self.server.inventory.user_with_items(int(id))
+
+    def update_user_me(self):
+        return self.update_user("1")
+
+    def delete_user(self, id: str):
+        inventory = self.server.inventory
+        if int(id) not in inventory.users:
+            raise NotFound
+        user = inventory.user_with_items(int(id))
+        del inventory.users[int(id)]
+        inventory.record("user", "deleted", user)
+        return 200, user
+
+
+class FakeTimServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        inventory: Inventory,
+        latency: float = 0.0,
+        port: int = 0,
+        batch_endpoint: bool = True,
+        validators: bool = True,
+        events: bool = True,
+        event_stream: bool = True,
+        ping_interval: float = 15.0,
+    ):
+        super().__init__(("127.0.0.1", port), FakeTimHandler)
+        self.inventory = inventory
+        self.latency = latency
+        # whether "/items/batch" is served, the real tim API may not have it
+        self.batch_endpoint = batch_endpoint
+        # whether the GET responses have an ETag and Last-Modified and can be answered with 304
+        self.validators = validators
+        # whether "/events/" and "/changes/" are served, and whether the events can be streamed or only
+        # long-polled
+        self.events = events
+        self.event_stream = event_stream
+        # seconds between the comments sent to keep an idle event stream open
+        self.ping_interval = ping_interval
+        # seconds after which the event streams are ended, like a proxy closing the idle connections
+        self.max_stream_time: Optional[float] = None
+        # set on shutdown, ends the event streams and long polls
+        self.closing = False
+
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request: socket.socket, client_address: Any):
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: socket.socket):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_streams(self):
+        with self.inventory.changes:
+            self.closing = True
+            self.inventory.changes.notify_all()
+
+    def close_connections(self):
+        """
+        Drops the connections kept alive, so the clients see the server is gone
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+@contextmanager
+def serve(
+    inventory: Optional[Inventory] = None,
+    latency: float = 0.0,
+    port: int = 0,
+    batch_endpoint: bool = True,
+    validators: bool = True,
+    events: bool = True,
+    event_stream: bool = True,
+    ping_interval: float = 15.0,
+) -> Iterator[FakeTimServer]:
+    """
+    Runs a `FakeTimServer` in a background thread for the duration of the `with` block
+    """
+    inventory = inventory if inventory is not None else Inventory.generate(100)
+    server = FakeTimServer(inventory, latency, port, batch_endpoint, validators, events, event_stream, ping_interval)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.close_streams()
+        server.shutdown()
+        server.server_close()
+        server.close_connections()
+        thread.join()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serves a synthetic inventory through a fake tim API")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--description-size", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--no-batch", action="store_true", help="don't serve the /items/batch endpoint")
+    parser.add_argument("--no-validators", action="store_true", help="don't send ETag and Last-Modified")
+    parser.add_argument("--no-event-stream", action="store_true", help="only long-poll the /events/ endpoint")
+    args = parser.parse_args()
+
+    inventory = Inventory.generate(args.items, args.description_size)
+    server = FakeTimServer(
+        inventory,
+        args.latency,
+        args.port,
+        batch_endpoint=not args.no_batch,
+        validators=not args.no_validators,
+        event_stream=not args.no_event_stream,
+    )
+    print(f"Serving {args.items} items on {server.url}")
+    server.serve_forever()
@@ -0,0 +1,27 @@
+import time
+from decimal import Decimal
+
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.models import Item
+
+
+def wait_until(app, predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def make_item(id: int, **fields) -> Item:
+    return Item(
+        **{"id": id, "owner_id": 1, "title": f"Item {id}", "bar_code": str(id), "price": Decimal("1.5"), **fields}
+    )
+
+
+def login(url: str) -> TimAPI:
+    api = TimAPI(Request(url))
+    api.login(username="admin", password="admin")
+    return api
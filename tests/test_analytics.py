@@ -0,0 +1,118 @@
+import time
+from decimal import Decimal
+
+import pytest
+
+from tests.helpers import make_item
+from tim_gui.api import analytics
+from tim_gui.api.analytics import InventoryStats, low_stock_rows
+from tim_gui.api.columns import ItemColumns
+from tim_gui.gui.dashboard import InventoryDashboard
+from tim_gui.gui.store import EntityStore
+
+
+@pytest.fixture(params=["numpy", "python"])
+def vectorized(request, monkeypatch):
+    if request.param == "numpy" and analytics.np is None:
+        pytest.skip("NumPy isn't installed")
+    if request.param == "python":
+        monkeypatch.setattr(analytics, "np", None)
+
+
+def expected_summary(items, threshold):
+    quantities = sorted(item.quantity for item in items)
+    value_by_owner = {}
+    for item in items:
+        value_by_owner[item.owner_id] = value_by_owner.get(item.owner_id, 0) + item.price * item.quantity
+    return {
+        "item_count": len(items),
+        "total_quantity": sum(quantities),
+        "total_value": sum(item.price * item.quantity for item in items),
+        "below_threshold": sum(quantity < threshold for quantity in quantities),
+        "value_by_owner": value_by_owner,
+        "median": quantities[-(-len(quantities) * 50 // 100) - 1],
+    }
+
+
+def assert_matches(stats, items):
+    summary = stats.summary()
+    expected = expected_summary(items, stats.reorder_threshold)
+    assert (summary.item_count, summary.total_quantity, summary.total_value, summary.below_threshold) == (
+        expected["item_count"],
+        expected["total_quantity"],
+        expected["total_value"],
+        expected["below_threshold"],
+    )
+    assert summary.value_by_owner == {owner: value for owner, value in expected["value_by_owner"].items() if value}
+    assert list(summary.value_by_owner.values()) == sorted(summary.value_by_owner.values(), reverse=True)
+    assert summary.quantity_percentiles[50] == expected["median"]
+    assert sum(count for _, _, count in summary.quantity_buckets) == len(items)
+
+
+def test_stats_are_computed_then_kept_up_to_date(vectorized):
+    items = [
+        make_item(id, owner_id=id % 4, quantity=id % 23, price=Decimal(id % 17) / 4 + Decimal("0.01"))
+        for id in range(1000)
+    ]
+    stats = InventoryStats(ItemColumns(items[:600]), reorder_threshold=3)
+    assert_matches(stats, items[:600])
+
+    stats.add_items(items[600:])
+    assert_matches(stats, items)
+
+    stats.change_item(items[10], items[10].copy(update={"quantity": 500, "owner_id": 9}))
+    stats.change_item(items[20], None)
+    items[10] = items[10].copy(update={"quantity": 500, "owner_id": 9})
+    del items[20]
+    assert_matches(stats, items)
+
+    columns = ItemColumns(items)
+    rows = low_stock_rows(columns, 3, limit=50)
+    assert len(rows) == 50
+    assert all(columns.item(row).quantity < 3 for row in rows)
+    assert [columns.item(row).quantity for row in rows] == sorted(columns.item(row).quantity for row in rows)
+
+
+def test_values_too_large_for_an_int64_are_summed_exactly(vectorized):
+    # the largest price and quantity the item windows accept, their product alone is above 2**63
+    items = [make_item(id, owner_id=1, quantity=2**31, price=Decimal(2**31)) for id in range(4)]
+    items.append(make_item(4, owner_id=2, quantity=3, price=Decimal("1.5")))
+
+    stats = InventoryStats(ItemColumns(items))
+
+    assert stats.total_value == 4 * Decimal(2**62) + Decimal("4.5")
+    assert_matches(stats, items)
+
+
+def test_dashboard_follows_the_store(qapp):
+    store = EntityStore()
+    store.put_items([make_item(id, quantity=id) for id in range(10)])
+
+    dashboard = InventoryDashboard(store)
+    dashboard.refresh()
+    assert dashboard.item_count_lbl.text() == "10"
+    assert dashboard.low_stock_table.rowCount() == 5
+
+    store.put_items([make_item(1, quantity=100), make_item(10, quantity=0)])
+    store.remove_item(0)
+    dashboard.refresh()
+
+    assert dashboard.item_count_lbl.text() == "10"
+    assert dashboard.total_quantity_lbl.text() == str(sum(range(2, 10)) + 100)
+    assert [dashboard.low_stock_table.item(row, 2).text() for row in range(3)] == ["0", "2", "3"]
+
+
+def test_stats_over_many_items_are_fast():
+    if analytics.np is None:
+        pytest.skip("NumPy isn't installed")
+    # the ids repeat, the stats don't depend on them
+    columns = ItemColumns([make_item(id, quantity=id % 97, owner_id=id % 50) for id in range(5000)] * 100)
+
+    start = time.perf_counter()
+    stats = InventoryStats(columns)
+    summary = stats.summary()
+    low_stock_rows(columns, 5)
+    elapsed = time.perf_counter() - start
+
+    assert summary.item_count == 500_000
+    assert elapsed < 2
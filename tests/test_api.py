@@ -0,0 +1,144 @@
+import json
+from decimal import Decimal
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.circuit import CircuitBreaker
+from tim_gui.api.errors import (CircuitOpen, RequestTimeout, ServerError,
+                                ServerUnavailable)
+from tim_gui.api.models import ItemCreate
+
+
+class FakeAdapter(BaseAdapter):
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.sent: list[requests.PreparedRequest] = []
+        self.kwargs: list[dict] = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        self.kwargs.append(kwargs)
+        route = self.routes[(request.method, request.path_url.split("?")[0])]
+        # a list answers each attempt in turn
+        if isinstance(route, list):
+            route = route.pop(0) if len(route) > 1 else route[0]
+        if isinstance(route, Exception):
+            raise route
+        status_code, body = route
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = "OK" if status_code < 400 else "Error"
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def make_api(routes, **request_options) -> tuple[TimAPI, FakeAdapter]:
+    adapter = FakeAdapter(routes)
+    request = Request(backoff=0, **request_options)
+    request.session.mount("http://", adapter)
+    return TimAPI(request), adapter
+
+
+ITEM = {"id": 1, "owner_id": 1, "title": "Pen", "bar_code": "123", "price": "1.50", "quantity": 3}
+
+
+def test_auth_header_is_set_once_at_login():
+    api, adapter = make_api(
+        {
+            ("POST", "/login/access-token"): (200, {"token_type": "bearer", "access_token": "abc"}),
+            ("GET", "/items/"): (200, [ITEM]),
+        }
+    )
+
+    api.login(username="user", password="pass")
+    items = api.items()
+
+    assert items[0].title == "Pen"
+    assert "Authorization" not in adapter.sent[0].headers
+    assert adapter.sent[1].headers["Authorization"] == "Bearer abc"
+
+
+def test_all_calls_share_the_same_session():
+    request = Request(pool_maxsize=2)
+
+    adapter = request.session.get_adapter("http://127.0.0.1:8000")
+    assert adapter._pool_maxsize == 2
+    assert request._request_type_table["GET"].__self__ is request.session
+
+
+def refused() -> requests.ConnectionError:
+    connection_error = NewConnectionError(None, "Connection refused")
+    return requests.ConnectionError(MaxRetryError(None, "/", connection_error))
+
+
+def test_requests_have_timeouts():
+    api, adapter = make_api({("GET", "/items/"): (200, [ITEM])}, connect_timeout=1, read_timeout=5)
+
+    api.items()
+
+    assert adapter.kwargs[0]["timeout"] == (1, 5)
+
+
+def test_idempotent_requests_are_retried():
+    api, adapter = make_api({("GET", "/items/"): [(503, {}), requests.ReadTimeout(), (200, [ITEM])]})
+
+    assert api.items()[0].title == "Pen"
+    assert len(adapter.sent) == 3
+
+
+def test_requests_that_may_have_been_sent_are_not_retried():
+    api, adapter = make_api(
+        {
+            ("POST", "/users/1/items/"): [(503, {}), (200, ITEM)],
+            ("GET", "/items/withdraw/1"): [requests.ReadTimeout(), (200, ITEM)],
+        }
+    )
+
+    with pytest.raises(ServerError):
+        api.create_item(1, ItemCreate(title="Pen", bar_code="123", price=Decimal("1.5"), quantity=3))
+    with pytest.raises(RequestTimeout):
+        api.withdraw_item(1, 1)
+    assert len(adapter.sent) == 2
+
+
+def test_requests_never_sent_are_retried():
+    api, adapter = make_api({("POST", "/users/1/items/"): [refused(), (200, ITEM)]})
+
+    api.create_item(1, ItemCreate(title="Pen", bar_code="123", price=Decimal("1.5"), quantity=3))
+
+    assert len(adapter.sent) == 2
+
+
+def test_circuit_breaker_fails_fast_while_the_server_is_down(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("tim_gui.api.circuit.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    routes = {("GET", "/items/"): [refused()]}
+    api, adapter = make_api(routes, max_retries=1, circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(ServerUnavailable):
+            api.items()
+    assert len(adapter.sent) == 4 and breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpen) as error:
+        api.items()
+    assert len(adapter.sent) == 4 and error.value.retry_after == 10
+
+    # a single trial request once the timeout is over
+    now[0] = 10
+    routes[("GET", "/items/")] = [(200, [ITEM])]
+    assert api.items()[0].title == "Pen"
+    assert breaker.state == CircuitBreaker.CLOSED
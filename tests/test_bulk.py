@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from benchmarks.fake_tim import Inventory, serve
+from tests.helpers import make_item, wait_until
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.bulk import run_item_operations
+from tim_gui.api.errors import ServerError
+from tim_gui.api.mirror import LocalMirror
+from tim_gui.api.models import ItemOperation
+from tim_gui.api.offline import OfflineTimAPI
+from tim_gui.gui.bulk import BulkItemOperation
+from tim_gui.gui.store import EntityStore
+
+
+def operations() -> list[ItemOperation]:
+    return [
+        ItemOperation(op="delete", id=1),
+        ItemOperation(op="update", id=2, quantity=40),
+        ItemOperation(op="withdraw", id=3, quantity=1),
+        # item 4 has only 4 units
+        ItemOperation(op="withdraw", id=4, quantity=10),
+        ItemOperation(op="delete", id=999),
+    ]
+
+
+@pytest.mark.parametrize("batch_endpoint", [True, False])
+def test_operations_collect_errors_per_item(batch_endpoint):
+    with serve(Inventory.generate(10), batch_endpoint=batch_endpoint) as server:
+        api = TimAPI(Request(server.url))
+        progress = []
+
+        result = run_item_operations(api, operations(), batch_size=2, on_progress=lambda *args: progress.append(args))
+
+        assert api.batch_supported is batch_endpoint
+        assert [operation_result.id for operation_result in result.results] == [1, 2, 3, 4, 999]
+        assert [operation_result.id for operation_result in result.failed()] == [4, 999]
+        assert result.results[1].item.quantity == 40
+        assert result.results[2].item.quantity == 2
+        assert 1 not in server.inventory.items
+        assert sorted(progress)[-1] == (5, 5)
+        api.request.close()
+
+
+def test_cancelled_operations_are_skipped():
+    with serve(Inventory.generate(10), batch_endpoint=False) as server:
+        cancelled = threading.Event()
+        cancelled.set()
+
+        result = run_item_operations(TimAPI(Request(server.url)), operations(), cancelled=cancelled)
+
+        assert result.results == []
+        assert result.cancelled == 5
+
+
+def test_bulk_operation_updates_the_store(qapp):
+    with serve(Inventory.generate(10)) as server:
+        api = TimAPI(Request(server.url))
+        store = EntityStore()
+        store.put_items(api.items())
+        removed, updated = [], []
+        store.itemRemoved.connect(removed.append)
+        store.itemUpdated.connect(updated.append)
+
+        operation = BulkItemOperation(api, store, operations())
+        results = []
+        operation.finished.connect(results.append)
+        operation.start()
+
+        assert wait_until(qapp, lambda: results)
+        assert removed == [1]
+        assert [item.id for item in updated] == [2, 3]
+        assert store.item(2).quantity == 40
+
+
+def test_batches_turned_down_later_are_sent_one_by_one():
+    with serve(Inventory.generate(10)) as server:
+        api = TimAPI(Request(server.url))
+        run_item_operations(api, [ItemOperation(op="update", id=5, quantity=1)])
+        assert api.batch_supported is True
+
+        server.batch_endpoint = False
+        result = run_item_operations(api, operations(), batch_size=2)
+
+        assert api.batch_supported is False
+        assert [operation_result.id for operation_result in result.failed()] == [4, 999]
+        assert 1 not in server.inventory.items
+        api.request.close()
+
+
+def test_failed_probes_are_reported_per_item():
+    class FailingAPI(TimAPI):
+        def batch_items(self, operations):
+            raise ServerError("500 - Internal Server Error", 500)
+
+    api = FailingAPI(Request("http://127.0.0.1:9"))
+    result = run_item_operations(api, operations(), batch_size=2)
+
+    assert len(result.failed()) == 5 and result.cancelled == 0
+    assert api.batch_supported is None
+
+
+def test_operations_applied_offline_do_not_tell_if_the_server_has_batches():
+    api = OfflineTimAPI(LocalMirror(), Request("http://127.0.0.1:9"))
+    api.online = False
+    api.mirror.put_items([make_item(id, quantity=4) for id in range(1, 5)])
+
+    result = run_item_operations(api, operations())
+
+    assert [operation_result.id for operation_result in result.failed()] == [4, 999]
+    assert api.batch_supported is None
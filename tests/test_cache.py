@@ -0,0 +1,71 @@
+from benchmarks.fake_tim import Inventory, serve
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.cache import CacheEntry, ResponseCache
+from tim_gui.api.models import ItemUpdate
+
+
+def make_api(url: str, cache: ResponseCache) -> TimAPI:
+    api = TimAPI(Request(url, response_cache=cache))
+    api.login(username="admin", password="admin")
+    return api
+
+
+def test_unchanged_responses_are_served_from_the_cache():
+    with serve(Inventory.generate(50)) as server:
+        api = make_api(server.url, ResponseCache())
+        histogram = api.request.histogram()
+
+        first = api.items()
+        second = api.items()
+        assert second == first
+        # the items of the pages aren't kept by the cache, only their body
+        assert second[0] is not first[0]
+
+        api.update_item(1, ItemUpdate(quantity=7))
+        third = api.items()
+        assert third[0].quantity == 7
+
+        stats = histogram.endpoints()[("GET", "/items/")]
+        assert stats.status_codes == {200: 2, 304: 1}
+        api.request.close()
+
+
+def test_unchanged_responses_are_not_parsed_again():
+    with serve(Inventory.generate(50)) as server:
+        api = make_api(server.url, ResponseCache())
+        histogram = api.request.histogram()
+
+        first = api.get_user_me()
+        assert api.get_user_me() is first
+
+        stats = histogram.endpoints()[("GET", "/users/me")]
+        assert stats.status_codes == {200: 1, 304: 1}
+        assert stats.samples["validation"][1] == 0
+        api.request.close()
+
+
+def test_the_cache_is_kept_per_user_and_on_disk(tmp_path):
+    with serve(Inventory.generate(50)) as server:
+        api = make_api(server.url, ResponseCache(directory=tmp_path))
+        api.get_users()
+        api.request.set_auth("bearer", "someone-else")
+        api.get_users()
+
+        # a new cache reads the entries back from the disk
+        api = make_api(server.url, ResponseCache(directory=tmp_path))
+        histogram = api.request.histogram()
+        assert len(api.get_users()) == 10
+        assert histogram.endpoints()[("GET", "/users/")].status_codes == {304: 1}
+        assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", CacheEntry(b"12345"))
+    cache.put("b", CacheEntry(b"12345"))
+    cache.get("a")
+    cache.put("c", CacheEntry(b"12345"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert len(cache) == 2
@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+from tests.helpers import make_item
+from tim_gui.api.columns import ItemColumns
+from tim_gui.api.query import SORT_KEYS, ItemQuery
+
+
+def test_rows_are_built_back_into_the_same_items():
+    items = [
+        make_item(1, description="A pen", image_path="pen.png", quantity=3),
+        make_item(2, price=Decimal("0.005")),
+        make_item(3, price=Decimal("1E+30")),
+    ]
+    columns = ItemColumns(items)
+
+    assert [columns.item(row) for row in range(len(columns))] == items
+    assert all(columns.same_item(row, item) for row, item in enumerate(items))
+    assert not columns.same_item(0, make_item(1, description="A pen", image_path="pen.png", quantity=4))
+
+    columns.set(1, make_item(2, price=Decimal("2.25")))
+    columns.insert(0, make_item(4))
+    assert columns.swap_delete(0) == 3
+    columns.delete(1)
+    assert [columns.item(row) for row in range(len(columns))] == [items[2], make_item(2, price=Decimal("2.25"))]
+
+
+def test_sort_keys_and_filters_agree_with_the_items():
+    items = [make_item(id, price=Decimal(id % 13) / 4, quantity=id % 7, owner_id=id % 3) for id in range(200)]
+    items.append(make_item(200, price=Decimal("1.001")))
+    columns = ItemColumns(items)
+
+    rows = range(len(items))
+    for field, key in SORT_KEYS.items():
+        keys = columns.sort_keys(field)
+        assert sorted(rows, key=keys.__getitem__) == sorted(rows, key=lambda row: key(items[row]))
+
+    query = ItemQuery(min_price=Decimal("1"), max_price=Decimal("2.5"), max_quantity=4, owner_id=1)
+    assert columns.matching_rows(query, rows) == [row for row in rows if query.matches(items[row])]
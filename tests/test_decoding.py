@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError, parse_obj_as
+
+from tim_gui.api.decoding import Decoder, construct, loads
+from tim_gui.api.models import Item, User
+
+ROWS = [
+    {"id": i, "owner_id": 1, "title": f"Item {i}", "bar_code": str(i), "price": "12.50", "quantity": i}
+    for i in range(1, 201)
+]
+
+
+def test_trusted_decoding_matches_validation():
+    decoder = Decoder(trusted=True)
+
+    items = decoder.parse_list(Item, loads(b"[" + b",".join(Item(**row).json().encode() for row in ROWS) + b"]"))
+
+    assert items == parse_obj_as(list[Item], ROWS)
+    assert isinstance(items[0].price, Decimal)
+    assert items[0].description is None
+    assert decoder.decoded_rows == 200
+    assert decoder.validated_rows == 2
+
+
+def test_trusted_decoding_builds_nested_models():
+    user = construct(User, {"id": 1, "name": "a", "email": "a@a.com", "is_admin": True, "items": ROWS[:2]})
+
+    assert isinstance(user.items[0], Item)
+    assert user == User(id=1, name="a", email="a@a.com", is_admin=True, items=ROWS[:2])
+
+
+def test_sampled_validation_rejects_bad_data():
+    decoder = Decoder(trusted=True, sample_rate=1)
+
+    with pytest.raises(ValidationError):
+        decoder.parse_list(Item, [{**ROWS[0], "quantity": "many"}])
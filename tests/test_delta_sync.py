@@ -0,0 +1,106 @@
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.fake_tim import EVENT_LOG_SIZE, Inventory, serve
+from tests.helpers import login, wait_until
+from tim_gui.api.errors import EventsLost
+from tim_gui.api.models import ItemCreate, ItemUpdate, UserUpdate
+from tim_gui.gui.delta import DeltaSync
+from tim_gui.gui.store import EntityStore
+
+
+def test_only_the_changes_since_the_cursor_are_fetched():
+    with serve(Inventory.generate(100)) as server:
+        api = login(server.url)
+        cursor = api.changes().revision
+
+        api.update_item(3, ItemUpdate(price=Decimal("2")))
+        api.update_item(3, ItemUpdate(quantity=1))
+        api.delete_item(4)
+        api.create_item(2, ItemCreate(title="New", bar_code="new", price=Decimal("1")))
+        api.update_user(2, UserUpdate(name="Renamed"))
+
+        changes = api.changes(cursor)
+        assert [item.id for item in changes.items] == [3, 101]
+        assert (changes.items[0].price, changes.items[0].quantity) == (Decimal("2"), 1)
+        assert changes.deleted_item_ids == [4]
+        assert [user.name for user in changes.users] == ["Renamed"]
+        assert changes.revision == server.inventory.revision
+        assert api.changes(changes.revision).items == []
+        api.request.close()
+
+
+def test_delta_sync_updates_the_store(qapp):
+    with serve(Inventory.generate(100)) as server:
+        api, other_terminal = login(server.url), login(server.url)
+        store = EntityStore()
+        sync = DeltaSync(api, store)
+        sync.start()
+        assert wait_until(qapp, lambda: sync.cursor == 0)
+        store.put_items(api.items(limit=50))
+        store.put_users(api.get_users(), complete=True)
+
+        updated = []
+        store.itemUpdated.connect(updated.append)
+        other_terminal.update_item(3, ItemUpdate(quantity=40))
+        other_terminal.delete_item(4)
+        other_terminal.delete_user(5)
+        # not loaded, left to their page
+        other_terminal.update_item(80, ItemUpdate(quantity=40))
+        other_terminal.create_item(2, ItemCreate(title="New", bar_code="new", price=Decimal("1")))
+
+        sync.sync()
+        assert wait_until(qapp, lambda: sync.cursor == 5)
+        assert store.item(3).quantity == 40
+        assert store.item(4) is None and store.user(5) is None
+        assert [item.id for item in updated] == [3]
+        assert store.item_count() == 49
+
+        sync.stop()
+        for client in (api, other_terminal):
+            client.request.close()
+
+
+def test_servers_without_changes_are_not_synced(qapp):
+    with serve(Inventory.generate(10), events=False) as server:
+        api = login(server.url)
+        sync = DeltaSync(api, EntityStore())
+        failures = []
+        sync.failed.connect(failures.append)
+        sync.start()
+
+        assert wait_until(qapp, lambda: sync.supported is False)
+        assert not sync._timer.isActive() and failures == []
+        api.request.close()
+
+
+# the pages of 1000 items covering the loaded ones: all of them, or the first two and the deleted item
+@pytest.mark.parametrize("item_count, loaded_count, stored_count", [(1500, 1500, 1499), (3000, 1500, 2001)])
+def test_loaded_items_are_fetched_again_when_the_changes_are_lost(qapp, item_count, loaded_count, stored_count):
+    inventory = Inventory.generate(item_count)
+    with serve(inventory) as server:
+        api = login(server.url)
+        store = EntityStore()
+        store.put_items(api.items(limit=loaded_count))
+        store.put_users(api.get_users(), complete=True)
+
+        with inventory.lock:
+            inventory.delete_item(10)
+            del inventory.users[3]
+            for quantity in range(EVENT_LOG_SIZE):
+                inventory.update_item(20, {"quantity": quantity})
+        with pytest.raises(EventsLost):
+            api.changes(0)
+
+        sync = DeltaSync(api, store)
+        sync.cursor = 0
+        sync.sync()
+        assert wait_until(qapp, lambda: sync.cursor == inventory.revision)
+
+        assert store.user(3) is None
+        assert store.item(20).quantity == EVENT_LOG_SIZE - 1
+        # only a complete snapshot tells the deleted item apart
+        assert (store.item(10) is None) is (item_count == loaded_count)
+        assert store.item_count() == stored_count
+        api.request.close()
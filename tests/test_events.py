@@ -0,0 +1,147 @@
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.fake_tim import EVENT_LOG_SIZE, Inventory, serve
+from tests.helpers import login, make_item, wait_until
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.errors import CircuitOpen, EventsLost
+from tim_gui.api.events import EventStream, parse_sse
+from tim_gui.api.models import ChangeEvent, ItemUpdate, User, UserUpdate
+from tim_gui.gui.live import LiveUpdates
+from tim_gui.gui.store import EntityStore
+
+
+def test_server_sent_events_are_parsed():
+    lines = ["id: 1", "event: revision", "data: {}", "", ": ping", "", "id: 2", "data: a", "data:b", "", "data: c", ""]
+    assert list(parse_sse(lines)) == [("revision", "1", "{}"), ("message", "2", "a\nb"), ("message", "2", "c")]
+
+
+@pytest.mark.parametrize("event_stream", [True, False], ids=["stream", "long-poll"])
+def test_changes_from_other_terminals_reach_the_store(qapp, event_stream):
+    with serve(Inventory.generate(20), event_stream=event_stream, ping_interval=0.1) as server:
+        api, other_terminal = login(server.url), login(server.url)
+        store = EntityStore()
+        store.put_items(api.items())
+        store.put_users(api.get_users())
+
+        live_updates = LiveUpdates(api, store)
+        live_updates._stream.poll_timeout = 0.5
+        live_updates.start()
+        assert wait_until(qapp, lambda: live_updates.revision() == 0)
+
+        updated = []
+        store.itemUpdated.connect(updated.append)
+        other_terminal.update_item(3, ItemUpdate(price=Decimal("9.5")))
+        other_terminal.update_item(3, ItemUpdate(quantity=7))
+        other_terminal.delete_item(4)
+        other_terminal.update_user(2, UserUpdate(name="Renamed"))
+
+        assert wait_until(qapp, lambda: store.user(2).name == "Renamed")
+        assert (store.item(3).price, store.item(3).quantity) == (Decimal("9.5"), 7)
+        assert store.item(4) is None
+        # the two changes of the item came together, it was updated once
+        assert len(updated) == 1
+        assert live_updates._stream.streaming is event_stream
+
+        live_updates.stop()
+        for client in (api, other_terminal):
+            client.request.close()
+
+
+def test_changes_no_longer_kept_are_reported(qapp):
+    inventory = Inventory.generate(1)
+    with serve(inventory) as server:
+        api = login(server.url)
+        with inventory.lock:
+            for quantity in range(EVENT_LOG_SIZE + 1):
+                inventory.update_item(1, {"quantity": quantity})
+
+        with pytest.raises(EventsLost):
+            api.events(after=0)
+
+        live_updates = LiveUpdates(api, EntityStore())
+        live_updates._stream.revision = 0
+        lost = []
+        live_updates.eventsLost.connect(lambda: lost.append(True))
+        live_updates.start()
+        assert wait_until(qapp, lambda: lost and live_updates.revision() == inventory.revision)
+
+        live_updates.stop()
+        api.request.close()
+
+
+def test_only_the_loaded_items_and_users_are_updated(qapp):
+    store = EntityStore()
+    store.put_items([make_item(1)])
+    store.put_users([User(id=1, name="a", email="a@a.com", is_admin=False, items=[])])
+    live_updates = LiveUpdates(TimAPI(Request("http://localhost")), store)
+
+    new_user = User(id=2, name="b", email="b@b.com", is_admin=False, items=[])
+    live_updates._events = [
+        ChangeEvent(revision=1, kind="item", action="changed", id=1, item=make_item(1, quantity=3)),
+        ChangeEvent(revision=2, kind="item", action="changed", id=2, item=make_item(2)),
+        ChangeEvent(revision=3, kind="user", action="changed", id=2, user=new_user),
+    ]
+    live_updates.apply_events()
+
+    assert store.item(1).quantity == 3
+    assert store.item(2) is None and store.user(2) is None
+
+
+def test_unexpected_errors_are_reported_once_and_retried(qapp, monkeypatch):
+    monkeypatch.setattr(LiveUpdates, "RETRY_MS", 10)
+    with serve(Inventory.generate(5)) as server:
+        api = login(server.url)
+        calls = []
+        decode = api.decoder.parse
+
+        def parse(model, data):
+            if model is not ChangeEvent:
+                return decode(model, data)
+            calls.append(data)
+            raise ValueError("unreadable change")
+
+        monkeypatch.setattr(api.decoder, "parse", parse)
+        live_updates = LiveUpdates(api, EntityStore())
+        live_updates._stream.poll_timeout = 0.5
+        failures = []
+        live_updates.failed.connect(failures.append)
+        live_updates.start()
+        assert wait_until(qapp, lambda: live_updates.revision() == 0)
+
+        api.update_item(1, ItemUpdate(quantity=1))
+        api.update_item(2, ItemUpdate(quantity=1))
+        assert wait_until(qapp, lambda: len(calls) >= 3)
+        assert [str(error) for error in failures] == ["unreadable change"]
+
+        live_updates.stop()
+        api.request.close()
+
+
+def test_streams_ended_by_the_server_are_reopened_with_a_backoff():
+    with serve(Inventory.generate(5)) as server:
+        # a proxy closing every stream right away
+        server.max_stream_time = 0
+        api = login(server.url)
+        api.request.backoff, api.request.max_backoff = 0.05, 0.2
+        histogram = api.request.histogram()
+        stream = EventStream(api)
+        thread = threading.Thread(target=lambda: list(stream))
+        thread.start()
+        time.sleep(1)
+        stream.close()
+        thread.join(5)
+
+        # each one is recorded like the other requests
+        stats = histogram.endpoints()[("GET", "/events/")]
+        assert 2 <= stats.calls < 30 and stats.errors == 0
+        assert stream.streaming is True
+
+        for _ in range(api.request.circuit_breaker.failure_threshold):
+            api.request.circuit_breaker.record_failure()
+        with pytest.raises(CircuitOpen):
+            next(iter(EventStream(api)))
+        api.request.close()
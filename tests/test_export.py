@@ -0,0 +1,73 @@
+import csv
+import json
+import threading
+
+import pytest
+
+from benchmarks.fake_tim import Inventory, serve
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.export import export_items
+from tim_gui.api.pages import iter_pages
+from tim_gui.cli import export
+
+
+def test_iter_pages_prefetches_the_next_page():
+    requested = []
+    next_page_requested = threading.Event()
+
+    def fetch(skip: int, limit: int) -> list[int]:
+        requested.append(skip)
+        if skip == 3:
+            next_page_requested.set()
+        return list(range(skip, min(skip + limit, 7)))
+
+    pages = iter_pages(fetch, page_size=3)
+    assert next(pages) == [0, 1, 2]
+    assert next_page_requested.wait(1)
+    assert list(pages) == [[3, 4, 5], [6]]
+    assert requested == [0, 3, 6]
+
+
+def test_iter_items_streams_every_item():
+    with serve(Inventory.generate(250)) as server:
+        api = TimAPI(Request(server.url))
+        assert [item.id for item in api.iter_items(page_size=100)] == list(range(1, 251))
+        assert [user.id for user in api.iter_users(page_size=3)] == list(range(1, 11))
+        api.request.close()
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+def test_export_writes_every_item(tmp_path, format):
+    path = tmp_path / f"inventory.{format}"
+    with serve(Inventory.generate(120)) as server:
+        api = TimAPI(Request(server.url))
+        assert export_items(api, path, page_size=50) == 120
+        api.request.close()
+
+    if format == "csv":
+        rows = list(csv.DictReader(path.open(newline="")))
+    else:
+        rows = [json.loads(line) for line in path.open()]
+    assert len(rows) == 120
+    assert rows[1]["title"] == "Item 2" and rows[1]["price"] == "1.2"
+    assert not (tmp_path / f"inventory.{format}.part").exists()
+
+
+def test_cancelled_export_leaves_nothing_behind(tmp_path):
+    cancelled = threading.Event()
+    cancelled.set()
+    with serve(Inventory.generate(10)) as server:
+        export_items(TimAPI(Request(server.url)), tmp_path / "inventory.csv", cancelled=cancelled)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_command(tmp_path, capsys):
+    with serve(Inventory.generate(30)) as server:
+        status = export(
+            [str(tmp_path / "inventory.jsonl"), "--server", server.url, "--username", "a", "--password", "b"]
+        )
+
+    assert status == 0
+    assert len((tmp_path / "inventory.jsonl").read_text().splitlines()) == 30
+    assert "30 items exported" in capsys.readouterr().err
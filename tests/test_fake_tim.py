@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+from benchmarks.fake_tim import Inventory, serve
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.models import Item, ItemUpdate
+from tim_gui.api.query import ItemQuery, SortKey
+
+
+def test_fake_backend_serves_the_api():
+    with serve(Inventory.generate(250)) as server:
+        api = TimAPI(Request(server.url))
+        api.login(username="admin", password="admin")
+
+        items = api.items(skip=200, limit=100)
+        assert [item.id for item in items] == list(range(201, 251))
+
+        item = api.update_item(1, ItemUpdate(price=Decimal("9.99")))
+        assert item.price == Decimal("9.99")
+        assert server.inventory.revision == 1
+
+        assert api.get_user_me().is_admin
+        api.request.close()
+
+
+def test_items_are_sorted_and_filtered_on_the_server():
+    inventory = Inventory.generate(500)
+    query = ItemQuery(sort=(SortKey("quantity"), SortKey("price", True)), min_price=Decimal("20"), max_quantity=10)
+    with serve(inventory) as server:
+        api = TimAPI(Request(server.url))
+        api.login(username="admin", password="admin")
+
+        pages = [api.items(skip=skip, limit=50, query=query) for skip in range(0, 500, 50)]
+        expected = query.apply(Item(**item) for item in inventory.items.values())
+        assert [item for page in pages for item in page] == expected
+        api.request.close()
@@ -0,0 +1,17 @@
+import pytest
+
+from tim_gui.gui import icons
+
+
+def test_every_icon_is_embedded(qapp):
+    for name in icons.ICON_NAMES:
+        assert not icons.icon(name).isNull()
+
+
+def test_icons_are_loaded_once(qapp):
+    assert icons.icon("tick32x32.png") is icons.icon("tick32x32.png")
+
+
+def test_unknown_icon(qapp):
+    with pytest.raises(ValueError):
+        icons.pixmap("missing.png")
@@ -0,0 +1,92 @@
+import os
+import threading
+
+from PySide6 import QtCore, QtGui
+
+from tests.helpers import wait_until
+from tim_gui.gui import images
+from tim_gui.gui.images import ThumbnailCache, prune_disk_cache
+
+
+def make_image(path, width: int, height: int) -> str:
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+    image.fill(QtCore.Qt.red)
+    image.save(str(path))
+    return str(path)
+
+
+def test_thumbnails_are_decoded_in_the_background_and_cached(qapp, tmp_path):
+    image_path = make_image(tmp_path / "photo.jpg", 1200, 600)
+    cache = ThumbnailCache(disk_cache_dir=tmp_path / "cache")
+    ready = []
+    cache.thumbnailReady.connect(lambda path, size: ready.append((path, size)))
+
+    assert cache.pixmap(image_path, 64) is None
+    assert wait_until(qapp, lambda: ready)
+
+    pixmap = cache.pixmap(image_path, 64)
+    assert (pixmap.width(), pixmap.height()) == (64, 32)
+    assert ready == [(image_path, 64)]
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_memory_cache_is_bounded(qapp, tmp_path):
+    paths = [make_image(tmp_path / f"{i}.png", 64, 64) for i in range(4)]
+    # room for two 64x64 thumbnails
+    cache = ThumbnailCache(max_bytes=2 * 64 * 64 * 4, use_disk_cache=False)
+    ready = []
+    cache.thumbnailReady.connect(lambda path, size: ready.append(path))
+
+    for path in paths:
+        cache.pixmap(path, 64)
+    assert wait_until(qapp, lambda: len(ready) == 4)
+
+    cached = [path for path in paths if cache.pixmap(path, 64) is not None]
+    assert len(cached) == 2
+
+
+def test_missing_images_fall_back_to_the_broken_image(qapp, tmp_path):
+    cache = ThumbnailCache(use_disk_cache=False)
+    ready = []
+    cache.thumbnailReady.connect(lambda path, size: ready.append(path))
+
+    cache.pixmap(str(tmp_path / "missing.png"), 64)
+    assert wait_until(qapp, lambda: ready)
+
+    assert cache.pixmap(str(tmp_path / "missing.png"), 64) is cache.broken_image
+
+
+def test_modified_images_are_decoded_again(qapp, tmp_path, monkeypatch):
+    stat_threads = []
+
+    def modification_time(image_path):
+        stat_threads.append(threading.current_thread())
+        return os.stat(image_path).st_mtime_ns
+
+    monkeypatch.setattr(images, "modification_time", modification_time)
+    image_path = make_image(tmp_path / "photo.png", 64, 64)
+    cache = ThumbnailCache(disk_cache_dir=tmp_path / "cache")
+    cache.RECHECK_INTERVAL_MS = 0
+    ready = []
+    cache.thumbnailReady.connect(lambda path, size: ready.append(path))
+
+    cache.pixmap(image_path, 64)
+    assert wait_until(qapp, lambda: ready)
+
+    make_image(image_path, 32, 32)
+    os.utime(image_path, ns=(0, os.stat(image_path).st_mtime_ns + 10**9))
+    # the old thumbnail is shown until the new one is decoded
+    assert cache.pixmap(image_path, 64).width() == 64
+    assert wait_until(qapp, lambda: len(ready) == 2)
+    assert cache.pixmap(image_path, 64).width() == 32
+    assert stat_threads and threading.main_thread() not in stat_threads
+
+
+def test_disk_cache_is_bounded(tmp_path):
+    for i in range(4):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, ns=(0, i * 10**9))
+
+    prune_disk_cache(tmp_path, 250)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.png", "3.png"]
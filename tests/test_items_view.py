@@ -0,0 +1,144 @@
+from decimal import Decimal
+
+from tests.helpers import make_item, wait_until
+from tim_gui.api.query import ItemQuery, SortKey
+from tim_gui.gui.items_view import ItemsList, ItemsModel
+
+
+def test_model_tracks_rows_by_id(qapp):
+    model = ItemsModel([make_item(1), make_item(2), make_item(3)])
+
+    model.insert_item(0, make_item(4))
+    model.remove_item(2)
+    model.update_item(make_item(3, title="Updated"))
+
+    assert [model.item(row).id for row in range(model.rowCount())] == [4, 1, 3]
+    assert model.row_of(3) == 2
+    assert model.item(2).title == "Updated"
+
+
+def test_inserting_a_listed_item_moves_it(qapp):
+    model = ItemsModel([make_item(1), make_item(2), make_item(3)])
+
+    model.insert_item(0, make_item(3, title="Updated"))
+    model.insert_item(0, make_item(3, title="Again"))
+
+    assert list(model.columns().ids()) == [3, 1, 2]
+    assert model.rows_by_id() == {3: 0, 1: 1, 2: 2}
+    assert model.item(0).title == "Again"
+
+
+def test_list_widget_count_does_not_grow_with_items(qapp):
+    items_list = ItemsList([make_item(id) for id in range(10)])
+    children = len(items_list.findChildren(object))
+
+    items_list.add_items([make_item(id) for id in range(10, 5000)])
+    items_list.flush()
+
+    assert len(items_list) == 5000
+    assert len(items_list.findChildren(object)) == children
+
+
+def test_large_pages_are_added_over_several_frames(qapp):
+    items_list = ItemsList([])
+    items_list._feeder.budget = 0.0005
+    loaded = []
+    items_list.rowsLoaded.connect(lambda: loaded.append(len(items_list)))
+
+    items_list.add_items([make_item(id) for id in range(20_000)])
+
+    # the first rows are there right away, the rest comes with the next iterations of the event loop
+    assert 0 < len(items_list) < 20_000
+    items_list.remove_item(19_999)
+    assert len(items_list) == 19_999 and items_list.pending() == 0
+    assert loaded == [20_000]
+
+    items_list.add_items([make_item(id) for id in range(20_000, 40_000)])
+    assert wait_until(qapp, lambda: len(loaded) == 2, timeout=10)
+    assert loaded[1] == 39_999
+
+
+def test_query_sorts_and_filters_the_loaded_items(qapp):
+    items = [make_item(id, price=Decimal(id % 7), quantity=id % 11, owner_id=id % 3) for id in range(50_000)]
+    items_list = ItemsList(items)
+    items_list.flush()
+    items_list.setCurrentIndex(items_list.model().index(100, 0))
+
+    query = ItemQuery(sort=(SortKey("quantity", True), SortKey("price")), max_quantity=5, owner_id=1)
+    items_list.set_query(query)
+
+    model = items_list.model()
+    shown = [model.index(row, 0).data(ItemsModel.ItemRole) for row in range(model.rowCount())]
+    assert shown == query.apply(items)
+    # the current item stays current wherever it moved
+    assert items_list.currentIndex().data(ItemsModel.ItemRole).id == 100
+
+    # new and changed items take their place in the order
+    items[1] = make_item(1, price=Decimal(0), quantity=5, owner_id=1)
+    items.append(make_item(50_000, price=Decimal(0), quantity=5, owner_id=1))
+    items_list.add_items(items[-1:])
+    items_list.update_item(items[1])
+    items_list.flush()
+    shown = [model.index(row, 0).data(ItemsModel.ItemRole) for row in range(model.rowCount())]
+    assert shown == query.apply(items)
+    assert shown[0].id == 1
+
+    items_list.set_query(ItemQuery())
+    assert model.rowCount() == 50_001
+
+
+def test_filtered_lists_keep_paging_but_search_results_do_not(qapp):
+    items_list = ItemsList([make_item(id, quantity=id % 2) for id in range(2000)])
+    items_list.resize(300, 300)
+    items_list.show()
+    items_list.flush()
+    items_list.set_query(ItemQuery(max_quantity=0))
+    assert wait_until(qapp, lambda: items_list.verticalScrollBar().maximum() > 0)
+    reached_end = []
+    items_list.reachedEnd.connect(lambda: reached_end.append(True))
+
+    scroll_bar = items_list.verticalScrollBar()
+    scroll_bar.setValue(scroll_bar.maximum())
+    assert reached_end
+
+    reached_end.clear()
+    items_list.set_filter(set(range(0, 2000, 2)))
+    assert wait_until(qapp, lambda: scroll_bar.maximum() > 0)
+    scroll_bar.setValue(0)
+    scroll_bar.setValue(scroll_bar.maximum())
+    assert not reached_end
+
+
+def hover(items_list: ItemsList, row: int, x: int, y: int):
+    from PySide6 import QtCore, QtGui
+
+    rect = items_list.visualRect(items_list.model().index(row, 0))
+    pos = QtCore.QPointF(rect.left() + x, rect.top() + y)
+    event = QtGui.QMouseEvent(
+        QtCore.QEvent.MouseMove, pos, pos, QtCore.Qt.NoButton, QtCore.Qt.NoButton, QtCore.Qt.NoModifier
+    )
+    QtCore.QCoreApplication.sendEvent(items_list.viewport(), event)
+
+
+def test_hover_preview_is_shared_and_created_lazily(qapp):
+    from tim_gui.gui import items_view
+
+    lists = [ItemsList([make_item(id) for id in range(20)]) for _ in range(2)]
+    for items_list in lists:
+        items_list.resize(600, 400)
+        items_list.show()
+    qapp.processEvents()
+    assert not any(items_list.findChildren(items_view.PreviewImage) for items_list in lists)
+
+    hover(lists[0], 0, 20, 20)
+    preview = items_view.shared_preview()
+    assert preview.isVisible()
+
+    hover(lists[0], 0, 300, 20)
+    assert not preview.isVisible()
+
+    hover(lists[1], 1, 20, 20)
+    assert items_view.shared_preview() is preview
+    assert preview.isVisible()
+    lists[1].hide()
+    assert not preview.isVisible()
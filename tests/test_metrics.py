@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from benchmarks.fake_tim import Inventory, serve
+from tim_gui.api import Request, TimAPI
+from tim_gui.api.metrics import (HistogramSink, JsonLinesSink,
+                                 RequestMetrics, endpoint_name)
+from tim_gui.gui.diagnostics import DiagnosticsPanel
+
+
+def test_endpoint_name_groups_ids():
+    assert endpoint_name("/items/update/12") == "/items/update/{id}"
+    assert endpoint_name("/users/3/items/") == "/users/{id}/items/"
+    assert endpoint_name("/items/Pen 2") == "/items/Pen 2"
+
+
+def test_requests_are_recorded(tmp_path):
+    log_path = tmp_path / "requests.jsonl"
+    with serve(Inventory.generate(300)) as server:
+        api = TimAPI(Request(server.url))
+        histogram = api.request.histogram()
+        api.request.add_sink(JsonLinesSink(log_path))
+
+        api.items(skip=0, limit=200)
+        api.items(skip=200, limit=200)
+        api.get_user(2)
+        with pytest.raises(Exception):
+            api.get_user(99)
+        api.request.close()
+
+    endpoints = histogram.endpoints()
+    items = endpoints[("GET", "/items/")]
+    assert items.calls == 2
+    assert items.status_codes == {200: 2}
+    assert items.response_bytes > 0
+    assert len(items.samples["validation"]) == 2
+    assert 0 < items.percentile("total", 50) <= items.percentile("total", 99)
+
+    users = endpoints[("GET", "/users/{id}")]
+    assert (users.calls, users.errors, users.status_codes) == (2, 1, {200: 1, 404: 1})
+
+    lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [line["endpoint"] for line in lines] == ["/items/", "/items/", "/users/{id}", "/users/{id}"]
+    # only the first request opened a connection
+    assert lines[0]["connect"] > 0 and lines[1]["connect"] == 0
+
+
+def test_diagnostics_panel_shows_every_endpoint(qapp):
+    histogram = HistogramSink()
+    for total in (0.01, 0.02, 0.03):
+        histogram.record(RequestMetrics("GET", "/items/", status_code=200, server=total))
+    histogram.record(RequestMetrics("GET", "/users/me", status_code=200, server=0.5))
+
+    panel = DiagnosticsPanel(histogram)
+    panel.refresh()
+
+    assert panel.table.rowCount() == 2
+    assert panel.table.item(0, 0).text() == "GET /items/"
+    assert panel.table.item(0, 1).text() == "3"
+    assert panel.table.item(0, 4).text() == "20.0 ms"
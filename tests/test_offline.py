@@ -0,0 +1,180 @@
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.fake_tim import Inventory, serve
+from tests.helpers import wait_until
+from tim_gui.api import Request
+from tim_gui.api.errors import RequestTimeout, ServerUnavailable
+from tim_gui.api.mirror import LocalMirror
+from tim_gui.api.models import Item, ItemCreate, ItemUpdate
+from tim_gui.api.offline import OfflineTimAPI
+from tim_gui.api.query import ItemQuery, SortKey
+from tim_gui.gui.offline import OfflineSync
+from tim_gui.gui.store import EntityStore
+
+
+def test_changes_made_offline_are_replayed(tmp_path):
+    inventory = Inventory.generate(20)
+    api = OfflineTimAPI(LocalMirror(tmp_path / "mirror.sqlite3"))
+
+    with serve(inventory) as server:
+        port = server.server_address[1]
+        api.request = Request(server.url)
+        api.login(username="admin", password="secret")
+        assert len(api.items(limit=100)) == 20
+        me = api.get_user_me()
+
+    # the server is gone
+    assert api.items(skip=0, limit=5) == api.mirror.items(0, 5)
+    assert not api.online
+    assert api.get_item("Item 3").id == 3
+    assert api.get_user_me() == me
+
+    assert api.update_item(1, ItemUpdate(price=Decimal("2.5"))).price == Decimal("2.5")
+    assert api.withdraw_item(2, 1).quantity == 1
+    api.delete_item(3)
+    api.update_item(4, ItemUpdate(quantity=30))
+    created = api.create_item(me.id, ItemCreate(title="New", bar_code="n", price=Decimal("1"), quantity=1))
+    assert created.id < 0
+    api.withdraw_item(created.id, 1)
+    assert api.pending_count() == 6
+    assert api.mirror.item(3) is None
+
+    # signing in again still works offline, with the same password only
+    api.login(username="admin", password="secret")
+    with pytest.raises(ServerUnavailable):
+        api.login(username="admin", password="wrong")
+
+    # someone else changed item 4 meanwhile
+    inventory.update_item(4, {"quantity": 5})
+
+    with serve(inventory, port=port):
+        report = api.sync()
+
+    assert api.online and api.pending_count() == 0
+    assert report.applied == 5
+    [conflict] = report.conflicts
+    assert conflict.operation.item_id == 4 and conflict.server_item.quantity == 5
+    assert api.mirror.item(4).quantity == 5
+
+    new_id = report.id_changes[created.id]
+    assert inventory.items[new_id]["quantity"] == 0
+    assert inventory.items[1]["price"] == 2.5
+    assert inventory.items[2]["quantity"] == 1
+    assert 3 not in inventory.items and report.deleted_ids == [3]
+    assert api.mirror.item(created.id) is None and api.mirror.item(new_id).title == "New"
+
+
+def test_sync_stays_offline_without_the_server(tmp_path):
+    api = OfflineTimAPI(LocalMirror(), Request("http://127.0.0.1:9"))
+    api.mirror.remember_login("admin", "secret")
+    api.login(username="admin", password="secret")
+
+    with pytest.raises(ServerUnavailable):
+        api.sync()
+    assert not api.online
+
+
+def test_changes_the_server_may_have_received_are_not_queued(tmp_path):
+    inventory = Inventory.generate(5)
+    api = OfflineTimAPI(LocalMirror(tmp_path / "mirror.sqlite3"))
+
+    with serve(inventory) as server:
+        api.request = Request(server.url, read_timeout=0.2)
+        api.login(username="admin", password="secret")
+        quantity = inventory.items[1]["quantity"]
+        # the requests are handled after the client gave up on them
+        server.latency = 0.5
+        with pytest.raises(RequestTimeout):
+            api.create_item(1, ItemCreate(title="New", bar_code="n", price=Decimal("1"), quantity=1))
+        assert not api.online and api.pending_count() == 0
+
+        server.latency = 0
+        time.sleep(0.5)
+        api.sync()
+        server.latency = 0.5
+        with pytest.raises(RequestTimeout):
+            api.withdraw_item(1, 1)
+        assert not api.online and api.pending_count() == 0
+
+        server.latency = 0
+        time.sleep(0.5)
+        api.sync()
+
+    assert [item["title"] for item in inventory.items.values()].count("New") == 1
+    assert inventory.items[1]["quantity"] == quantity - 1
+
+
+def test_replayed_changes_target_the_item_by_id(tmp_path):
+    inventory = Inventory.generate(10)
+    api = OfflineTimAPI(LocalMirror(tmp_path / "mirror.sqlite3"))
+
+    with serve(inventory) as server:
+        port = server.server_address[1]
+        api.request = Request(server.url)
+        api.login(username="admin", password="secret")
+        api.items()
+
+    api.update_item(6, ItemUpdate(price=Decimal("3")))
+    api.delete_item(7)
+    # another item took the title of item 6, item 7 was renamed
+    inventory.update_item(2, {"title": "Item 6"})
+    inventory.update_item(7, {"title": "Renamed"})
+
+    with serve(inventory, port=port):
+        report = api.sync()
+
+    assert report.applied == 1 and inventory.items[6]["price"] == 3
+    [conflict] = report.conflicts
+    assert conflict.operation.item_id == 7 and conflict.server_item.title == "Renamed"
+    assert 7 in inventory.items and api.mirror.item(7).title == "Renamed"
+
+
+def test_offline_sync_updates_the_store(qapp):
+    inventory = Inventory.generate(5)
+    api = OfflineTimAPI(LocalMirror())
+    store = EntityStore()
+
+    with serve(inventory) as server:
+        port = server.server_address[1]
+        api.request = Request(server.url)
+        api.login(username="admin", password="secret")
+        store.put_items(api.items())
+
+    created = api.create_item(1, ItemCreate(title="New", bar_code="n", price=Decimal("1"), quantity=1))
+    store.put_item(created)
+    api.delete_item(2)
+    store.remove_item(2)
+
+    sync = OfflineSync(api, store)
+    statuses = []
+    sync.statusChanged.connect(statuses.append)
+    counting_threads = []
+    pending_count = api.pending_count
+    api.pending_count = lambda: counting_threads.append(threading.current_thread()) or pending_count()
+    sync.refresh_status()
+    assert wait_until(qapp, lambda: statuses == ["Offline — 2 changes pending"])
+    # the mirror isn't queried from the GUI thread
+    assert threading.main_thread() not in counting_threads
+
+    with serve(inventory, port=port):
+        sync.sync()
+        assert wait_until(qapp, lambda: len(statuses) == 2)
+
+    assert statuses[-1] == ""
+    assert store.item(created.id) is None
+    assert store.item(6).title == "New" and store.item(2) is None
+
+
+def test_mirror_sorts_and_filters_like_the_server():
+    items = [Item(**item) for item in Inventory.generate(300).items.values()]
+    mirror = LocalMirror()
+    mirror.put_items(items)
+
+    query = ItemQuery(sort=(SortKey("title", True),), max_price=Decimal("50.5"), min_quantity=40, owner_id=3)
+    pages = [mirror.items(skip, 10, query) for skip in range(0, 300, 10)]
+    assert [item for page in pages for item in page] == query.apply(items)
+    mirror.close()
@@ -0,0 +1,55 @@
+import threading
+import time
+
+from tests.helpers import make_item, wait_until
+from tim_gui.gui.paging import ItemPager
+
+INVENTORY = [make_item(id) for id in range(250)]
+
+
+def test_pages_are_delivered_in_order_with_the_true_offset(qapp):
+    calls = []
+
+    def fetch(skip: int, limit: int):
+        calls.append((skip, limit))
+        # make the first page the slowest one
+        time.sleep(0.05 if skip == 0 else 0)
+        return INVENTORY[skip : skip + limit]
+
+    pager = ItemPager(fetch, page_size=100, max_page_size=100, prefetch_pages=3, target_latency=10)
+    loaded = []
+    pager.pageLoaded.connect(loaded.extend)
+
+    pager.prefetch()
+    assert wait_until(qapp, lambda: pager.exhausted and pager.in_flight() == 0)
+
+    assert [item.id for item in loaded] == list(range(250))
+    assert pager.loaded_offset == 250
+    assert sorted(calls) == [(0, 100), (100, 100), (200, 100)]
+
+
+def test_repeated_fetch_more_does_not_duplicate_requests(qapp):
+    release = threading.Event()
+    calls = []
+
+    def fetch(skip: int, limit: int):
+        calls.append(skip)
+        release.wait()
+        return INVENTORY[skip : skip + limit]
+
+    pager = ItemPager(fetch, page_size=100)
+    for _ in range(5):
+        pager.fetch_more()
+    release.set()
+
+    assert wait_until(qapp, lambda: pager.in_flight() == 0)
+    assert calls == [0]
+
+
+def test_page_size_adapts_to_latency(qapp):
+    pager = ItemPager(lambda skip, limit: INVENTORY[skip : skip + limit], page_size=50, target_latency=10)
+
+    pager.fetch_more()
+    assert wait_until(qapp, lambda: pager.in_flight() == 0)
+
+    assert pager.page_size == 100
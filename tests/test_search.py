@@ -0,0 +1,48 @@
+from tests.helpers import make_item
+from tim_gui.gui.items_view import ItemsList
+from tim_gui.gui.search import SearchIndex
+
+
+def test_search_matches_title_bar_code_and_description():
+    index = SearchIndex(
+        [
+            make_item(1, title="Blue Pen", bar_code="7891000"),
+            make_item(2, title="Pencil", bar_code="7892000", description="HB graphite"),
+            make_item(3, title="Stapler", bar_code="1234567"),
+        ]
+    )
+
+    assert index.search("pen") == {1, 2}
+    assert index.search("PENC") == {2}
+    assert index.search("789") == {1, 2}
+    assert index.search("graph") == {2}
+    assert index.search("e") == {1, 2, 3}
+    assert index.search("  ") is None
+
+
+def test_search_does_not_match_across_fields():
+    index = SearchIndex([make_item(1, title="abc", bar_code="def")])
+
+    assert index.search("cde") == set()
+
+
+def test_search_sees_updates_and_removals():
+    index = SearchIndex([make_item(1, title="Hammer"), make_item(2, title="Hammock")])
+    assert index.search("hamm") == {1, 2}
+
+    index.add_item(make_item(2, title="Chair"))
+    assert index.search("hamm") == {1}
+
+    index.remove_item(1)
+    assert index.search("hamme") == set()
+
+
+def test_list_filter_keeps_source_order(qapp):
+    items_list = ItemsList([make_item(id) for id in range(10)])
+
+    items_list.set_filter({7, 2, 5})
+    visible = [items_list.model().index(row, 0).data(items_list.items_model.ItemRole).id for row in range(3)]
+    assert visible == [2, 5, 7]
+
+    items_list.set_filter(None)
+    assert items_list.model().rowCount() == 10
@@ -0,0 +1,51 @@
+import io
+import subprocess
+import sys
+
+from benchmarks.fake_tim import Inventory, serve
+from tests.helpers import wait_until
+from tim_gui.api import Request, TimAPI
+from tim_gui.gui.login import LoginWindow
+from tim_gui.gui.startup import StartupReport
+
+
+def test_gui_package_imports_nothing_heavy():
+    heavy = ["requests", "pydantic", "tim_gui.api", "tim_gui.gui.windows"]
+    code = f"import sys, tim_gui.gui; print([name for name in {heavy!r} if name in sys.modules])"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_signing_in_waits_for_the_api(qapp):
+    with serve(Inventory.generate(10)) as server:
+        login = LoginWindow()
+        login.login_le.setText("admin")
+        login.password_le.le.setText("admin")
+        login.signin()
+        assert not login.signin_btn.isEnabled()
+
+        api = TimAPI(Request(server.url))
+        assert api.request.preconnect()
+        login.set_api(api)
+
+        assert wait_until(qapp, lambda: hasattr(login, "main_window"))
+        main_window = login.main_window
+        assert wait_until(qapp, lambda: main_window.store.item_count() == 10 and main_window.store.current_user)
+        main_window.close()
+
+
+def test_startup_report_is_printed_once(monkeypatch):
+    monkeypatch.setenv("TIM_GUI_STARTUP_REPORT", "1")
+    report = StartupReport()
+    report.mark("login window shown")
+    report.mark("first items shown")
+
+    output = io.StringIO()
+    report.finish(output)
+    report.mark("later")
+    report.finish(output)
+
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "Startup:" and len(lines) == 3
+    assert lines[2].endswith("first items shown")
+    assert report.elapsed("first items shown") >= report.elapsed("login window shown")
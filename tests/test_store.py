@@ -0,0 +1,31 @@
+from tests.helpers import make_item
+from tim_gui.gui.store import EntityStore
+
+
+def test_put_items_emits_only_what_changed(qapp):
+    store = EntityStore()
+    added, updated, removed = [], [], []
+    store.itemsAdded.connect(added.extend)
+    store.itemUpdated.connect(updated.append)
+    store.itemRemoved.connect(removed.append)
+
+    store.put_items([make_item(1), make_item(2)])
+    store.put_items([make_item(1), make_item(2, title="Renamed"), make_item(3)])
+    store.remove_item(1)
+
+    assert [item.id for item in added] == [1, 2, 3]
+    assert [item.title for item in updated] == ["Renamed"]
+    assert removed == [1]
+
+
+def test_secondary_indexes_follow_updates(qapp):
+    store = EntityStore()
+
+    store.put_items([make_item(1, title="Pen", bar_code="111"), make_item(2, title="Pen", bar_code="222")])
+    store.put_item(make_item(2, title="Pencil", bar_code="222"))
+    store.remove_item(1)
+
+    assert store.items_by_title("Pen") == []
+    assert [item.id for item in store.items_by_title("Pencil")] == [2]
+    assert [item.id for item in store.items_by_bar_code("222")] == [2]
+    assert store.items_by_bar_code("111") == []
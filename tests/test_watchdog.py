@@ -0,0 +1,41 @@
+import time
+
+from tests.helpers import wait_until
+from tim_gui.gui.watchdog import StallWatchdog, call_site
+
+
+def block_event_loop(seconds: float):
+    time.sleep(seconds)
+
+
+def test_stalls_are_aggregated_by_call_site(qapp):
+    watchdog = StallWatchdog(threshold=0.05)
+    watchdog.start()
+    try:
+        wait_until(qapp, lambda: False, timeout=0.1)
+        for _ in range(2):
+            block_event_loop(0.2)
+            wait_until(qapp, lambda: bool(watchdog.report()) and watchdog.report()[0].count == _ + 1, timeout=0.5)
+    finally:
+        watchdog.stop()
+
+    [site] = watchdog.report()
+    assert site.site[2] == "block_event_loop"
+    assert site.count == 2
+    assert 0.1 < site.longest < 0.3
+    assert "block_event_loop" in watchdog.format_report()
+
+
+def test_no_stalls_while_the_event_loop_runs(qapp):
+    watchdog = StallWatchdog(threshold=0.05)
+    watchdog.start()
+    wait_until(qapp, lambda: False, timeout=0.3)
+    watchdog.stop()
+
+    assert watchdog.report() == []
+
+
+def test_call_site_prefers_our_code():
+    stack = [("/app/tim_gui/gui/windows.py", 10, "search"), ("/usr/lib/python3/json/decoder.py", 5, "decode")]
+    assert call_site(stack) == stack[0]
+    assert call_site(stack[1:]) == stack[1]
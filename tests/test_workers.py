@@ -0,0 +1,63 @@
+import threading
+
+from PySide6 import QtCore, QtWidgets
+
+from tests.helpers import wait_until
+from tim_gui.gui.workers import TaskRunner
+
+
+def test_result_is_delivered_in_the_gui_thread(qapp):
+    window = QtWidgets.QWidget()
+    runner = TaskRunner(window)
+    results = []
+
+    runner.submit(lambda: threading.get_ident(), on_result=lambda r: results.append((r, threading.get_ident())))
+
+    assert wait_until(qapp, lambda: results)
+    worker_thread, receiving_thread = results[0]
+    assert worker_thread != threading.get_ident()
+    assert receiving_thread == threading.get_ident()
+    assert wait_until(qapp, lambda: runner.pending() == 0)
+
+
+def test_errors_are_delivered(qapp):
+    window = QtWidgets.QWidget()
+    runner = TaskRunner(window)
+    errors = []
+
+    def fail():
+        raise ValueError("boom")
+
+    runner.submit(fail, on_error=errors.append)
+
+    assert wait_until(qapp, lambda: errors)
+    assert str(errors[0]) == "boom"
+
+
+def test_closing_the_window_cancels_pending_jobs(qapp):
+    window = QtWidgets.QWidget()
+    window.show()
+    runner = TaskRunner(window)
+    release = threading.Event()
+    results = []
+
+    runner.submit(release.wait, on_result=results.append)
+    window.close()
+    release.set()
+
+    assert wait_until(qapp, lambda: runner.pending() == 0)
+    assert results == []
+
+
+def test_only_windows_are_filtered(qapp):
+    filtered = []
+    original = TaskRunner.eventFilter
+    TaskRunner.eventFilter = lambda self, watched, event: filtered.append(watched) or original(self, watched, event)
+    try:
+        TaskRunner(qapp)
+        qapp.postEvent(qapp, QtCore.QEvent(QtCore.QEvent.User))
+        qapp.processEvents()
+    finally:
+        TaskRunner.eventFilter = original
+
+    assert qapp not in filtered
@@ -1,12 +1,40 @@
+import hashlib
+import random
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from functools import partial
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import urlencode
 
 import requests
-from pydantic import BaseModel, parse_obj_as
+import urllib3
+from pydantic import BaseModel
 from requests.models import Response
+from urllib3.exceptions import ConnectTimeoutError
 
-from .models import (Item, ItemCreate, ItemUpdate, Login, User, UserCreate,
-                     UserUpdate)
+from .cache import CacheEntry, ResponseCache, parser_key
+from .circuit import CircuitBreaker
+from .decoding import Decoder, Model, loads
+from .errors import (EventsLost, RequestError, RequestTimeout, ServerError,
+                     ServerUnavailable)
+from .metrics import (HistogramSink, MetricsSink, RequestMetrics,
+                      TimedHTTPAdapter, endpoint_name, reset_connect_time,
+                      take_connect_time)
+from .models import (ChangeEvents, Changes, Item, ItemBatch, ItemCreate,
+                     ItemOperation, ItemOperationResult, ItemUpdate, Login,
+                     User, UserCreate, UserUpdate)
+from .pages import iter_pages
+from .query import ItemQuery
+
+# methods that can be sent again without changing the result, unless `request` is told otherwise
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+# the answers of a server without the "/items/batch" endpoint
+BATCH_UNSUPPORTED_STATUSES = frozenset((404, 405))
+# answers of a server that is restarting or overloaded, worth retrying
+RETRY_STATUSES = frozenset((502, 503, 504))
+# failures to reach the server
+NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
 
 
 @dataclass
@@ -19,18 +47,93 @@ class RequestResult:
 class Request:
     # result: Optional[RequestResult] = None
     prefix: str = "http://127.0.0.1:8000"
-    _request_type_table: dict[str, Callable[..., Response]] = field(
-        default_factory=lambda: {
-            "POST": requests.post,
-            "GET": requests.get,
-            "PUT": requests.put,
-            "DELETE": requests.delete,
-            "HEAD": requests.head,
-            "PATCH": requests.patch,
-            "OPTIONS": requests.options,
-        },
-        init=False,
-    )
+    pool_connections: int = 4
+    pool_maxsize: int = 10
+    max_retries: int = 3
+    keep_alive: bool = True
+    # seconds, the read timeout is the longest wait for a byte of the response, not for all of it
+    connect_timeout: float = 3.05
+    read_timeout: float = 30.0
+    # the delay before the n-th retry is random between 0 and `backoff * 2**n`, capped at `max_backoff`
+    backoff: float = 0.1
+    max_backoff: float = 5.0
+    # fails the requests fast while the server is down, disabled if None
+    circuit_breaker: Optional[CircuitBreaker] = field(default_factory=CircuitBreaker, repr=False)
+    session: requests.Session = field(default_factory=requests.Session, repr=False)
+    sinks: list[MetricsSink] = field(default_factory=list, repr=False)
+    # conditional requests for the endpoints requested with `cache=True`, disabled if None
+    response_cache: Optional[ResponseCache] = field(default=None, repr=False)
+    _request_type_table: dict[str, Callable[..., Response]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # the retries are made by `request`, which knows which requests can be sent again
+        adapter = TimedHTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Connection"] = "keep-alive" if self.keep_alive else "close"
+
+        self._request_type_table = {
+            "POST": self.session.post,
+            "GET": self.session.get,
+            "PUT": self.session.put,
+            "DELETE": self.session.delete,
+            "HEAD": self.session.head,
+            "PATCH": self.session.patch,
+            "OPTIONS": self.session.options,
+        }
+
+    def set_auth(self, token_type: str, access_token: str):
+        self.session.headers["Authorization"] = f"{token_type.capitalize()} {access_token}"
+
+    def clear_auth(self):
+        self.session.headers.pop("Authorization", None)
+
+    def close(self):
+        self.session.close()
+
+    def preconnect(self) -> bool:
+        """
+        Opens a connection to the server, kept in the pool for the next request, so the first one
+        doesn't wait for the TCP (and TLS) handshake. Returns whether it could be opened.
+        """
+        adapter = self.session.get_adapter(self.prefix)
+        # the pool the requests will use, its key depends on the TLS settings and the proxies
+        settings = self.session.merge_environment_settings(self.prefix, {}, None, None, None)
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            request = requests.Request("GET", self.prefix).prepare()
+            pool = adapter.get_connection_with_tls_context(
+                request, settings["verify"], settings["proxies"], settings["cert"]
+            )
+        else:
+            pool = adapter.get_connection(self.prefix, settings["proxies"])
+        # the pool has no public way to open a connection without sending a request
+        connection = pool._get_conn()
+        try:
+            connection.connect()
+        except (OSError, urllib3.exceptions.HTTPError):
+            connection.close()
+            pool._put_conn(None)
+            return False
+        pool._put_conn(connection)
+        return True
+
+    def add_sink(self, sink: MetricsSink):
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: MetricsSink):
+        self.sinks.remove(sink)
+
+    def histogram(self) -> HistogramSink:
+        """
+        The `HistogramSink` of this request, added if there isn't one yet
+        """
+        for sink in self.sinks:
+            if isinstance(sink, HistogramSink):
+                return sink
+
+        sink = HistogramSink()
+        self.add_sink(sink)
+        return sink
 
     def request(
         self,
@@ -39,7 +142,26 @@ class Request:
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
         request_model=None,
+        parse: Optional[Callable[[Any], Any]] = None,
+        cache: bool = False,
+        keep_parsed: bool = True,
+        idempotent: Optional[bool] = None,
     ):
+        """
+        Sends the request and returns the decoded JSON of the response, passed through `parse` when
+        given. The timings and sizes of every phase are recorded into the `sinks`. With `cache` a GET
+        is made conditional on the `response_cache` and a 304 is answered from it, without parsing
+        the body again unless `keep_parsed` is False: the parsed results aren't counted by the cache,
+        only the body of the large responses should be kept.
+
+        Requests that failed to reach the server or got a 502/503/504 are retried up to `max_retries`
+        times, only when they are `idempotent` (by default when the method is) or surely weren't sent.
+        Raises `ServerUnavailable` (`RequestTimeout`, `CircuitOpen`) when the server can't be reached,
+        `ServerError` for a 5xx and `RequestError` for a 4xx.
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
         if request_model is None:
             data = dict()
         elif isinstance(request_model, BaseModel):
@@ -50,142 +172,362 @@ class Request:
         if issubclass(type(request_model), BaseModel):
             if "price" in data:
                 data["price"] = str(data["price"])
+            body = {"json": data}
+        else:
+            body = {"data": data}
 
-            result = self._request_type_table[method](
-                f"{self.prefix}{endpoint}", params=params, headers=headers, json=data
+        cache_key, entry = None, None
+        if cache and method == "GET" and self.response_cache is not None:
+            cache_key = self.__cache_key(endpoint, params)
+            entry = self.response_cache.get(cache_key)
+            if entry is not None:
+                headers = {**(headers or {}), **entry.validators()}
+
+        metrics = RequestMetrics(method, endpoint_name(endpoint))
+        try:
+            result, content = self.__send(
+                method, f"{self.prefix}{endpoint}", idempotent, metrics, params=params, headers=headers, **body
             )
-        else:
+            request_body = result.request.body or b""
+            metrics.request_bytes = len(request_body.encode() if isinstance(request_body, str) else request_body)
+            metrics.response_bytes = len(content)
+
+            if 500 <= result.status_code <= 599:
+                raise ServerError(f"{result.status_code} - {result.reason}", result.status_code)
+
+            if result.status_code == 304 and entry is not None:
+                content = entry.content
+                if parse is not None and parser_key(parse) in entry.parsed:
+                    return copy_result(entry.parsed[parser_key(parse)])
+            elif cache_key is not None and result.status_code == 200:
+                entry = self.__cache_response(cache_key, result, content)
+            else:
+                entry = None
+
+            start = time.perf_counter()
+            result_data = loads(content)
+            metrics.decode = time.perf_counter() - start
+
+            if 400 <= result.status_code <= 499:
+                raise RequestError(
+                    f"Error in request:\n\tstatus code: {result.status_code}\n\tDetail: {result_data['detail']}",
+                    result.status_code,
+                )
+
+            if parse is not None:
+                start = time.perf_counter()
+                result_data = parse(result_data)
+                metrics.validation = time.perf_counter() - start
+
+                if entry is not None and keep_parsed:
+                    entry.parsed[parser_key(parse)] = copy_result(result_data)
+
+            return result_data
+        except Exception as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            for sink in list(self.sinks):
+                sink.record(metrics)
+
+    @contextmanager
+    def stream(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None
+    ) -> Iterator[Response]:
+        """
+        A GET whose response is read by the caller as it comes, closed on exit. It goes through the
+        circuit breaker, the timeouts and the `sinks` like `request` but isn't retried, the caller knows
+        when to connect again. The `download` phase is how long the response was read. Raises
+        `ServerUnavailable` when the server can't be reached, the status code is left to the caller.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+        metrics = RequestMetrics("GET", endpoint_name(endpoint))
+        try:
+            try:
+                result = self.__open("GET", f"{self.prefix}{endpoint}", metrics, params=params, headers=headers)
+            except NETWORK_ERRORS as e:
+                self.__record_outcome(False)
+                raise unavailable(e)
+            self.__record_outcome(result.status_code not in RETRY_STATUSES)
+
+            start = time.perf_counter()
+            try:
+                yield result
+            finally:
+                metrics.download = time.perf_counter() - start
+                metrics.response_bytes = result.raw.tell()
+                result.close()
+        except Exception as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            for sink in list(self.sinks):
+                sink.record(metrics)
+
+    def __send(
+        self, method: str, url: str, idempotent: bool, metrics: RequestMetrics, **kwargs
+    ) -> tuple[Response, bytes]:
+        """
+        Sends the request and reads the response, retrying with a jittered exponential backoff
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+        attempt = 0
+        while True:
+            error: Optional[ServerUnavailable] = None
+            try:
+                result, content = self.__attempt(method, url, metrics, **kwargs)
+            except NETWORK_ERRORS as e:
+                error = unavailable(e)
+                can_retry = idempotent or not was_sent(e)
+            else:
+                if result.status_code not in RETRY_STATUSES:
+                    self.__record_outcome(True)
+                    return result, content
+                can_retry = idempotent
+
+            if not can_retry or attempt == self.max_retries:
+                # the retries of a request count as one failure
+                self.__record_outcome(False)
+                if error is not None:
+                    raise error
+                return result, content
+
+            time.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt)))
+            attempt += 1
+            metrics.retries = attempt
+
+    def __attempt(self, method: str, url: str, metrics: RequestMetrics, **kwargs) -> tuple[Response, bytes]:
+        result = self.__open(method, url, metrics, **kwargs)
+        start = time.perf_counter()
+        try:
+            return result, result.content
+        finally:
+            metrics.download += time.perf_counter() - start
+
+    def __open(self, method: str, url: str, metrics: RequestMetrics, **kwargs) -> Response:
+        """
+        Sends the request and returns once the headers of the response arrived, its body isn't read
+        """
+        reset_connect_time()
+        start = time.perf_counter()
+        try:
             result = self._request_type_table[method](
-                f"{self.prefix}{endpoint}", params=params, headers=headers, data=data
+                url, timeout=(self.connect_timeout, self.read_timeout), stream=True, **kwargs
             )
+        finally:
+            connect = take_connect_time()
+            metrics.connect += connect
+            metrics.server += time.perf_counter() - start - connect
+        metrics.status_code = result.status_code
+        return result
+
+    def __record_outcome(self, success: bool):
+        if self.circuit_breaker is None:
+            return
+        if success:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
 
-        if 500 <= result.status_code <= 599:
-            raise Exception(f"{result.status_code} - {result.reason}")
+    def __cache_key(self, endpoint: str, params: Optional[dict[str, Any]]) -> str:
+        # the responses depend on who is logged in
+        auth = hashlib.sha1(self.session.headers.get("Authorization", "").encode()).hexdigest()
+        return f"{auth}:{self.prefix}{endpoint}?{urlencode(sorted((params or {}).items()))}"
 
-        result_data = result.json()
+    def __cache_response(self, key: str, result: Response, content: bytes) -> Optional[CacheEntry]:
+        etag, last_modified = result.headers.get("ETag"), result.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return None
 
-        if 400 <= result.status_code <= 499:
-            raise Exception(
-                f"Error in request:\n\tstatus code: {result.status_code}\n\tDetail: {result_data['detail']}"
-            )
+        entry = CacheEntry(content, etag, last_modified)
+        self.response_cache.put(key, entry)
+        return entry
 
-        return result_data
+
+def was_sent(error: requests.RequestException) -> bool:
+    """
+    False when the connection couldn't even be opened, so the server surely didn't get the request
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    # urllib3 wraps the error of the connection in a MaxRetryError
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return not isinstance(reason, ConnectTimeoutError)
+
+
+def unavailable(error: requests.RequestException) -> ServerUnavailable:
+    if isinstance(error, requests.Timeout):
+        unavailable_error = RequestTimeout("The server took too long to answer")
+    else:
+        unavailable_error = ServerUnavailable("The server can't be reached")
+    unavailable_error.__cause__ = error
+    return unavailable_error
+
+
+def copy_result(result: Any) -> Any:
+    # the cached lists are shared, each caller gets its own copy
+    return list(result) if isinstance(result, list) else result
 
 
 class TimAPI(RequestResult):
     # request = Request("http://127.0.0.1:8000", auth="access_token", auth_type="Bearer")
 
-    def __init__(self) -> None:
-        self.request = Request()
+    def __init__(self, request: Optional[Request] = None, decoder: Optional[Decoder] = None) -> None:
+        self.request = request if request is not None else Request()
+        self.decoder = decoder if decoder is not None else Decoder()
         self.access_token: Optional[str] = None
+        # whether the server has the "/items/batch" endpoint, unknown until it's tried
+        self.batch_supported: Optional[bool] = None
 
     def __repr__(self) -> str:
         return f"TimAPI({self.access_token=}, {self.status_code=}, {self.data=})"
 
+    def __parser(self, model: type[Model]) -> Callable[[dict[str, Any]], Model]:
+        return partial(self.decoder.parse, model)
+
+    def __list_parser(self, model: type[Model]) -> Callable[[list[dict[str, Any]]], list[Model]]:
+        return partial(self.decoder.parse_list, model)
+
     def login(self, *, username: str, password: str):
         data = self.request.request(
-            "POST", "/login/access-token", request_model=Login(username=username, password=password)
+            "POST", "/login/access-token", request_model=Login(username=username, password=password), idempotent=True
         )
         self.token_type: str = data["token_type"]
         self.access_token = data["access_token"]
+        self.request.set_auth(self.token_type, self.access_token)
 
-    def items(self, skip: int = 0, limit: int = 100) -> list[Item]:
-        data = self.request.request(
-            "GET",
-            "/items/",
-            params={"skip": skip, "limit": limit},
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
+    def items(self, skip: int = 0, limit: int = 100, query: Optional[ItemQuery] = None) -> list[Item]:
+        """
+        A page of the items, sorted and filtered on the server by `query`. The pages of a query are
+        consistent with `query.apply` over every item.
+        """
+        params = {"skip": skip, "limit": limit, **(query.params() if query is not None else {})}
+        # the items parsed are kept by the caller, only the body of the page is cached
+        return self.request.request(
+            "GET", "/items/", params=params, parse=self.__list_parser(Item), cache=True, keep_parsed=False
         )
-        return parse_obj_as(list[Item], data)
+
+    def iter_items(self, page_size: int = 1000, prefetch: bool = True) -> Iterator[Item]:
+        """
+        Streams every item page by page, see `iter_pages`. The pages aren't kept in the `response_cache`,
+        so the memory used doesn't grow with the inventory.
+        """
+        def fetch(skip: int, limit: int) -> list[Item]:
+            return self.request.request(
+                "GET", "/items/", params={"skip": skip, "limit": limit}, parse=self.__list_parser(Item)
+            )
+
+        for page in iter_pages(fetch, page_size, prefetch):
+            yield from page
 
     def get_item(self, title: str) -> Item:
-        data = self.request.request(
-            "GET",
-            f"/items/{title}",
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return Item(**data)
+        return self.request.request("GET", f"/items/{title}", parse=self.__parser(Item))
 
     def update_item(self, id: int, item: ItemUpdate) -> Item:
-        data = self.request.request(
-            "PUT",
-            f"/items/update/{id}",
-            request_model=item,
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return Item(**data)
+        return self.request.request("PUT", f"/items/update/{id}", request_model=item, parse=self.__parser(Item))
 
     def delete_item(self, id: int) -> Item:
-        data = self.request.request("DELETE", f"/items/delete/{id}",
-                                    headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-                                    )
-        return Item(**data)
+        return self.request.request("DELETE", f"/items/delete/{id}", parse=self.__parser(Item))
 
     def withdraw_item(self, id: int, quantity: int) -> Item:
-        data = self.request.request(
+        # a GET, but sending it twice withdraws twice
+        return self.request.request(
             "GET",
             f"/items/withdraw/{id}",
             params={"quantity": quantity},
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
+            parse=self.__parser(Item),
+            idempotent=False,
         )
-        return Item(**data)
 
     def create_item(self, user_id: int, item: ItemCreate) -> Item:
-        data = self.request.request(
-            "POST",
-            f"/users/{user_id}/items/",
-            request_model=item,
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return Item(**data)
+        return self.request.request("POST", f"/users/{user_id}/items/", request_model=item, parse=self.__parser(Item))
+
+    def batch_items(self, operations: list[ItemOperation]) -> list[ItemOperationResult]:
+        """
+        Updates `batch_supported` from the answer of the server
+        """
+        try:
+            results = self.request.request(
+                "POST",
+                "/items/batch",
+                request_model=ItemBatch(operations=operations),
+                parse=self.__list_parser(ItemOperationResult),
+            )
+        except RequestError as e:
+            if e.status_code in BATCH_UNSUPPORTED_STATUSES:
+                self.batch_supported = False
+            raise
+        self.batch_supported = True
+        return results
 
     def get_user(self, id: int) -> User:
-        data = self.request.request("GET", f"/users/{id}")
-        return User(**data)
+        return self.request.request("GET", f"/users/{id}", parse=self.__parser(User))
 
     def create_user(self, user: UserCreate) -> User:
-        data = self.request.request("POST", "/users/register", request_model=user)
-        return User(**data)
+        return self.request.request("POST", "/users/register", request_model=user, parse=self.__parser(User))
 
     def get_user_me(self) -> User:
-        data = self.request.request(
-            "GET",
-            "/users/me",
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return User(**data)
+        return self.request.request("GET", "/users/me", parse=self.__parser(User), cache=True)
 
     def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
-        data = self.request.request(
+        return self.request.request(
             "GET",
             "/users/",
             params={"skip": skip, "limit": limit},
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
+            parse=self.__list_parser(User),
+            cache=True,
+            keep_parsed=False,
         )
-        return parse_obj_as(list[User], data)
+
+    def iter_users(self, page_size: int = 100, prefetch: bool = True) -> Iterator[User]:
+        """
+        Streams every user page by page, like `iter_items`
+        """
+        def fetch(skip: int, limit: int) -> list[User]:
+            return self.request.request(
+                "GET", "/users/", params={"skip": skip, "limit": limit}, parse=self.__list_parser(User)
+            )
+
+        for page in iter_pages(fetch, page_size, prefetch):
+            yield from page
 
     def update_user(self, id: int, user: UserUpdate) -> User:
-        data = self.request.request(
-            "PUT",
-            f"/users/update/{id}",
-            request_model=user,
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return User(**data)
+        return self.request.request("PUT", f"/users/update/{id}", request_model=user, parse=self.__parser(User))
 
     def update_user_me(self, user: UserUpdate) -> User:
-        data = self.request.request(
-            "PUT",
-            "/users/update/me",
-            request_model=user,
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return User(**data)
+        return self.request.request("PUT", "/users/update/me", request_model=user, parse=self.__parser(User))
 
     def delete_user(self, id: int) -> User:
-        data = self.request.request(
-            "DELETE",
-            f"/users/delete/{id}",
-            headers={"Authorization": f"{self.token_type.capitalize()} {self.access_token}"},
-        )
-        return User(**data)
+        return self.request.request("DELETE", f"/users/delete/{id}", parse=self.__parser(User))
+
+    def changes(self, since: Optional[int] = None) -> Changes:
+        """
+        The items and users changed or deleted after the revision `since`, as they are now, and the
+        revision they are up to, to ask for the next changes since it. Without `since` only the current
+        revision. Raises `EventsLost` when the server doesn't know what changed since then anymore.
+        """
+        params = {"since": since} if since is not None else {}
+        try:
+            return self.request.request("GET", "/changes/", params=params, parse=self.__parser(Changes), cache=True)
+        except RequestError as e:
+            if e.status_code == 410:
+                raise EventsLost(str(e), e.status_code) from e
+            raise
+
+    def events(self, after: Optional[int] = None, timeout: float = 25.0) -> ChangeEvents:
+        """
+        The changes made on the server after the revision `after` (by default the current one), waiting
+        up to `timeout` seconds for one, which must be shorter than the `read_timeout`. `EventStream`
+        follows them as they are pushed. Raises `EventsLost` when the server doesn't have them anymore.
+        """
+        params = {"timeout": timeout, **({"after": after} if after is not None else {})}
+        try:
+            return self.request.request("GET", "/events/", params=params, parse=self.__parser(ChangeEvents))
+        except RequestError as e:
+            if e.status_code == 410:
+                raise EventsLost(str(e), e.status_code) from e
+            raise
@@ -0,0 +1,181 @@
+from collections import Counter
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional, Sequence
+
+from .columns import PRICE_SCALE, ItemColumns, fixed_point_price
+from .models import Item
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# upper bounds (exclusive) of the buckets of `InventorySummary.quantity_buckets`, the last one is open
+QUANTITY_BUCKETS = (1, 5, 10, 50, 100, 500)
+PERCENTILES = (50, 90, 99)
+INT64_MAX = 2**63 - 1
+
+
+@dataclass
+class InventorySummary:
+    item_count: int
+    total_quantity: int
+    total_value: Decimal
+    reorder_threshold: int
+    # how many items have less than `reorder_threshold` units
+    below_threshold: int
+    # owner id -> value of the items, the most valuable first
+    value_by_owner: dict[int, Decimal]
+    # percent -> quantity, nearest rank
+    quantity_percentiles: dict[int, int]
+    # (lowest quantity, highest quantity or None, number of items)
+    quantity_buckets: list[tuple[int, Optional[int], int]]
+
+
+def _grouped_sums(keys: Sequence[int], values: Sequence[int]) -> dict[int, int]:
+    """
+    The sum of `values` per key, vectorized when they're a NumPy array
+    """
+    if np is None or not isinstance(values, np.ndarray):
+        sums: Counter[int] = Counter()
+        for key, value in zip(keys, values):
+            sums[key] += value
+        return dict(sums)
+
+    keys, values = np.asarray(keys, dtype=np.int64), np.asarray(values, dtype=np.int64)
+    if not len(keys):
+        return {}
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return dict(zip(keys[starts].tolist(), np.add.reduceat(values, starts).tolist()))
+
+
+def _sums_fit_int64(prices: Sequence[int], quantities: Sequence[int]) -> bool:
+    """
+    Whether any sum of the products of `prices` and `quantities` fits in an int64, NumPy would wrap around
+    """
+    if not len(prices):
+        return True
+    largest_price = max(abs(max(prices)), abs(min(prices)))
+    largest_quantity = max(abs(max(quantities)), abs(min(quantities)))
+    return largest_price * largest_quantity * len(prices) <= INT64_MAX
+
+
+class InventoryStats:
+    """
+    Stock value, value per owner and distribution of the quantities of the items. They're computed once
+    over the columns of every item, vectorized with NumPy when it's installed, then kept up to date by
+    adding the difference each added, updated or removed item makes, so reading them costs nothing.
+    The values are summed exactly, in fixed-point, with Python integers when an int64 could overflow.
+    """
+
+    def __init__(self, columns: Optional[ItemColumns] = None, reorder_threshold: int = 5):
+        self.reorder_threshold = reorder_threshold
+        self.item_count = 0
+        self.total_quantity = 0
+        self._total_value = 0
+        self._value_by_owner: Counter[int] = Counter()
+        # quantity -> how many items have it
+        self._quantities: Counter[int] = Counter()
+
+        if columns is not None:
+            self.__add_columns(columns)
+
+    def __add_columns(self, columns: ItemColumns):
+        owner_ids, quantities, prices = (columns.column(field) for field in ("owner_id", "quantity", "price"))
+        if np is None or not _sums_fit_int64(prices, quantities):
+            values = [price * quantity for price, quantity in zip(prices, quantities)]
+            self.total_quantity += sum(quantities)
+            self._total_value += sum(values)
+            self._quantities.update(quantities)
+        else:
+            # copies, the columns can't grow while a view of them exists
+            owner_ids, quantities = np.array(owner_ids, dtype=np.int64), np.array(quantities, dtype=np.int64)
+            values = np.array(prices, dtype=np.int64) * quantities
+            self.total_quantity += int(quantities.sum())
+            self._total_value += int(values.sum())
+            distinct_quantities, counts = np.unique(quantities, return_counts=True)
+            self._quantities.update(dict(zip(distinct_quantities.tolist(), counts.tolist())))
+
+        self.item_count += len(columns)
+        self._value_by_owner.update(_grouped_sums(owner_ids, values))
+
+    def __add(self, item: Item, sign: int):
+        value = fixed_point_price(item.price) * item.quantity
+        self.item_count += sign
+        self.total_quantity += sign * item.quantity
+        self._total_value += sign * value
+        self._value_by_owner[item.owner_id] += sign * value
+        self._quantities[item.quantity] += sign
+        for counter, key in ((self._value_by_owner, item.owner_id), (self._quantities, item.quantity)):
+            if not counter[key]:
+                del counter[key]
+
+    def add_items(self, items: Iterable[Item]):
+        for item in items:
+            self.__add(item, 1)
+
+    def change_item(self, old_item: Item, new_item: Optional[Item]):
+        """
+        Replaces `old_item` by `new_item`, or removes it when `new_item` is `None`
+        """
+        self.__add(old_item, -1)
+        if new_item is not None:
+            self.__add(new_item, 1)
+
+    @property
+    def total_value(self) -> Decimal:
+        return Decimal(self._total_value) / PRICE_SCALE
+
+    def below_threshold(self) -> int:
+        return sum(count for quantity, count in self._quantities.items() if quantity < self.reorder_threshold)
+
+    def percentile(self, percent: float) -> int:
+        """
+        The quantity that `percent`% of the items have at most, 0 without items
+        """
+        rank = max(1, -(-self.item_count * percent // 100))
+        seen = 0
+        for quantity in sorted(self._quantities):
+            seen += self._quantities[quantity]
+            if seen >= rank:
+                return quantity
+        return 0
+
+    def quantity_buckets(self) -> list[tuple[int, Optional[int], int]]:
+        bounds = (0, *QUANTITY_BUCKETS)
+        counts = [0] * len(bounds)
+        for quantity, count in self._quantities.items():
+            counts[sum(quantity >= bound for bound in QUANTITY_BUCKETS)] += count
+        highest = [bound - 1 for bound in QUANTITY_BUCKETS] + [None]
+        return list(zip(bounds, highest, counts))
+
+    def summary(self) -> InventorySummary:
+        return InventorySummary(
+            item_count=self.item_count,
+            total_quantity=self.total_quantity,
+            total_value=self.total_value,
+            reorder_threshold=self.reorder_threshold,
+            below_threshold=self.below_threshold(),
+            value_by_owner={
+                owner_id: Decimal(value) / PRICE_SCALE for owner_id, value in self._value_by_owner.most_common()
+            },
+            quantity_percentiles={percent: self.percentile(percent) for percent in PERCENTILES},
+            quantity_buckets=self.quantity_buckets(),
+        )
+
+
+def low_stock_rows(columns: ItemColumns, threshold: int, limit: int = 100) -> list[int]:
+    """
+    The rows of the items with less than `threshold` units, the lowest quantity first
+    """
+    quantities = columns.column("quantity")
+    if np is None:
+        rows = [row for row, quantity in enumerate(quantities) if quantity < threshold]
+        return sorted(rows, key=quantities.__getitem__)[:limit]
+
+    quantities = np.array(quantities, dtype=np.int64)
+    rows = np.flatnonzero(quantities < threshold)
+    return rows[np.argsort(quantities[rows], kind="stable")[:limit]].tolist()
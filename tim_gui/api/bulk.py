@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from . import BATCH_UNSUPPORTED_STATUSES, RequestError, TimAPI
+from .models import Item, ItemOperation, ItemOperationResult, ItemUpdate
+
+MAX_CONCURRENCY = 8
+BATCH_SIZE = 500
+
+
+@dataclass
+class BulkResult:
+    # results of the operations that were run, in the order of the operations
+    results: list[ItemOperationResult]
+    cancelled: int = 0
+
+    def succeeded(self) -> list[ItemOperationResult]:
+        return [result for result in self.results if result.detail is None]
+
+    def failed(self) -> list[ItemOperationResult]:
+        return [result for result in self.results if result.detail is not None]
+
+
+def apply_operation(api: TimAPI, operation: ItemOperation) -> Item:
+    if operation.op == "delete":
+        return api.delete_item(operation.id)
+    if operation.op == "update":
+        return api.update_item(operation.id, ItemUpdate(quantity=operation.quantity))
+    return api.withdraw_item(operation.id, operation.quantity)
+
+
+class _Progress:
+    def __init__(self, total: int, callback: Optional[Callable[[int, int], None]]):
+        self.total = total
+        self.done = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def advance(self, count: int):
+        with self._lock:
+            self.done += count
+            done = self.done
+        if self._callback is not None:
+            self._callback(done, self.total)
+
+
+def run_item_operations(
+    api: TimAPI,
+    operations: list[ItemOperation],
+    max_concurrency: int = MAX_CONCURRENCY,
+    batch_size: int = BATCH_SIZE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> BulkResult:
+    """
+    Runs `operations` with at most `max_concurrency` requests at a time. They are sent `batch_size` at
+    a time unless the server doesn't have the batch endpoint (`api.batch_supported`), the operations of a
+    batch it turns down are then made one request each. The errors are collected per item instead of
+    stopping the whole run, `on_progress(done, total)` is called from the worker threads and setting
+    `cancelled` skips the operations not started yet.
+    """
+    cancelled = cancelled if cancelled is not None else threading.Event()
+    progress = _Progress(len(operations), on_progress)
+
+    def run_batch(batch: list[ItemOperation]) -> list[ItemOperationResult]:
+        if cancelled.is_set():
+            return []
+        try:
+            results = api.batch_items(batch)
+        except Exception as e:
+            if isinstance(e, RequestError) and e.status_code in BATCH_UNSUPPORTED_STATUSES:
+                # the server has no batch endpoint, nothing was applied
+                return [result for result in map(run_one, batch) if result is not None]
+            results = [ItemOperationResult(id=operation.id, detail=str(e)) for operation in batch]
+        progress.advance(len(batch))
+        return results
+
+    def run_one(operation: ItemOperation) -> Optional[ItemOperationResult]:
+        if cancelled.is_set():
+            return None
+        try:
+            result = ItemOperationResult(id=operation.id, item=apply_operation(api, operation))
+        except Exception as e:
+            result = ItemOperationResult(id=operation.id, detail=str(e))
+        progress.advance(1)
+        return result
+
+    batches = [operations[i : i + batch_size] for i in range(0, len(operations), batch_size)]
+    results: list[ItemOperationResult] = []
+    if batches and api.batch_supported is None:
+        # the first batch tells whether the server has the endpoint
+        results.extend(run_batch(batches.pop(0)))
+
+    with ThreadPoolExecutor(max_concurrency) as executor:
+        if api.batch_supported is False:
+            remaining = [operation for batch in batches for operation in batch]
+            results.extend(result for result in executor.map(run_one, remaining) if result is not None)
+        else:
+            results.extend(result for batch in executor.map(run_batch, batches) for result in batch)
+
+    return BulkResult(results, cancelled=len(operations) - len(results))
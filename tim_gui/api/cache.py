@@ -0,0 +1,122 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Union
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # results of parsing the content, by parser, so a 304 doesn't parse it again
+    parsed: dict[Hashable, Any] = field(default_factory=dict, repr=False)
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parser_key(parse: Callable[[Any], Any]) -> Hashable:
+    """
+    Key identifying what `parse` does, equal for two `functools.partial` of the same function and arguments
+    """
+    return getattr(parse, "func", parse), getattr(parse, "args", ())
+
+
+class ResponseCache:
+    """
+    Bodies and validators (ETag/Last-Modified) of the responses, so the requests can be made conditional.
+    Kept in a memory LRU bounded by `max_bytes` and, when `directory` is given, on disk bounded by
+    `max_disk_bytes`. The keys are opaque strings built by `Request`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        directory: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 128 * 1024 * 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self.__read(key)
+        if entry is not None:
+            self.__put_in_memory(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry):
+        self.__put_in_memory(key, entry)
+        self.__write(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.response"):
+                path.unlink(missing_ok=True)
+
+    def __put_in_memory(self, key: str, entry: CacheEntry):
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._bytes -= len(old_entry.content)
+
+            self._entries[key] = entry
+            self._bytes += len(entry.content)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.response"
+
+    def __read(self, key: str) -> Optional[CacheEntry]:
+        if self.directory is None:
+            return None
+
+        # the validators as a JSON line followed by the body
+        try:
+            header, content = self.__path(key).read_bytes().split(b"\n", 1)
+            validators = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(content, validators["etag"], validators["last_modified"])
+
+    def __write(self, key: str, entry: CacheEntry):
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        header = json.dumps({"etag": entry.etag, "last_modified": entry.last_modified}).encode()
+        self.__path(key).write_bytes(header + b"\n" + entry.content)
+
+        files = sorted(self.directory.glob("*.response"), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in files)
+        while total > self.max_disk_bytes and len(files) > 1:
+            path = files.pop(0)
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
@@ -0,0 +1,58 @@
+import threading
+import time
+
+from .errors import CircuitOpen
+
+
+class CircuitBreaker:
+    """
+    Fails the requests fast while the server is down. After `failure_threshold` consecutive failures
+    the circuit opens and `before_request` raises `CircuitOpen` for `reset_timeout` seconds; then a
+    single trial request is let through (half-open), closing the circuit if it succeeds and opening it
+    again if it fails. The retries of a request count as a single failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_request(self):
+        with self._lock:
+            if self._state == CircuitBreaker.CLOSED:
+                return
+
+            retry_after = self._opened_at + self.reset_timeout - time.monotonic()
+            if retry_after > 0:
+                raise CircuitOpen(retry_after)
+            # a single trial request, another one goes through if it hasn't finished in `reset_timeout`
+            self._state = CircuitBreaker.HALF_OPEN
+            self._opened_at = time.monotonic()
+
+    def record_success(self):
+        with self._lock:
+            self._state = CircuitBreaker.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitBreaker.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CircuitBreaker.OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self):
+        self.record_success()
@@ -0,0 +1,224 @@
+import sys
+from array import array
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from .decoding import construct
+from .models import Item
+from .query import ItemQuery
+
+# the prices are kept as integers of 1 / PRICE_SCALE
+PRICE_SCALE = 100
+
+
+def fixed_point_price(price: Decimal) -> int:
+    """
+    The price in 1 / PRICE_SCALE, rounded, 0 if it doesn't fit 64 bits
+    """
+    price = (price * PRICE_SCALE).to_integral_value()
+    return int(price) if price.is_finite() and -(2**63) <= price < 2**63 else 0
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    return None if text is None else sys.intern(text)
+
+
+class ItemColumns:
+    """
+    Rows of items kept as columns: the ids, owner ids, quantities and prices (in fixed-point) in integer
+    arrays and the strings in lists, the image paths interned as they are often shared. A row takes a
+    few times less memory than an `Item`, which is only built by `item` when needed.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._ids = array("q")
+        self._owner_ids = array("q")
+        self._quantities = array("q")
+        self._prices = array("q")
+        # id -> price of the few items whose price doesn't fit the fixed-point, rounded in `_prices`
+        self._exact_prices: dict[int, Decimal] = {}
+        self._titles: list[str] = []
+        self._bar_codes: list[str] = []
+        self._descriptions: list[Optional[str]] = []
+        self._image_paths: list[Optional[str]] = []
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __columns(self) -> tuple:
+        return (
+            self._ids,
+            self._owner_ids,
+            self._quantities,
+            self._prices,
+            self._titles,
+            self._bar_codes,
+            self._descriptions,
+            self._image_paths,
+        )
+
+    def __values(self, item: Item) -> tuple:
+        price = fixed_point_price(item.price)
+        if price == item.price * PRICE_SCALE:
+            self._exact_prices.pop(item.id, None)
+        else:
+            self._exact_prices[item.id] = item.price
+        return (
+            item.id,
+            item.owner_id,
+            item.quantity,
+            price,
+            item.title,
+            item.bar_code,
+            item.description,
+            _intern(item.image_path),
+        )
+
+    # Reads
+
+    def id(self, row: int) -> int:
+        return self._ids[row]
+
+    def ids(self) -> array:
+        return self._ids
+
+    def column(self, field: str) -> array:
+        """
+        The integer column of "id", "owner_id", "quantity" or "price", the prices being rounded to
+        1 / PRICE_SCALE
+        """
+        columns = {"id": self._ids, "owner_id": self._owner_ids, "quantity": self._quantities, "price": self._prices}
+        return columns[field]
+
+    def title(self, row: int) -> str:
+        return self._titles[row]
+
+    def bar_code(self, row: int) -> str:
+        return self._bar_codes[row]
+
+    def description(self, row: int) -> Optional[str]:
+        return self._descriptions[row]
+
+    def price(self, row: int) -> Decimal:
+        price = self._exact_prices.get(self._ids[row])
+        return price if price is not None else Decimal(self._prices[row]) / PRICE_SCALE
+
+    def item(self, row: int) -> Item:
+        return construct(
+            Item,
+            {
+                "id": self._ids[row],
+                "owner_id": self._owner_ids[row],
+                "title": self._titles[row],
+                "bar_code": self._bar_codes[row],
+                "description": self._descriptions[row],
+                "price": self.price(row),
+                "image_path": self._image_paths[row],
+                "quantity": self._quantities[row],
+            },
+        )
+
+    def same_item(self, row: int, item: Item) -> bool:
+        """
+        Whether the row holds `item`, without building an `Item` out of it
+        """
+        return (
+            self._ids[row] == item.id
+            and self._owner_ids[row] == item.owner_id
+            and self._quantities[row] == item.quantity
+            and self._titles[row] == item.title
+            and self._bar_codes[row] == item.bar_code
+            and self._descriptions[row] == item.description
+            and self._image_paths[row] == item.image_path
+            and self.price(row) == item.price
+        )
+
+    def sort_key(self, field: str, row: int) -> Any:
+        """
+        Orders the rows like `query.SORT_KEYS` orders the items
+        """
+        if field == "price":
+            price = self._exact_prices.get(self._ids[row])
+            return self._prices[row] if price is None else price * PRICE_SCALE
+        if field == "quantity":
+            return self._quantities[row]
+        if field == "title":
+            return self._titles[row].casefold()
+        if field == "bar_code":
+            return self._bar_codes[row]
+        raise ValueError(f'Items can\'t be sorted by "{field}"')
+
+    def sort_keys(self, field: str) -> list[Any]:
+        if field == "price" and not self._exact_prices:
+            return self._prices.tolist()
+        if field == "quantity":
+            return self._quantities.tolist()
+        if field == "title":
+            return [title.casefold() for title in self._titles]
+        if field == "bar_code":
+            return list(self._bar_codes)
+        return [self.sort_key(field, row) for row in range(len(self))]
+
+    def matching_rows(self, query: ItemQuery, rows: Iterable[int]) -> list[int]:
+        """
+        The rows of `rows` holding an item matched by `query`, tested on the columns
+        """
+        rows = list(rows)
+        quantities, owner_ids = self._quantities, self._owner_ids
+        price = self._prices.__getitem__ if not self._exact_prices else lambda row: self.sort_key("price", row)
+        if query.owner_id is not None:
+            rows = [row for row in rows if owner_ids[row] == query.owner_id]
+        if query.min_quantity is not None:
+            rows = [row for row in rows if quantities[row] >= query.min_quantity]
+        if query.max_quantity is not None:
+            rows = [row for row in rows if quantities[row] <= query.max_quantity]
+        if query.min_price is not None:
+            min_price = query.min_price * PRICE_SCALE
+            rows = [row for row in rows if price(row) >= min_price]
+        if query.max_price is not None:
+            max_price = query.max_price * PRICE_SCALE
+            rows = [row for row in rows if price(row) <= max_price]
+        return rows
+
+    # Changes
+
+    def append(self, item: Item):
+        for column, value in zip(self.__columns(), self.__values(item)):
+            column.append(value)
+
+    def extend(self, items: Iterable[Item]):
+        for item in items:
+            self.append(item)
+
+    def insert(self, row: int, item: Item):
+        for column, value in zip(self.__columns(), self.__values(item)):
+            column.insert(row, value)
+
+    def set(self, row: int, item: Item):
+        if self._ids[row] != item.id:
+            self._exact_prices.pop(self._ids[row], None)
+        for column, value in zip(self.__columns(), self.__values(item)):
+            column[row] = value
+
+    def delete(self, row: int):
+        self._exact_prices.pop(self._ids[row], None)
+        for column in self.__columns():
+            del column[row]
+
+    def swap_delete(self, row: int) -> Optional[int]:
+        """
+        Deletes the row by moving the last one in its place, returns the id of the moved item if any
+        """
+        self._exact_prices.pop(self._ids[row], None)
+        last = len(self) - 1
+        for column in self.__columns():
+            column[row] = column[last]
+            del column[last]
+        return self._ids[row] if row < last else None
+
+    def clear(self):
+        for column in self.__columns():
+            del column[:]
+        self._exact_prices.clear()
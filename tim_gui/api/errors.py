@@ -0,0 +1,43 @@
+from typing import Optional
+
+
+class RequestError(Exception):
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ServerError(RequestError):
+    """
+    The server failed to handle the request, a 5xx response
+    """
+
+
+class ServerUnavailable(RequestError):
+    """
+    The server couldn't be reached, the request may not have been sent at all
+    """
+
+
+class RequestTimeout(ServerUnavailable):
+    """
+    The server didn't accept the connection or didn't answer within the timeouts of `Request`
+    """
+
+
+class EventsLost(RequestError):
+    """
+    The server doesn't keep the changes since the revision asked for anymore, everything has to be
+    fetched again
+    """
+
+
+class CircuitOpen(ServerUnavailable):
+    """
+    Raised without sending the request while the server is considered down, see `CircuitBreaker`
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"The server is unavailable, retrying in {retry_after:.0f}s")
+        # seconds until a request is let through again
+        self.retry_after = retry_after
@@ -0,0 +1,150 @@
+import random
+import socket
+import threading
+from typing import Iterable, Iterator, Optional
+
+from requests.models import Response
+
+from . import NETWORK_ERRORS, TimAPI, unavailable
+from .decoding import loads
+from .errors import EventsLost, RequestError, ServerError
+from .models import ChangeEvent, ChangeEvents
+
+
+def parse_sse(lines: Iterable[str]) -> Iterator[tuple[str, Optional[str], str]]:
+    """
+    The (event, id, data) of each Server-Sent Event in the lines of a "text/event-stream". The id is the
+    last one sent, it's kept by the next events.
+    """
+    event, id, data = "message", None, []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, id, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            # a comment, sent to keep the connection open
+            continue
+
+        name, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+        elif name == "id":
+            id = value
+
+
+class EventStream:
+    """
+    Follows the changes made on the server after `revision`. The server pushes them as Server-Sent Events
+    on "GET /events/", or when it doesn't stream they are long-polled from it with `TimAPI.events`. Both
+    go through the `Request` of `api`, and every reconnection waits for its jittered backoff, growing
+    while the connections end without a change, so a proxy closing the idle ones isn't hammered.
+    """
+
+    def __init__(self, api: TimAPI, revision: Optional[int] = None, poll_timeout: float = 25.0):
+        self.api = api
+        # of the last change received, `None` follows the changes from the current revision on
+        self.revision = revision
+        self.poll_timeout = poll_timeout
+        # whether the server streams the events, unknown until it's tried
+        self.streaming: Optional[bool] = None
+
+        self._closed = threading.Event()
+        self._response: Optional[Response] = None
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        """
+        Yields the changes as they come, until `close` is called. Raises `EventsLost` when the server
+        doesn't have the changes since `revision` anymore, and the errors of `Request.request`, a 404
+        meaning the server has no "/events/". Iterating again goes on from `revision`.
+        """
+        attempt = 0
+        while not self._closed.is_set():
+            received = False
+            for change in self.__poll() if self.streaming is False else self.__stream():
+                received = True
+                yield change
+
+            attempt = 0 if received else attempt + 1
+            request = self.api.request
+            self.wait_closed(random.uniform(0, min(request.max_backoff, request.backoff * 2**attempt)))
+
+    def close(self):
+        """
+        Ends the iteration, from any thread
+        """
+        self._closed.set()
+        response = self._response
+        # wakes up the thread reading the stream, the connection has no public way to do it
+        connection = getattr(response.raw, "connection", None) if response is not None else None
+        sock = getattr(connection, "sock", None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def wait_closed(self, timeout: float) -> bool:
+        """
+        Waits up to `timeout` seconds for `close`, returns whether it was called
+        """
+        return self._closed.wait(timeout)
+
+    def __poll(self) -> Iterator[ChangeEvent]:
+        changes = self.api.events(self.revision, self.poll_timeout)
+        yield from self.__changes(changes)
+
+    def __changes(self, changes: ChangeEvents) -> Iterator[ChangeEvent]:
+        for event in changes.events:
+            self.revision = event.revision
+            yield event
+        self.revision = changes.revision
+
+    def __stream(self) -> Iterator[ChangeEvent]:
+        # the timeout is for a server that doesn't stream and answers like a long poll
+        params = {"timeout": self.poll_timeout, **({"after": self.revision} if self.revision is not None else {})}
+        with self.api.request.stream("/events/", params=params, headers={"Accept": "text/event-stream"}) as response:
+            self._response = response
+            try:
+                yield from self.__read(response)
+            except NETWORK_ERRORS as e:
+                if not self._closed.is_set():
+                    raise unavailable(e)
+            finally:
+                self._response = None
+
+    def __read(self, response: Response) -> Iterator[ChangeEvent]:
+        if response.status_code == 410:
+            raise EventsLost("The changes since the last one received are gone", response.status_code)
+        if response.status_code >= 500:
+            raise ServerError(f"{response.status_code} - {response.reason}", response.status_code)
+        if response.status_code >= 400:
+            raise RequestError(
+                f"Error in request:\n\tstatus code: {response.status_code}\n\tDetail: {response.reason}",
+                response.status_code,
+            )
+
+        if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+            # a server that doesn't stream answers like a long poll
+            self.streaming = False
+            yield from self.__changes(self.api.decoder.parse(ChangeEvents, loads(response.content)))
+            return
+
+        self.streaming = True
+        response.encoding = "utf-8"
+        # a chunk at a time, waiting for a full buffer would hold the events back
+        chunk_size = None if response.headers.get("Transfer-Encoding") == "chunked" else 1
+        for event, id, data in parse_sse(response.iter_lines(chunk_size, decode_unicode=True)):
+            if event == "revision":
+                self.revision = int(id)
+            elif event == "change":
+                change = self.api.decoder.parse(ChangeEvent, loads(data))
+                self.revision = change.revision
+                yield change
@@ -0,0 +1,90 @@
+import csv
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TextIO, Union
+
+from . import TimAPI
+from .models import Item
+
+EXPORT_FORMATS = ("csv", "jsonl")
+ITEM_FIELDS = ("id", "owner_id", "title", "bar_code", "description", "price", "image_path", "quantity")
+# how many items are written between two `on_progress` calls
+PROGRESS_INTERVAL = 1000
+
+
+def export_format(path: Union[str, Path]) -> str:
+    """
+    The format of an export file from its extension
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f'Unknown export format "{suffix}", use ".csv" or ".jsonl"')
+
+
+def item_row(item: Item) -> list[Any]:
+    # the price as text, exactly as it's stored
+    return [str(item.price) if name == "price" else getattr(item, name) for name in ITEM_FIELDS]
+
+
+def write_items(
+    items: Iterable[Item],
+    file: TextIO,
+    format: str,
+    on_progress: Optional[Callable[[int], Any]] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> int:
+    """
+    Writes the items to `file` one by one as they come, returns how many were written. Setting
+    `cancelled` stops at the next item.
+    """
+    if format == "csv":
+        writer = csv.writer(file)
+        writer.writerow(ITEM_FIELDS)
+        write_row = writer.writerow
+    elif format == "jsonl":
+        write_row = lambda row: file.write(json.dumps(dict(zip(ITEM_FIELDS, row))) + "\n")
+    else:
+        raise ValueError(f'Unknown export format "{format}"')
+
+    count = 0
+    for item in items:
+        if cancelled is not None and cancelled.is_set():
+            break
+        write_row(item_row(item))
+        count += 1
+        if on_progress is not None and count % PROGRESS_INTERVAL == 0:
+            on_progress(count)
+    return count
+
+
+def export_items(
+    api: TimAPI,
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    page_size: int = 1000,
+    on_progress: Optional[Callable[[int], Any]] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> int:
+    """
+    Streams the whole inventory into `path`, in constant memory. The file is written next to `path` and
+    only replaces it once complete, nothing is left behind if the export fails or is cancelled.
+    """
+    path = Path(path)
+    format = format or export_format(path)
+    partial_path = path.with_name(f"{path.name}.part")
+    try:
+        with open(partial_path, "w", newline="", encoding="utf-8") as file:
+            count = write_items(api.iter_items(page_size), file, format, on_progress, cancelled)
+        if cancelled is not None and cancelled.is_set():
+            partial_path.unlink()
+        else:
+            os.replace(partial_path, path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    return count
@@ -0,0 +1,186 @@
+import json
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Protocol, Union
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ("connect", "server", "download", "decode", "validation", "total")
+
+_connect_time = threading.local()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Measurements of a single request, the phases are in seconds. `connect` is the time spent opening
+    a new connection (0 when one was reused), `server` the time until the response headers arrived,
+    `download` reading the body, `decode` parsing the JSON and `validation` building the models. The
+    phases of the network add up over the `retries`.
+    """
+
+    method: str
+    endpoint: str
+    status_code: Optional[int] = None
+    connect: float = 0.0
+    server: float = 0.0
+    download: float = 0.0
+    decode: float = 0.0
+    validation: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.server + self.download + self.decode + self.validation
+
+
+def endpoint_name(path: str) -> str:
+    """
+    Groups the paths of the same endpoint together, "/items/update/12" -> "/items/update/{id}"
+    """
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+class MetricsSink(Protocol):
+    def record(self, metrics: RequestMetrics):
+        ...
+
+
+class JsonLinesSink:
+    """
+    Appends every request to `path`, one JSON object per line
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def record(self, metrics: RequestMetrics):
+        line = json.dumps({**asdict(metrics), "total": metrics.total})
+        with self._lock, self.path.open("a") as file:
+            file.write(line + "\n")
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, round(percent / 100 * (len(values) - 1)))]
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0
+    errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_codes: Counter = field(default_factory=Counter)
+    # the last samples of each phase
+    samples: dict[str, deque] = field(default_factory=dict)
+
+    def percentile(self, phase: str, percent: float) -> float:
+        return percentile(list(self.samples.get(phase, ())), percent)
+
+
+class HistogramSink:
+    """
+    Keeps the last `max_samples` measurements of every endpoint in memory to compute percentiles
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._stats: defaultdict[tuple[str, str], EndpointStats] = defaultdict(EndpointStats)
+        self._lock = threading.Lock()
+
+    def record(self, metrics: RequestMetrics):
+        with self._lock:
+            stats = self._stats[(metrics.method, metrics.endpoint)]
+            stats.calls += 1
+            stats.request_bytes += metrics.request_bytes
+            stats.response_bytes += metrics.response_bytes
+            if metrics.error is not None:
+                stats.errors += 1
+            if metrics.status_code is not None:
+                stats.status_codes[metrics.status_code] += 1
+            for phase in PHASES:
+                samples = stats.samples.setdefault(phase, deque(maxlen=self.max_samples))
+                samples.append(getattr(metrics, phase))
+
+    def endpoints(self) -> dict[tuple[str, str], EndpointStats]:
+        """
+        Snapshot of the statistics of every endpoint, keyed by (method, endpoint)
+        """
+        with self._lock:
+            return {
+                key: EndpointStats(
+                    stats.calls,
+                    stats.errors,
+                    stats.request_bytes,
+                    stats.response_bytes,
+                    Counter(stats.status_codes),
+                    {phase: deque(samples) for phase, samples in stats.samples.items()},
+                )
+                for key, stats in self._stats.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def reset_connect_time():
+    _connect_time.value = 0.0
+
+
+def take_connect_time() -> float:
+    """
+    Time spent opening connections in this thread since the last `reset_connect_time`
+    """
+    value = getattr(_connect_time, "value", 0.0)
+    _connect_time.value = 0.0
+    return value
+
+
+class _TimedConnectionMixin:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.value = getattr(_connect_time, "value", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` measuring how long it takes to open its connections, see `take_connect_time`
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from .decoding import construct
+from .models import Item, User
+from .query import ItemQuery
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    owner_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    bar_code TEXT NOT NULL,
+    description TEXT,
+    price TEXT NOT NULL,
+    image_path TEXT,
+    quantity INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_title ON items (title);
+CREATE INDEX IF NOT EXISTS items_bar_code ON items (bar_code);
+CREATE INDEX IF NOT EXISTS items_owner_id ON items (owner_id);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    is_admin INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pending_operations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    -- the item as it was when the operation was queued, to detect conflicting changes on the server
+    base TEXT
+);
+
+CREATE TABLE IF NOT EXISTS logins (
+    username TEXT PRIMARY KEY,
+    salt BLOB NOT NULL,
+    password_hash BLOB NOT NULL,
+    user_id INTEGER
+);
+"""
+
+ITEM_COLUMNS = ("id", "owner_id", "title", "bar_code", "description", "price", "image_path", "quantity")
+USER_COLUMNS = ("id", "name", "email", "is_admin")
+SELECT_ITEMS = f"SELECT {', '.join(ITEM_COLUMNS)} FROM items"
+SELECT_USERS = f"SELECT {', '.join(USER_COLUMNS)} FROM users"
+# `ItemQuery` sort field -> the expression ordering the items like `SORT_KEYS` (sqlite only lowers ASCII letters)
+SORT_COLUMNS = {
+    "price": "CAST(price AS REAL)",
+    "quantity": "quantity",
+    "title": "lower(title)",
+    "bar_code": "bar_code",
+}
+
+PASSWORD_HASH_ITERATIONS = 100_000
+
+
+@dataclass
+class PendingOperation:
+    seq: int
+    kind: str
+    item_id: int
+    payload: dict[str, Any]
+    base: Optional[dict[str, Any]]
+
+
+class LocalMirror:
+    """
+    SQLite copy of the items and users fetched from the server, with the queue of the changes made
+    while offline. Safe to use from any thread.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = path
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __execute(self, query: str, parameters: Iterable[Any] = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, tuple(parameters)).fetchall()
+
+    def __execute_many(self, query: str, rows: Iterable[Iterable[Any]]):
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(query, rows)
+
+    # Items
+
+    def put_items(self, items: Iterable[Item]):
+        self.__execute_many(
+            f"INSERT OR REPLACE INTO items VALUES ({', '.join('?' * len(ITEM_COLUMNS))})",
+            (self.__item_row(item) for item in items),
+        )
+
+    @staticmethod
+    def __item_row(item: Item) -> list[Any]:
+        return [str(item.price) if column == "price" else getattr(item, column) for column in ITEM_COLUMNS]
+
+    def put_item(self, item: Item):
+        self.put_items((item,))
+
+    def delete_item(self, id: int):
+        self.__execute("DELETE FROM items WHERE id = ?", (id,))
+
+    def replace_item_id(self, old_id: int, item: Item):
+        self.delete_item(old_id)
+        self.put_item(item)
+
+    def item(self, id: int) -> Optional[Item]:
+        rows = self.__execute(f"{SELECT_ITEMS} WHERE id = ?", (id,))
+        return self.__item(rows[0]) if rows else None
+
+    def item_by_title(self, title: str) -> Optional[Item]:
+        rows = self.__execute(f"{SELECT_ITEMS} WHERE title = ? LIMIT 1", (title,))
+        return self.__item(rows[0]) if rows else None
+
+    def items(self, skip: int = 0, limit: int = 100, query: Optional[ItemQuery] = None) -> list[Item]:
+        conditions, parameters = self.__item_conditions(query)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sort = query.sort if query is not None else ()
+        order = [f"{SORT_COLUMNS[key.field]} {'DESC' if key.descending else 'ASC'}" for key in sort]
+        # the items created offline have negative ids, they go after the others
+        order.append("id < 0, abs(id)")
+        rows = self.__execute(
+            f"{SELECT_ITEMS} {where} ORDER BY {', '.join(order)} LIMIT ? OFFSET ?", (*parameters, limit, skip)
+        )
+        return [self.__item(row) for row in rows]
+
+    @staticmethod
+    def __item_conditions(query: Optional[ItemQuery]) -> tuple[list[str], list[Any]]:
+        conditions, parameters = [], []
+        if query is None:
+            return conditions, parameters
+
+        price = SORT_COLUMNS["price"]
+        for condition, value in (
+            (f"{price} >= ?", query.min_price),
+            (f"{price} <= ?", query.max_price),
+            ("quantity >= ?", query.min_quantity),
+            ("quantity <= ?", query.max_quantity),
+            ("owner_id = ?", query.owner_id),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                # sqlite has no decimals
+                parameters.append(float(value) if isinstance(value, Decimal) else value)
+        return conditions, parameters
+
+    def items_of(self, owner_id: int) -> list[Item]:
+        return [construct(Item, row) for row in self.__item_rows_of(owner_id)]
+
+    def __item_rows_of(self, owner_id: int) -> list[dict[str, Any]]:
+        rows = self.__execute(f"{SELECT_ITEMS} WHERE owner_id = ? ORDER BY id", (owner_id,))
+        return [dict(zip(ITEM_COLUMNS, row)) for row in rows]
+
+    def item_count(self) -> int:
+        return self.__execute("SELECT count(*) FROM items")[0][0]
+
+    def next_temporary_id(self) -> int:
+        """
+        Id for an item created offline, negative so it never clashes with the ids of the server
+        """
+        return min(self.__execute("SELECT min(id) FROM items")[0][0] or 0, 0) - 1
+
+    @staticmethod
+    def __item(row: tuple) -> Item:
+        return construct(Item, dict(zip(ITEM_COLUMNS, row)))
+
+    # Users
+
+    def put_users(self, users: Iterable[User]):
+        users = list(users)
+        self.__execute_many(
+            f"INSERT OR REPLACE INTO users VALUES ({', '.join('?' * len(USER_COLUMNS))})",
+            ((user.id, user.name, user.email, int(user.is_admin)) for user in users),
+        )
+        self.put_items(item for user in users for item in user.items)
+
+    def put_user(self, user: User):
+        self.put_users((user,))
+
+    def user(self, id: int) -> Optional[User]:
+        rows = self.__execute(f"{SELECT_USERS} WHERE id = ?", (id,))
+        return self.__user(rows[0]) if rows else None
+
+    def users(self, skip: int = 0, limit: int = 100) -> list[User]:
+        rows = self.__execute(f"{SELECT_USERS} ORDER BY id LIMIT ? OFFSET ?", (limit, skip))
+        return [self.__user(row) for row in rows]
+
+    def __user(self, row: tuple) -> User:
+        user = dict(zip(USER_COLUMNS, row), is_admin=bool(row[3]))
+        return construct(User, {**user, "items": self.__item_rows_of(user["id"])})
+
+    # Logins
+
+    def remember_login(self, username: str, password: str, user_id: Optional[int] = None):
+        salt = os.urandom(16)
+        password_hash = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PASSWORD_HASH_ITERATIONS)
+        self.__execute("INSERT OR REPLACE INTO logins VALUES (?, ?, ?, ?)", (username, salt, password_hash, user_id))
+
+    def set_login_user(self, username: str, user_id: int):
+        self.__execute("UPDATE logins SET user_id = ? WHERE username = ?", (user_id, username))
+
+    def check_login(self, username: str, password: str) -> Optional[int]:
+        """
+        The id of the user if `username` signed in with `password` before (0 if it's unknown), otherwise `None`
+        """
+        rows = self.__execute("SELECT salt, password_hash, user_id FROM logins WHERE username = ?", (username,))
+        if not rows:
+            return None
+
+        salt, password_hash, user_id = rows[0]
+        if hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PASSWORD_HASH_ITERATIONS) != password_hash:
+            return None
+        return user_id or 0
+
+    # Pending operations
+
+    def enqueue(self, kind: str, item_id: int, payload: dict[str, Any], base: Optional[Item] = None):
+        self.__execute(
+            "INSERT INTO pending_operations (kind, item_id, payload, base) VALUES (?, ?, ?, ?)",
+            (kind, item_id, json.dumps(payload), base.json() if base is not None else None),
+        )
+
+    def pending_operations(self) -> list[PendingOperation]:
+        rows = self.__execute("SELECT seq, kind, item_id, payload, base FROM pending_operations ORDER BY seq")
+        return [
+            PendingOperation(seq, kind, item_id, json.loads(payload), json.loads(base) if base else None)
+            for seq, kind, item_id, payload, base in rows
+        ]
+
+    def pending_count(self) -> int:
+        return self.__execute("SELECT count(*) FROM pending_operations")[0][0]
+
+    def remove_operation(self, seq: int):
+        self.__execute("DELETE FROM pending_operations WHERE seq = ?", (seq,))
+
+    def rename_item_in_operations(self, old_id: int, new_id: int):
+        self.__execute("UPDATE pending_operations SET item_id = ? WHERE item_id = ?", (new_id, old_id))
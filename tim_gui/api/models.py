@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Type
+from typing import Literal, Optional, Type
 
 from pydantic import BaseModel
 
@@ -44,6 +44,23 @@ class Item(ItemBase):
     owner_id: int
 
 
+class ItemOperation(BaseModel):
+    op: Literal["delete", "update", "withdraw"]
+    id: int
+    # the new quantity of "update" or how many to take out with "withdraw"
+    quantity: Optional[int] = None
+
+
+class ItemBatch(BaseModel):
+    operations: list[ItemOperation]
+
+
+class ItemOperationResult(BaseModel):
+    id: int
+    item: Optional[Item] = None
+    detail: Optional[str] = None
+
+
 class UserBase(BaseModel):
     name: str
     email: str
@@ -61,3 +78,28 @@ class UserCreate(UserBase):
 
 class UserUpdate(UserCreate):
     __annotations__ = convert_to_optional(UserBase, UserCreate)
+
+
+class ChangeEvent(BaseModel):
+    revision: int
+    kind: Literal["item", "user"]
+    action: Literal["changed", "deleted"]
+    id: int
+    # the item or user as it is after the change, `None` when it was deleted
+    item: Optional[Item] = None
+    user: Optional[User] = None
+
+
+class Changes(BaseModel):
+    # the revision the changes are up to, the next ones are asked since it
+    revision: int
+    items: list[Item]
+    deleted_item_ids: list[int]
+    users: list[User]
+    deleted_user_ids: list[int]
+
+
+class ChangeEvents(BaseModel):
+    # the revision the next changes come after
+    revision: int
+    events: list[ChangeEvent]
@@ -0,0 +1,346 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+import requests
+
+from . import Request, RequestError, TimAPI, was_sent
+from .bulk import apply_operation
+from .decoding import Decoder
+from .errors import CircuitOpen, ServerUnavailable
+from .mirror import LocalMirror, PendingOperation
+from .models import (Changes, Item, ItemCreate, ItemOperation,
+                     ItemOperationResult, ItemUpdate, User)
+from .query import ItemQuery
+
+# errors meaning the server can't be reached
+OFFLINE_ERRORS = (ServerUnavailable,)
+
+T = TypeVar("T")
+
+
+@dataclass
+class Conflict:
+    operation: PendingOperation
+    # the item as the server has it, `None` if it couldn't be found
+    server_item: Optional[Item]
+    detail: str
+
+
+@dataclass
+class SyncReport:
+    """
+    What replaying the operations queued while offline changed
+    """
+
+    applied: int = 0
+    # the items as the server has them now
+    items: list[Item] = field(default_factory=list)
+    deleted_ids: list[int] = field(default_factory=list)
+    # temporary id of the items created offline -> their id on the server
+    id_changes: dict[int, int] = field(default_factory=dict)
+    conflicts: list[Conflict] = field(default_factory=list)
+
+
+def not_found() -> RequestError:
+    return RequestError("Error in request:\n\tstatus code: 404\n\tDetail: Item not found", 404)
+
+
+def surely_not_sent(error: ServerUnavailable) -> bool:
+    """
+    Whether the server surely didn't get the request: the circuit was open or the connection couldn't be opened
+    """
+    if isinstance(error, CircuitOpen):
+        return True
+    cause = error.__cause__
+    return isinstance(cause, requests.RequestException) and not was_sent(cause)
+
+
+class OfflineTimAPI(TimAPI):
+    """
+    `TimAPI` that keeps working when the server can't be reached. Everything fetched is mirrored in a
+    `LocalMirror`, which answers the reads while offline. The item changes made offline are applied to
+    the mirror and queued, `sync` replays them once the server is back. A queued change is dropped as
+    a conflict, and the server version kept, when the item was changed on the server in the meantime.
+    The changes that would be applied twice if replayed are only queued when the server surely didn't
+    get them, e.g. not after a timeout.
+    """
+
+    def __init__(self, mirror: LocalMirror, request: Optional[Request] = None, decoder: Optional[Decoder] = None):
+        super().__init__(request, decoder)
+        self.mirror = mirror
+        self.online = True
+
+        self._credentials: Optional[tuple[str, str]] = None
+        self._user_id: Optional[int] = None
+        self._sync_lock = threading.Lock()
+
+    def pending_count(self) -> int:
+        return self.mirror.pending_count()
+
+    def __call(
+        self,
+        online: Callable[[], T],
+        offline: Callable[[], T],
+        mirror: Callable[[T], Any],
+        idempotent: bool = True,
+    ) -> T:
+        """
+        Returns `online()`, passed to `mirror`, or `offline()` if the server can't be reached. When
+        `online` isn't `idempotent` and the server may have got it, the error is raised instead.
+        """
+        if self.online:
+            try:
+                result = online()
+            except OFFLINE_ERRORS as e:
+                self.online = False
+                if not idempotent and not surely_not_sent(e):
+                    raise
+            else:
+                mirror(result)
+                return result
+        return offline()
+
+    def login(self, *, username: str, password: str):
+        self._credentials = (username, password)
+        try:
+            super().login(username=username, password=password)
+        except OFFLINE_ERRORS:
+            user_id = self.mirror.check_login(username, password)
+            if user_id is None:
+                raise
+            self.online = False
+            self._user_id = user_id or None
+        else:
+            self.online = True
+            self.mirror.remember_login(username, password, self._user_id)
+
+    # Reads
+
+    def items(self, skip: int = 0, limit: int = 100, query: Optional[ItemQuery] = None) -> list[Item]:
+        return self.__call(
+            lambda: TimAPI.items(self, skip, limit, query),
+            lambda: self.mirror.items(skip, limit, query),
+            self.mirror.put_items,
+        )
+
+    def get_item(self, title: str) -> Item:
+        return self.__call(
+            lambda: TimAPI.get_item(self, title),
+            lambda: self.__local_item(self.mirror.item_by_title(title)),
+            self.mirror.put_item,
+        )
+
+    def get_user(self, id: int) -> User:
+        return self.__call(lambda: TimAPI.get_user(self, id), lambda: self.__local_user(id), self.mirror.put_user)
+
+    def get_user_me(self) -> User:
+        def mirror(user: User):
+            self._user_id = user.id
+            self.mirror.put_user(user)
+            if self._credentials is not None:
+                self.mirror.set_login_user(self._credentials[0], user.id)
+
+        return self.__call(lambda: TimAPI.get_user_me(self), lambda: self.__local_user(self._user_id), mirror)
+
+    def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
+        return self.__call(
+            lambda: TimAPI.get_users(self, skip, limit),
+            lambda: self.mirror.users(skip, limit),
+            self.mirror.put_users,
+        )
+
+    def changes(self, since: Optional[int] = None) -> Changes:
+        def offline() -> Changes:
+            # what changed on the server can't be known without it
+            raise ServerUnavailable("The server can't be reached")
+
+        def mirror(changes: Changes):
+            self.mirror.put_items(changes.items)
+            for id in changes.deleted_item_ids:
+                self.mirror.delete_item(id)
+            self.mirror.put_users(changes.users)
+
+        return self.__call(lambda: TimAPI.changes(self, since), offline, mirror)
+
+    @staticmethod
+    def __local_item(item: Optional[Item]) -> Item:
+        if item is None:
+            raise not_found()
+        return item
+
+    def __local_user(self, id: Optional[int]) -> User:
+        user = self.mirror.user(id) if id is not None else None
+        if user is None:
+            raise RequestError("Error in request:\n\tstatus code: 404\n\tDetail: User not found", 404)
+        return user
+
+    # Item changes
+
+    def create_item(self, user_id: int, item: ItemCreate) -> Item:
+        def offline() -> Item:
+            created = Item(id=self.mirror.next_temporary_id(), owner_id=user_id, **item.dict())
+            self.mirror.put_item(created)
+            self.mirror.enqueue("create", created.id, {"user_id": user_id, "item": json.loads(item.json())})
+            return created
+
+        return self.__call(
+            lambda: TimAPI.create_item(self, user_id, item), offline, self.mirror.put_item, idempotent=False
+        )
+
+    def update_item(self, id: int, item: ItemUpdate) -> Item:
+        def offline() -> Item:
+            base = self.__local_item(self.mirror.item(id))
+            changes = item.dict(exclude_none=True)
+            updated = base.copy(update=changes)
+            self.mirror.put_item(updated)
+            self.mirror.enqueue("update", id, json.loads(item.json(exclude_none=True)), base)
+            return updated
+
+        return self.__call(lambda: TimAPI.update_item(self, id, item), offline, self.mirror.put_item)
+
+    def withdraw_item(self, id: int, quantity: int) -> Item:
+        def offline() -> Item:
+            base = self.__local_item(self.mirror.item(id))
+            if quantity > base.quantity:
+                raise RequestError("Error in request:\n\tstatus code: 400\n\tDetail: Not enough items", 400)
+            updated = base.copy(update={"quantity": base.quantity - quantity})
+            self.mirror.put_item(updated)
+            self.mirror.enqueue("withdraw", id, {"quantity": quantity}, base)
+            return updated
+
+        return self.__call(
+            lambda: TimAPI.withdraw_item(self, id, quantity), offline, self.mirror.put_item, idempotent=False
+        )
+
+    def delete_item(self, id: int) -> Item:
+        def offline() -> Item:
+            base = self.__local_item(self.mirror.item(id))
+            self.mirror.delete_item(id)
+            self.mirror.enqueue("delete", id, {}, base)
+            return base
+
+        return self.__call(lambda: TimAPI.delete_item(self, id), offline, lambda _: self.mirror.delete_item(id))
+
+    def batch_items(self, operations: list[ItemOperation]) -> list[ItemOperationResult]:
+        def offline() -> list[ItemOperationResult]:
+            results = []
+            for operation in operations:
+                try:
+                    results.append(ItemOperationResult(id=operation.id, item=apply_operation(self, operation)))
+                except RequestError as e:
+                    results.append(ItemOperationResult(id=operation.id, detail=str(e)))
+            return results
+
+        def mirror(results: list[ItemOperationResult]):
+            deleted = {operation.id for operation in operations if operation.op == "delete"}
+            for result in results:
+                if result.detail is None and result.id in deleted:
+                    self.mirror.delete_item(result.id)
+            self.mirror.put_items(
+                result.item for result in results if result.item is not None and result.id not in deleted
+            )
+
+        return self.__call(lambda: TimAPI.batch_items(self, operations), offline, mirror, idempotent=False)
+
+    # Replay
+
+    def sync(self) -> SyncReport:
+        """
+        Signs in again if needed and replays the queued operations. Raises the connection error and
+        stays offline if the server still can't be reached.
+        """
+        with self._sync_lock:
+            if not self.online or self.access_token is None:
+                if self._credentials is None:
+                    raise RequestError("Not signed in")
+                username, password = self._credentials
+                try:
+                    TimAPI.login(self, username=username, password=password)
+                except OFFLINE_ERRORS:
+                    self.online = False
+                    raise
+                self.online = True
+
+            report = SyncReport()
+            for operation in self.mirror.pending_operations():
+                try:
+                    self.__replay(operation, report)
+                except OFFLINE_ERRORS:
+                    self.online = False
+                    raise
+                self.mirror.remove_operation(operation.seq)
+            return report
+
+    def __replay(self, operation: PendingOperation, report: SyncReport):
+        item_id = report.id_changes.get(operation.item_id, operation.item_id)
+
+        if operation.kind == "create":
+            item = TimAPI.create_item(self, operation.payload["user_id"], ItemCreate(**operation.payload["item"]))
+            self.mirror.replace_item_id(operation.item_id, item)
+            self.mirror.rename_item_in_operations(operation.item_id, item.id)
+            report.id_changes[operation.item_id] = item.id
+            report.items.append(item)
+            report.applied += 1
+            return
+
+        base = Item.parse_obj(operation.base)
+        server_item = self.__server_item(item_id, base)
+        if server_item is None:
+            report.conflicts.append(Conflict(operation, None, "The item was not found on the server"))
+            return
+        # other terminals withdrawing from the same item don't conflict, the server checks the quantity
+        if operation.kind != "withdraw" and server_item.dict(exclude={"id"}) != base.dict(exclude={"id"}):
+            self.__conflict(report, operation, server_item, "The item was changed on the server")
+            return
+
+        try:
+            if operation.kind == "update":
+                item = TimAPI.update_item(self, item_id, ItemUpdate(**operation.payload))
+            elif operation.kind == "withdraw":
+                item = TimAPI.withdraw_item(self, item_id, operation.payload["quantity"])
+            else:
+                TimAPI.delete_item(self, item_id)
+                self.mirror.delete_item(item_id)
+                report.deleted_ids.append(item_id)
+                report.applied += 1
+                return
+        except OFFLINE_ERRORS:
+            raise
+        except RequestError as e:
+            self.__conflict(report, operation, server_item, str(e))
+            return
+
+        self.mirror.put_item(item)
+        report.items.append(item)
+        report.applied += 1
+
+    def __server_item(self, id: int, base: Item) -> Optional[Item]:
+        """
+        The item `id` as the server has it. The server finds the items by title only: another item may
+        have the title of `base`, or the item may have been renamed, it's then looked for among the items
+        of its owner.
+        """
+        try:
+            item = TimAPI.get_item(self, base.title)
+        except RequestError as e:
+            if e.status_code != 404:
+                raise
+        else:
+            if item.id == id:
+                return item
+
+        try:
+            owner = TimAPI.get_user(self, base.owner_id)
+        except RequestError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return next((item for item in owner.items if item.id == id), None)
+
+    def __conflict(self, report: SyncReport, operation: PendingOperation, server_item: Item, detail: str):
+        # the server wins, the local change is undone
+        self.mirror.put_item(server_item)
+        report.items.append(server_item)
+        report.conflicts.append(Conflict(operation, server_item, detail))
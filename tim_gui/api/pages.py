@@ -0,0 +1,30 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_pages(fetch: Callable[[int, int], list[T]], page_size: int = 1000, prefetch: bool = True) -> Iterator[list[T]]:
+    """
+    Yields the pages of `fetch(skip, limit)` until a short one. With `prefetch` the next page is fetched in
+    a background thread while the current one is consumed, so at most two pages are in memory.
+    """
+    executor = ThreadPoolExecutor(1, thread_name_prefix="iter_pages") if prefetch else None
+    try:
+        skip = 0
+        page = fetch(skip, page_size)
+        while page:
+            next_page: Optional[Future] = None
+            if executor is not None and len(page) == page_size:
+                next_page = executor.submit(fetch, skip + page_size, page_size)
+
+            yield page
+            if len(page) < page_size:
+                return
+
+            skip += page_size
+            page = next_page.result() if next_page is not None else fetch(skip, page_size)
+    finally:
+        # don't wait for a page nobody will read when the iteration is stopped early
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Optional
+
+from .models import Item
+
+# field -> key the items are sorted by
+SORT_KEYS: dict[str, Callable[[Item], Any]] = {
+    "price": lambda item: item.price,
+    "quantity": lambda item: item.quantity,
+    "title": lambda item: item.title.casefold(),
+    "bar_code": lambda item: item.bar_code,
+}
+
+
+@dataclass(frozen=True)
+class SortKey:
+    field: str
+    descending: bool = False
+
+    def __post_init__(self):
+        if self.field not in SORT_KEYS:
+            raise ValueError(f'Items can\'t be sorted by "{self.field}"')
+
+    def param(self) -> str:
+        return f"-{self.field}" if self.descending else self.field
+
+
+@dataclass(frozen=True)
+class ItemQuery:
+    """
+    Sort and filters over the items, applied in memory by `apply` or sent to the server by `params`.
+    The items are ordered by the first key of `sort`, then the next one for the items equal on it, and
+    so on, then by id. The ranges include their bounds, `None` leaves a bound open.
+    """
+
+    sort: tuple[SortKey, ...] = ()
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+    min_quantity: Optional[int] = None
+    max_quantity: Optional[int] = None
+    owner_id: Optional[int] = None
+
+    def is_sorted(self) -> bool:
+        return bool(self.sort)
+
+    def is_filtered(self) -> bool:
+        return any(
+            bound is not None
+            for bound in (self.min_price, self.max_price, self.min_quantity, self.max_quantity, self.owner_id)
+        )
+
+    def is_empty(self) -> bool:
+        return not self.is_sorted() and not self.is_filtered()
+
+    def matches(self, item: Item) -> bool:
+        return (
+            (self.min_price is None or item.price >= self.min_price)
+            and (self.max_price is None or item.price <= self.max_price)
+            and (self.min_quantity is None or item.quantity >= self.min_quantity)
+            and (self.max_quantity is None or item.quantity <= self.max_quantity)
+            and (self.owner_id is None or item.owner_id == self.owner_id)
+        )
+
+    def apply(self, items: Iterable[Item]) -> list[Item]:
+        items = sorted((item for item in items if self.matches(item)), key=lambda item: item.id)
+        # a stable sort per key, from the last one to the first
+        for key in reversed(self.sort):
+            items.sort(key=SORT_KEYS[key.field], reverse=key.descending)
+        return items
+
+    def params(self) -> dict[str, Any]:
+        """
+        The query parameters of "GET /items/", e.g. `sort=-price,title&max_quantity=5`
+        """
+        params: dict[str, Any] = {}
+        if self.sort:
+            params["sort"] = ",".join(key.param() for key in self.sort)
+        for name in ("min_price", "max_price", "min_quantity", "max_quantity", "owner_id"):
+            value = getattr(self, name)
+            if value is not None:
+                params[name] = str(value)
+        return params
@@ -0,0 +1,55 @@
+"""
+Headless commands, they don't need Qt
+"""
+import argparse
+import getpass
+import os
+import sys
+from typing import Optional
+
+from tim_gui.api import Request, RequestError, TimAPI
+from tim_gui.api.decoding import Decoder
+from tim_gui.api.export import EXPORT_FORMATS, export_format, export_items, write_items
+
+
+def export(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Exports every item of the inventory, page by page in constant memory")
+    parser.add_argument("output", help='file written, ".csv" or ".jsonl", "-" for the standard output')
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="by default guessed from the extension of output")
+    parser.add_argument("--server", default=os.environ.get("TIM_SERVER", Request.prefix), help="URL of the tim API")
+    parser.add_argument("--username", default=os.environ.get("TIM_USERNAME"))
+    parser.add_argument("--password", help="read from TIM_PASSWORD or asked when not given")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--quiet", action="store_true", help="don't report the progress")
+    args = parser.parse_args(argv)
+
+    if args.output == "-" and args.format is None:
+        parser.error("--format is needed to write to the standard output")
+    if args.username is None:
+        parser.error("--username or TIM_USERNAME is needed")
+    password = args.password or os.environ.get("TIM_PASSWORD") or getpass.getpass()
+
+    def report(count: int):
+        if not args.quiet:
+            print(f"{count} items exported", file=sys.stderr)
+
+    # the items come from the server itself, only a sample of them needs to be validated
+    api = TimAPI(Request(args.server), Decoder(trusted=True))
+    try:
+        api.login(username=args.username, password=password)
+        if args.output == "-":
+            count = write_items(api.iter_items(args.page_size), sys.stdout, args.format, report)
+        else:
+            count = export_items(api, args.output, args.format or export_format(args.output), args.page_size, report)
+    except (RequestError, ValueError, OSError) as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        api.request.close()
+
+    report(count)
+    return 0
+
+
+def run_export():
+    sys.exit(export())
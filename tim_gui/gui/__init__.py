@@ -1,16 +1,77 @@
+# imported first, so the report measures the whole startup
+from tim_gui.gui.startup import startup_report  # isort: skip
+
+import os
 import sys
+from pathlib import Path
+
+from PySide6 import QtCore, QtWidgets
+
+from tim_gui.gui import icons
+from tim_gui.gui.login import LoginWindow
+from tim_gui.gui.workers import TaskRunner
+
+
+def load_api(data_dir: Path):
+    """
+    Builds the API, with its heavy imports, and opens a connection to the server. Run in the background
+    while the login window is shown.
+    """
+    from tim_gui.api import Request
+    from tim_gui.api.cache import ResponseCache
+    from tim_gui.api.decoding import Decoder
+    from tim_gui.api.metrics import JsonLinesSink
+    from tim_gui.api.mirror import LocalMirror
+    from tim_gui.api.offline import OfflineTimAPI
+
+    startup_report.mark("API imported")
+    # everything fetched is mirrored locally, so the app keeps working when the server can't be reached.
+    # The responses come from our own server, only a sample of them needs to be validated
+    api = OfflineTimAPI(
+        LocalMirror(data_dir / "mirror.sqlite3"), Request(response_cache=ResponseCache()), Decoder(trusted=True)
+    )
+    if "TIM_GUI_METRICS_LOG" in os.environ:
+        api.request.add_sink(JsonLinesSink(os.environ["TIM_GUI_METRICS_LOG"]))
+    startup_report.mark("API ready")
+
+    if api.request.preconnect():
+        startup_report.mark("connected to the server")
+    return api
 
-from PySide6 import QtWidgets
 
-from tim_gui.api import TimAPI
-from tim_gui.gui.windows import LoginWindow
+def import_windows():
+    import tim_gui.gui.windows  # noqa: F401
+
+    startup_report.mark("windows imported")
 
 
 def run():
-    api = TimAPI()
     app = QtWidgets.QApplication()
+    app.setApplicationName("tim-gui")
+    icons.preload()
+
+    if "TIM_GUI_STALL_MS" in os.environ:
+        from tim_gui.gui.watchdog import StallWatchdog
+
+        watchdog = StallWatchdog(app, threshold=int(os.environ["TIM_GUI_STALL_MS"]) / 1000)
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+        app.aboutToQuit.connect(lambda: print(watchdog.format_report(), file=sys.stderr))
 
-    login = LoginWindow(api)
+    login = LoginWindow()
     login.show()
+    startup_report.mark("login window shown")
+
+    # the rest loads while the user types
+    data_dir = Path(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.AppDataLocation))
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    def api_failed(error: Exception):
+        QtWidgets.QMessageBox.critical(login, "ERRO!", f"Não foi possível iniciar:\n{error}")
+        app.quit()
+
+    tasks = TaskRunner(app)
+    tasks.submit(load_api, data_dir, on_result=login.set_api, on_error=api_failed)
+    tasks.submit(import_windows)
 
     sys.exit(app.exec())
@@ -0,0 +1,63 @@
+import threading
+from typing import Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api import TimAPI
+from tim_gui.api.bulk import BulkResult, run_item_operations
+from tim_gui.api.models import ItemOperation
+from tim_gui.gui.store import EntityStore
+from tim_gui.gui.workers import TaskRunner
+
+
+class BulkItemOperation(QtCore.QObject):
+    """
+    Runs item operations in the background with `run_item_operations`, reporting the progress and
+    applying the results to the store once they are all done.
+    """
+
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal(BulkResult)
+    failed = QtCore.Signal(Exception)
+
+    def __init__(
+        self,
+        api: TimAPI,
+        store: EntityStore,
+        operations: list[ItemOperation],
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+
+        self._api = api
+        self._store = store
+        self.operations = operations
+        self._cancelled = threading.Event()
+        self._tasks = TaskRunner(self)
+
+    def start(self):
+        self._tasks.submit(
+            run_item_operations,
+            self._api,
+            self.operations,
+            # emitted from the worker threads, delivered in the GUI thread
+            on_progress=self.progress.emit,
+            cancelled=self._cancelled,
+            on_result=self.__done,
+            on_error=self.failed.emit,
+        )
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def __done(self, result: BulkResult):
+        deleted = {operation.id for operation in self.operations if operation.op == "delete"}
+        changed_items = []
+        for operation_result in result.succeeded():
+            if operation_result.id in deleted:
+                self._store.remove_item(operation_result.id)
+            elif operation_result.item is not None:
+                changed_items.append(operation_result.item)
+        self._store.put_items(changed_items)
+
+        self.finished.emit(result)
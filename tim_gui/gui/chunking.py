@@ -0,0 +1,91 @@
+import time
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from PySide6 import QtCore
+
+T = TypeVar("T")
+
+# time the work queued on the GUI thread may take per event loop iteration, half of a 60 Hz frame
+FRAME_BUDGET = 0.008
+
+
+class ChunkedFeeder(QtCore.QObject, Generic[T]):
+    """
+    Passes the values queued with `add` to `consume` in chunks, spread over event loop iterations that
+    each spend about `budget` seconds on them, so a large page neither blocks the event loop nor delays
+    the first rows: the first chunk is consumed right away. The chunk size adapts to the measured time
+    per value. `finished` is emitted once the queue is empty.
+    """
+
+    finished = QtCore.Signal()
+
+    MIN_CHUNK_SIZE = 10
+    MAX_CHUNK_SIZE = 50_000
+
+    def __init__(
+        self,
+        consume: Callable[[list[T]], Any],
+        budget: float = FRAME_BUDGET,
+        chunk_size: int = 100,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+
+        self._consume = consume
+        self.budget = budget
+        self.chunk_size = chunk_size
+
+        self._queue: list[T] = []
+        self._offset = 0
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.__consume_for_a_frame)
+
+    def pending(self) -> int:
+        return len(self._queue) - self._offset
+
+    def add(self, values: list[T]):
+        self._queue.extend(values)
+        if not self._timer.isActive():
+            self.__consume_for_a_frame()
+
+    def flush(self):
+        """
+        Consumes everything queued now, before a change that must see it
+        """
+        self._timer.stop()
+        if self.pending():
+            self.__consume(len(self._queue))
+            self.__done()
+
+    def clear(self):
+        self._timer.stop()
+        self._queue = []
+        self._offset = 0
+
+    def __consume_for_a_frame(self):
+        deadline = time.perf_counter() + self.budget
+        while self.pending() and time.perf_counter() < deadline:
+            start = time.perf_counter()
+            count = self.__consume(self.chunk_size)
+            per_value = (time.perf_counter() - start) / count
+            # a few chunks per frame, so the last one doesn't overrun the budget by much
+            chunk_size = int(self.budget / 4 / per_value) if per_value else ChunkedFeeder.MAX_CHUNK_SIZE
+            self.chunk_size = max(ChunkedFeeder.MIN_CHUNK_SIZE, min(chunk_size, ChunkedFeeder.MAX_CHUNK_SIZE))
+
+        if self.pending():
+            self._timer.start()
+        else:
+            self.__done()
+
+    def __consume(self, count: int) -> int:
+        chunk = self._queue[self._offset : self._offset + count]
+        self._offset += len(chunk)
+        self._consume(chunk)
+        return len(chunk)
+
+    def __done(self):
+        self._queue = []
+        self._offset = 0
+        self.finished.emit()
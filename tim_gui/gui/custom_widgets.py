@@ -1,117 +1,17 @@
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import (QHBoxLayout, QLabel, QLayoutItem, QLineEdit,
                                QPushButton, QScrollArea, QSpacerItem,
                                QVBoxLayout, QWidget)
 
-from tim_gui.api.models import Item, User, UserUpdate
-from tim_gui.gui.utils import center_window, create_widgets_with_layout
+from tim_gui.gui import icons
+from tim_gui.gui.images import thumbnail_cache
+from tim_gui.gui.utils import create_widgets_with_layout
 
-icons_path = Path(__file__).parent.parent.parent / "icons"
-
-
-class PreviewImage(QLabel):
-    def __init__(self):
-        super().__init__()
-
-        self.preview_window = QWidget()
-        self.preview_window.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
-
-        self.preview_lbl = QLabel()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.preview_lbl)
-
-        self.preview_window.setLayout(layout)
-
-        center_window(self.preview_window)
-
-    def enterEvent(self, event: QtGui.QEnterEvent):
-        preview_image = self.pixmap().scaled(256, 256, mode=QtCore.Qt.SmoothTransformation)
-
-        self.preview_lbl.setPixmap(preview_image)
-        self.preview_window.show()
-
-        return super().enterEvent(event)
-
-    def leaveEvent(self, event: QtCore.QEvent):
-        self.preview_window.close()
-        return super().leaveEvent(event)
-
-
-class ItemView(QWidget):
-    clicked = QtCore.Signal(QtCore.QObject)
-
-    def __init__(self, item: Item):
-        super().__init__()
-
-        self.item = item
-        self.is_selected = False
-
-        self.name_lbl = QLabel(item.title)
-        self.barcode_lbl = QLabel(item.bar_code)
-        self.price_lbl = QLabel(str(item.price))
-        self.quantity_lbl = QLabel(str(item.quantity))
-
-        name_layout = create_widgets_with_layout(QVBoxLayout, QLabel("<b>Name:<\b>"), self.name_lbl)
-        bar_code_layout = create_widgets_with_layout(QVBoxLayout, QLabel("<b>Bar Code:<\b>"), self.barcode_lbl)
-        price_layout = create_widgets_with_layout(QVBoxLayout, QLabel("<b>Price:<\b>"), self.price_lbl)
-        quantity_layout = create_widgets_with_layout(QVBoxLayout, QLabel("<b>Quantity:<\b>"), self.quantity_lbl)
-
-        image_path = f"{icons_path}/broken-image32x32.png" if item.image_path is None else item.image_path
-        self.image_lbl = PreviewImage()
-        self.set_image(image_path)
-
-        container_layout = create_widgets_with_layout(QHBoxLayout, self.image_lbl)
-        container_layout.addLayout(name_layout)
-        container_layout.addLayout(bar_code_layout)
-        container_layout.addLayout(price_layout)
-        container_layout.addLayout(quantity_layout)
-
-        self.setLayout(container_layout)
-        self.setAutoFillBackground(True)
-        self._palette = self.palette()
-
-    def select(self):
-        self.is_selected = True
-        self._palette.setColor(QtGui.QPalette.Window, QtCore.Qt.green)
-        self.setPalette(self._palette)
-
-    def clear_selection(self):
-        self.is_selected = False
-        self.setPalette(QtGui.QPalette())
-
-    def mousePressEvent(self, _: QtGui.QMouseEvent):
-        self.clicked.emit(self)
-
-    def enterEvent(self, event: QtGui.QEnterEvent):
-        if not self.is_selected:
-            self._palette.setColor(self.backgroundRole(), QtCore.Qt.darkGray)
-            self.setPalette(self._palette)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event: QtCore.QEvent):
-        if not self.is_selected:
-            self.clear_selection()
-        super().leaveEvent(event)
-
-    def set_image(self, image_path: str):
-        pixmap = QtGui.QPixmap(image_path)
-        if pixmap.width() > 64 or pixmap.height() > 64:
-            pixmap = pixmap.scaled(64, 64)
-        self.image_lbl.setPixmap(pixmap)
-
-    def update(self, item: Item):
-        self.item = item
-
-        self.name_lbl.setText(item.title)
-        self.price_lbl.setText(str(item.price))
-        self.price_lbl.setText(str(item.quantity))
-        self.barcode_lbl.setText(item.bar_code)
-
-        if item.image_path is not None:
-            self.set_image(item.image_path)
+if TYPE_CHECKING:
+    # the login window uses these widgets, importing the models would pull in the whole API package
+    from tim_gui.api.models import User, UserUpdate
 
 
 class ListView(QWidget):
@@ -146,6 +46,17 @@ class ListView(QWidget):
     def insertWidget(self, index: int, widget: QWidget):
         self.widgets_layout.insertWidget(index, widget)
 
+    def insertWidgets(self, index: int, widgets: list[QWidget]):
+        # showing widgets one by one in a visible list is several times slower than showing them along with it
+        scroll_position = self.scroll_area.verticalScrollBar().value()
+        self.container.hide()
+        try:
+            for offset, widget in enumerate(widgets):
+                self.widgets_layout.insertWidget(index + offset, widget)
+        finally:
+            self.container.show()
+            self.scroll_area.verticalScrollBar().setValue(scroll_position)
+
     def addSpacerItem(self, item: QSpacerItem):
         self.widgets_layout.addSpacerItem(item)
 
@@ -170,64 +81,38 @@ class ListView(QWidget):
                 item.widget().deleteLater()
 
 
-class ItemsList(ListView):
-    clicked = QtCore.Signal(QtCore.QObject)
+class ClickableLabel(QLabel):
+    clicked = QtCore.Signal()
 
-    def __init__(self, items: list[Item]):
+    def __init__(self):
         super().__init__()
 
-        self.child_widgets: set[ItemView] = set()
-        self.selected_widget: ItemView | None = None
-
-        self.add_items(items)
-
-    def __len__(self):
-        return self.count()
-
-    def add_items(self, items: list[Item]):
-        # remove the Stretch at the end of the layout before inserting new widgets
-        child = self.takeAt(self.count() - 1)
-        if child is not None and child.spacerItem():
-            del child
-
-        for item in items:
-            self.add_item(item)
-
-        self.addStretch()
-
-    def insert_item(self, index: int, item: Item):
-        child = ItemView(item)
-        child.clicked.connect(self.__clicked_item)
-        self.child_widgets.add(child)
-
-        self.insertWidget(index, child)
-
-    def add_item(self, item: Item):
-        self.insert_item(self.count() - 1, item)
-
-    def remove_selected_item(self):
-        if self.selected_widget is not None:
-            self.removeWidget(self.selected_widget)
-            self.selected_widget.deleteLater()
-
-    def __clicked_item(self, widget: ItemView):
-        if self.selected_widget is not None:
-            self.selected_widget.clear_selection()
+    def mousePressEvent(self, _: QtGui.QMouseEvent) -> None:
+        self.clicked.emit()
 
-        widget.select()
-        self.selected_widget = widget
 
-        self.clicked.emit(widget)
+class ImageLabel(ClickableLabel):
+    """
+    Shows an item image through the thumbnail cache, so it is decoded off the GUI thread at the
+    displayed size.
+    """
 
+    def __init__(self, size: int = 128):
+        super().__init__()
 
-class ClickableLabel(QLabel):
-    clicked = QtCore.Signal()
+        self.image_size = size
+        self.image_path: Optional[str] = None
+        self.thumbnails = thumbnail_cache()
+        self.thumbnails.thumbnailReady.connect(self.__thumbnail_ready)
 
-    def __init__(self):
-        super().__init__()
+    def set_image(self, image_path: Optional[str]):
+        self.image_path = image_path
+        pixmap = self.thumbnails.pixmap(image_path, self.image_size)
+        self.setPixmap(pixmap if pixmap is not None else self.thumbnails.broken_image)
 
-    def mousePressEvent(self, _: QtGui.QMouseEvent) -> None:
-        self.clicked.emit()
+    def __thumbnail_ready(self, image_path: str, size: int):
+        if image_path == self.image_path and size == self.image_size:
+            self.set_image(image_path)
 
 
 class CustomLineEdit(QWidget):
@@ -281,7 +166,7 @@ class PasswordEdit(CustomLineEdit):
 
         self.setEchoMode(QLineEdit.Password)
         self.toggle_password_action = self.addAction(
-            QtGui.QIcon(f"{icons_path}/eye_open32x32.png"), QLineEdit.TrailingPosition
+            icons.icon("eye_open32x32.png"), QLineEdit.TrailingPosition
         )
         self.toggle_password_action.triggered.connect(self.on_toggle_password_action)
 
@@ -289,20 +174,22 @@ class PasswordEdit(CustomLineEdit):
         if not self.password_shown:
             self.setEchoMode(QLineEdit.Normal)
             self.password_shown = True
-            self.toggle_password_action.setIcon(QtGui.QIcon(f"{icons_path}/eye_closed32x32.png"))
+            self.toggle_password_action.setIcon(icons.icon("eye_closed32x32.png"))
         else:
             self.setEchoMode(QLineEdit.Password)
             self.password_shown = False
-            self.toggle_password_action.setIcon(QtGui.QIcon(f"{icons_path}/eye_open32x32.png"))
+            self.toggle_password_action.setIcon(icons.icon("eye_open32x32.png"))
 
 
 class UserEditItem(QWidget):
-    editUser = QtCore.Signal(User)
-    deleteUser = QtCore.Signal(User)
+    # carry a `User`
+    editUser = QtCore.Signal(object)
+    deleteUser = QtCore.Signal(object)
 
-    def __init__(self, user: User) -> None:
+    def __init__(self, user: "User") -> None:
         super().__init__()
 
+        self.user = user
         self._palette = self.palette()
 
         self.edit_btn = QPushButton()
@@ -310,11 +197,11 @@ class UserEditItem(QWidget):
 
         self.edit_btn.setToolTip("Edit user")
         self.delete_btn.setToolTip("Delete user")
-        self.edit_btn.setIcon(QtGui.QIcon(f"{icons_path}/edit32x32.png"))
-        self.delete_btn.setIcon(QtGui.QIcon(f"{icons_path}/trash32x32.png"))
+        self.edit_btn.setIcon(icons.icon("edit32x32.png"))
+        self.delete_btn.setIcon(icons.icon("trash32x32.png"))
 
-        self.edit_btn.clicked.connect(lambda: self.editUser.emit(user))
-        self.delete_btn.clicked.connect(lambda: self.deleteUser.emit(user))
+        self.edit_btn.clicked.connect(lambda: self.editUser.emit(self.user))
+        self.delete_btn.clicked.connect(lambda: self.deleteUser.emit(self.user))
 
         self.name_lbl = QLabel(user.name)
         self.email_lbl = QLabel(user.email)
@@ -338,7 +225,11 @@ class UserEditItem(QWidget):
         self.setPalette(QtGui.QPalette())
         super().leaveEvent(event)
 
-    def update_item(self, user: UserUpdate):
+    def set_user(self, user: "User"):
+        self.user = user
+        self.update_item(user)
+
+    def update_item(self, user: "UserUpdate"):
         if user.name is not None:
             self.name_lbl.setText(user.name)
 
@@ -0,0 +1,172 @@
+from decimal import Decimal
+from typing import Optional
+
+from PySide6 import QtCore
+from PySide6.QtWidgets import (QFormLayout, QHBoxLayout, QHeaderView, QLabel,
+                               QSpinBox, QTableWidget, QTableWidgetItem,
+                               QVBoxLayout, QWidget)
+
+from tim_gui.api.analytics import InventoryStats, low_stock_rows
+from tim_gui.api.models import Item
+from tim_gui.gui.store import EntityStore
+
+
+def format_value(value: Decimal) -> str:
+    return f"{value:,.2f}"
+
+
+def bucket_label(lowest: int, highest: Optional[int]) -> str:
+    if highest is None:
+        return f"{lowest}+"
+    return str(lowest) if lowest == highest else f"{lowest} - {highest}"
+
+
+def create_table(*headers: str) -> QTableWidget:
+    table = QTableWidget(0, len(headers))
+    table.setHorizontalHeaderLabels(headers)
+    table.setEditTriggers(QTableWidget.NoEditTriggers)
+    table.verticalHeader().setVisible(False)
+    table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+    return table
+
+
+def fill_table(table: QTableWidget, rows: list[list[str]]):
+    table.setRowCount(len(rows))
+    for row, values in enumerate(rows):
+        for column, value in enumerate(values):
+            table.setItem(row, column, QTableWidgetItem(value))
+
+
+class InventoryDashboard(QWidget):
+    """
+    Stock value, value per owner, quantity distribution and the items to reorder, over every loaded item.
+    The `InventoryStats` are computed the first time the dashboard is shown and then follow the changes of
+    the store, the panel is redrawn at most every `REFRESH_MS` while visible.
+    """
+
+    REFRESH_MS = 500
+    TOP_OWNERS = 20
+    LOW_STOCK_ROWS = 100
+
+    def __init__(self, store: EntityStore, parent: Optional[QWidget] = None):
+        super().__init__(parent, QtCore.Qt.Tool)
+
+        self.store = store
+        self.stats: Optional[InventoryStats] = None
+        self._changed = False
+
+        self.setWindowTitle("T.I.M - Dashboard")
+        self.resize(900, 600)
+
+        self.item_count_lbl = QLabel()
+        self.total_quantity_lbl = QLabel()
+        self.total_value_lbl = QLabel()
+        self.below_threshold_lbl = QLabel()
+        self.percentiles_lbl = QLabel()
+
+        self.threshold_sb = QSpinBox()
+        self.threshold_sb.setRange(0, 1_000_000_000)
+        self.threshold_sb.setValue(5)
+        self.threshold_sb.setToolTip("Items with fewer units than this need to be reordered")
+        self.threshold_sb.valueChanged.connect(self.__set_threshold)
+
+        summary_layout = QFormLayout()
+        summary_layout.addRow("<b>Items:</b>", self.item_count_lbl)
+        summary_layout.addRow("<b>Units in stock:</b>", self.total_quantity_lbl)
+        summary_layout.addRow("<b>Stock value:</b>", self.total_value_lbl)
+        summary_layout.addRow("<b>Reorder under:</b>", self.threshold_sb)
+        summary_layout.addRow("<b>Items to reorder:</b>", self.below_threshold_lbl)
+        summary_layout.addRow("<b>Quantity percentiles:</b>", self.percentiles_lbl)
+
+        self.buckets_table = create_table("Quantity", "Items")
+        self.owners_table = create_table("Owner", "Items value")
+        self.low_stock_table = create_table("Name", "Bar Code", "Quantity")
+
+        tables_layout = QHBoxLayout()
+        for title, table in (
+            ("Quantity distribution", self.buckets_table),
+            ("Value by owner", self.owners_table),
+            ("To reorder", self.low_stock_table),
+        ):
+            column = QVBoxLayout()
+            column.addWidget(QLabel(f"<b>{title}:</b>"))
+            column.addWidget(table)
+            tables_layout.addLayout(column)
+
+        layout = QVBoxLayout()
+        layout.addLayout(summary_layout)
+        layout.addLayout(tables_layout)
+        self.setLayout(layout)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(InventoryDashboard.REFRESH_MS)
+        self._timer.timeout.connect(self.__refresh_if_changed)
+
+    def refresh(self):
+        if self.stats is None:
+            self.stats = InventoryStats(self.store.item_columns(), self.threshold_sb.value())
+            self.store.itemsAdded.connect(self.__items_added)
+            self.store.itemChanged.connect(self.__item_changed)
+        self._changed = False
+
+        summary = self.stats.summary()
+        self.item_count_lbl.setText(str(summary.item_count))
+        self.total_quantity_lbl.setText(str(summary.total_quantity))
+        self.total_value_lbl.setText(format_value(summary.total_value))
+        self.below_threshold_lbl.setText(str(summary.below_threshold))
+        self.percentiles_lbl.setText(
+            ", ".join(f"p{percent}: {quantity}" for percent, quantity in summary.quantity_percentiles.items())
+        )
+
+        fill_table(
+            self.buckets_table,
+            [[bucket_label(lowest, highest), str(count)] for lowest, highest, count in summary.quantity_buckets],
+        )
+        fill_table(
+            self.owners_table,
+            [
+                [self.__owner_name(owner_id), format_value(value)]
+                for owner_id, value in list(summary.value_by_owner.items())[: InventoryDashboard.TOP_OWNERS]
+            ],
+        )
+
+        columns = self.store.item_columns()
+        low_stock = [
+            columns.item(row)
+            for row in low_stock_rows(columns, summary.reorder_threshold, InventoryDashboard.LOW_STOCK_ROWS)
+        ]
+        fill_table(self.low_stock_table, [[item.title, item.bar_code, str(item.quantity)] for item in low_stock])
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def __owner_name(self, owner_id: int) -> str:
+        owner = self.store.user(owner_id)
+        return owner.name if owner is not None else f"User {owner_id}"
+
+    def __set_threshold(self, threshold: int):
+        if self.stats is not None:
+            self.stats.reorder_threshold = threshold
+            self.refresh()
+
+    def __items_added(self, items: list[Item]):
+        self.stats.add_items(items)
+        self._changed = True
+
+    def __item_changed(self, old_item: Item, new_item: Optional[Item]):
+        self.stats.change_item(old_item, new_item)
+        self._changed = True
+
+    def __refresh_if_changed(self):
+        if self._changed:
+            self.refresh()
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api import TimAPI
+from tim_gui.api.errors import EventsLost, RequestError
+from tim_gui.api.models import Changes, Item, User
+from tim_gui.api.offline import OFFLINE_ERRORS
+from tim_gui.gui.store import EntityStore
+from tim_gui.gui.workers import TaskRunner
+
+
+@dataclass
+class Snapshot:
+    # the revision of the server before the items were fetched
+    revision: int
+    # the first pages of the items
+    items: list[Item]
+    # whether `items` are all of them
+    complete: bool
+    users: list[User]
+
+
+def fetch_snapshot(api: TimAPI, item_count: int, page_size: int = 1000) -> Snapshot:
+    """
+    At least the first `item_count` items and every user, as they are now
+    """
+    # the revision first, what changes while fetching is synced again from it
+    revision = api.changes().revision
+    items: list[Item] = []
+    complete = False
+    while not complete and len(items) < max(item_count, 1):
+        page = api.items(len(items), page_size)
+        items.extend(page)
+        complete = len(page) < page_size
+    return Snapshot(revision, items, complete, list(api.iter_users()))
+
+
+class DeltaSync(QtCore.QObject):
+    """
+    Keeps the loaded items and users up to date by fetching, every `SYNC_INTERVAL_MS`, only those changed
+    or deleted on the server since the last sync, `cursor` being the revision it's up to. The items not
+    loaded yet are left to the page they belong to. When the server doesn't know what changed since then
+    anymore, the loaded items are fetched again instead, the deleted ones are removed only when every
+    item was fetched.
+    """
+
+    SYNC_INTERVAL_MS = 60_000
+
+    synced = QtCore.Signal()
+    failed = QtCore.Signal(Exception)
+
+    def __init__(self, api: TimAPI, store: EntityStore, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
+        self._syncing = False
+        # the revision of the server the store is up to, unknown until the first sync
+        self.cursor: Optional[int] = None
+        # whether the server has "/changes/", unknown until it's tried
+        self.supported: Optional[bool] = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(DeltaSync.SYNC_INTERVAL_MS)
+        self._timer.timeout.connect(self.sync)
+
+    def start(self):
+        """
+        Syncs right away, which only fetches the current revision, then periodically
+        """
+        self._timer.start()
+        self.sync()
+
+    def stop(self):
+        self._timer.stop()
+
+    def sync(self):
+        if self._syncing or self.supported is False:
+            return
+
+        self._syncing = True
+        self._tasks.submit(self._api.changes, self.cursor, on_result=self.__synced, on_error=self.__sync_failed)
+
+    def __synced(self, changes: Changes):
+        self._syncing = False
+        self.supported = True
+
+        for id in changes.deleted_item_ids:
+            self._store.remove_item(id)
+        self._store.update_items(changes.items)
+        for id in changes.deleted_user_ids:
+            self._store.remove_user(id)
+        self._store.update_users(changes.users)
+
+        self.cursor = changes.revision
+        self.synced.emit()
+
+    def __sync_failed(self, error: Exception):
+        if isinstance(error, EventsLost):
+            self._tasks.submit(
+                fetch_snapshot,
+                self._api,
+                self._store.item_count(),
+                on_result=self.__snapshot_fetched,
+                on_error=self.__sync_failed,
+            )
+            return
+
+        self._syncing = False
+        if isinstance(error, RequestError) and error.status_code == 404:
+            # the server can't tell what changed, the items are refreshed as before
+            self.supported = False
+            self.stop()
+        elif not isinstance(error, OFFLINE_ERRORS):
+            self.failed.emit(error)
+
+    def __snapshot_fetched(self, snapshot: Snapshot):
+        self._syncing = False
+
+        # the order of the pages isn't guaranteed, only a complete snapshot tells which items were deleted
+        if snapshot.complete:
+            fetched_ids = {item.id for item in snapshot.items}
+            for id in [id for id in self._store.item_columns().ids() if id not in fetched_ids]:
+                self._store.remove_item(id)
+        self._store.put_items(snapshot.items)
+
+        user_ids = {user.id for user in snapshot.users}
+        for user in self._store.users():
+            if user.id not in user_ids:
+                self._store.remove_user(user.id)
+        self._store.put_users(snapshot.users, complete=True)
+
+        self.cursor = snapshot.revision
+        self.synced.emit()
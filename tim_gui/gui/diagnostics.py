@@ -0,0 +1,105 @@
+from typing import Optional
+
+from PySide6 import QtCore
+from PySide6.QtWidgets import (QHeaderView, QPushButton, QTableWidget,
+                               QTableWidgetItem, QVBoxLayout, QWidget)
+
+from tim_gui.api.metrics import HistogramSink
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class DiagnosticsPanel(QWidget):
+    """
+    Table with the latency percentiles, phases, status codes and sizes of the requests made to every
+    endpoint. It is refreshed every `REFRESH_MS` while visible.
+    """
+
+    REFRESH_MS = 1000
+    COLUMNS = [
+        "Endpoint",
+        "Calls",
+        "Errors",
+        "Status",
+        "p50",
+        "p95",
+        "p99",
+        "Connect p50",
+        "Server p50",
+        "Download p50",
+        "Decode p50",
+        "Validation p50",
+        "Sent",
+        "Received",
+    ]
+
+    def __init__(self, histogram: HistogramSink, parent: Optional[QWidget] = None):
+        super().__init__(parent, QtCore.Qt.Tool)
+
+        self.histogram = histogram
+
+        self.setWindowTitle("T.I.M - Diagnostics")
+        self.resize(1100, 300)
+
+        self.table = QTableWidget(0, len(DiagnosticsPanel.COLUMNS))
+        self.table.setHorizontalHeaderLabels(DiagnosticsPanel.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+        self.clear_btn = QPushButton("Clear")
+        self.clear_btn.clicked.connect(self.__clear)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addWidget(self.clear_btn, alignment=QtCore.Qt.AlignRight)
+        self.setLayout(layout)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(DiagnosticsPanel.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        endpoints = sorted(self.histogram.endpoints().items(), key=lambda entry: entry[0][1])
+        self.table.setRowCount(len(endpoints))
+
+        for row, ((method, endpoint), stats) in enumerate(endpoints):
+            status = ", ".join(f"{code}: {count}" for code, count in sorted(stats.status_codes.items()))
+            values = [
+                f"{method} {endpoint}",
+                str(stats.calls),
+                str(stats.errors),
+                status,
+                *(f"{stats.percentile('total', percent) * 1000:.1f} ms" for percent in (50, 95, 99)),
+                *(
+                    f"{stats.percentile(phase, 50) * 1000:.1f} ms"
+                    for phase in ("connect", "server", "download", "decode", "validation")
+                ),
+                format_bytes(stats.request_bytes),
+                format_bytes(stats.response_bytes),
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def __clear(self):
+        self.histogram.clear()
+        self.refresh()
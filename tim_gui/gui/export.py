@@ -0,0 +1,50 @@
+import threading
+from pathlib import Path
+from typing import Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api import TimAPI
+from tim_gui.api.export import export_items
+from tim_gui.gui.workers import TaskRunner
+
+
+class ItemExport(QtCore.QObject):
+    """
+    Exports the whole inventory to a file in the background with `export_items`
+    """
+
+    progress = QtCore.Signal(int)
+    finished = QtCore.Signal(int)
+    failed = QtCore.Signal(Exception)
+
+    def __init__(
+        self, api: TimAPI, path: Path, format: Optional[str] = None, parent: Optional[QtCore.QObject] = None
+    ):
+        super().__init__(parent)
+
+        self._api = api
+        self.path = path
+        self.format = format
+        self._cancelled = threading.Event()
+        self._tasks = TaskRunner(self)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self):
+        self._tasks.submit(
+            export_items,
+            self._api,
+            self.path,
+            self.format,
+            # emitted from the worker thread, delivered in the GUI thread
+            on_progress=self.progress.emit,
+            cancelled=self._cancelled,
+            on_result=self.finished.emit,
+            on_error=self.failed.emit,
+        )
+
+    def cancel(self):
+        self._cancelled.set()
@@ -0,0 +1,54 @@
+import atexit
+from functools import cache
+
+from PySide6 import QtGui
+
+from tim_gui.gui import resources_rc  # noqa: F401 registers the embedded resources
+
+ICON_NAMES = (
+    "broken-image32x32.png",
+    "close32x32.png",
+    "edit32x32.png",
+    "eye_closed32x32.png",
+    "eye_open32x32.png",
+    "gear32x32.png",
+    "plus32x32.png",
+    "tick32x32.png",
+    "trash32x32.png",
+)
+
+
+def resource_path(name: str) -> str:
+    return f":/icons/{name}"
+
+
+@cache
+def icon(name: str) -> QtGui.QIcon:
+    """
+    Icon from the embedded resources, loaded once per process
+    """
+    return QtGui.QIcon(pixmap(name))
+
+
+@cache
+def pixmap(name: str) -> QtGui.QPixmap:
+    pixmap = QtGui.QPixmap(resource_path(name))
+    if pixmap.isNull():
+        raise ValueError(f"unknown icon: {name}")
+    return pixmap
+
+
+def preload():
+    for name in ICON_NAMES:
+        icon(name)
+
+
+def clear():
+    """
+    Drops the loaded icons, they must not outlive the QApplication
+    """
+    icon.cache_clear()
+    pixmap.cache_clear()
+
+
+atexit.register(clear)
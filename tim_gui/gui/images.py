@@ -0,0 +1,280 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from PySide6 import QtCore, QtGui
+
+from tim_gui.gui import icons
+
+IMAGE_MAX_THREADS = 2
+
+_image_thread_pool: Optional[QtCore.QThreadPool] = None
+_thumbnail_cache: Optional["ThumbnailCache"] = None
+
+
+def image_thread_pool() -> QtCore.QThreadPool:
+    """
+    Thread pool used to decode images, kept apart from the API one so decoding never delays a request
+    """
+    global _image_thread_pool
+    if _image_thread_pool is None:
+        _image_thread_pool = QtCore.QThreadPool()
+        _image_thread_pool.setMaxThreadCount(IMAGE_MAX_THREADS)
+    return _image_thread_pool
+
+
+def thumbnail_cache() -> "ThumbnailCache":
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache(QtCore.QCoreApplication.instance())
+    return _thumbnail_cache
+
+
+def default_disk_cache_dir() -> Path:
+    cache_location = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+    return Path(cache_location) / "thumbnails"
+
+
+def modification_time(image_path: str) -> int:
+    """
+    In nanoseconds, 0 when the image can't be read
+    """
+    try:
+        return os.stat(image_path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def decode_thumbnail(image_path: str, size: int, disk_cache_dir: Optional[Path]) -> tuple[int, QtGui.QImage]:
+    """
+    Decodes `image_path` already scaled down to fit in `size` x `size`, going through the disk cache.
+    Safe to call from any thread, returns the modification time of the image and the decoded image
+    (null if it couldn't be read).
+    """
+    mtime = modification_time(image_path)
+    if not mtime:
+        return 0, QtGui.QImage()
+
+    cached_path = None
+    if disk_cache_dir is not None:
+        key = hashlib.sha1(f"{image_path}:{mtime}:{size}".encode()).hexdigest()
+        cached_path = disk_cache_dir / f"{key}.png"
+        if cached_path.exists():
+            image = QtGui.QImage(str(cached_path))
+            if not image.isNull():
+                # the modification time of the cached thumbnails tells which ones were used last
+                try:
+                    os.utime(cached_path)
+                except OSError:
+                    pass
+                return mtime, image
+
+    reader = QtGui.QImageReader(image_path)
+    reader.setAutoTransform(True)
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > size or original_size.height() > size):
+        reader.setScaledSize(original_size.scaled(size, size, QtCore.Qt.KeepAspectRatio))
+    image = reader.read()
+
+    if cached_path is not None and not image.isNull():
+        disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        image.save(str(cached_path), "PNG")
+
+    return mtime, image
+
+
+def prune_disk_cache(disk_cache_dir: Path, max_bytes: int):
+    """
+    Deletes the thumbnails used the longest time ago until the disk cache takes up to `max_bytes`
+    """
+    try:
+        entries = [(entry.stat(), entry) for entry in os.scandir(disk_cache_dir) if entry.name.endswith(".png")]
+    except OSError:
+        return
+
+    total = sum(stat.st_size for stat, _ in entries)
+    for stat, entry in sorted(entries, key=lambda entry: entry[0].st_mtime_ns):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(entry.path)
+        except OSError:
+            continue
+        total -= stat.st_size
+
+
+class _DecodeSignals(QtCore.QObject):
+    # the modification time goes as an object, nanoseconds overflow a C++ int
+    decoded = QtCore.Signal(str, int, object, QtGui.QImage)
+    checked = QtCore.Signal(str, object)
+
+
+class _DecodeJob(QtCore.QRunnable):
+    def __init__(self, image_path: str, size: int, disk_cache_dir: Optional[Path], signals: _DecodeSignals):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.disk_cache_dir = disk_cache_dir
+        self.signals = signals
+
+    def run(self):
+        mtime, image = decode_thumbnail(self.image_path, self.size, self.disk_cache_dir)
+        self.signals.decoded.emit(self.image_path, self.size, mtime, image)
+
+
+class _CheckJob(QtCore.QRunnable):
+    def __init__(self, image_path: str, signals: _DecodeSignals):
+        super().__init__()
+        self.image_path = image_path
+        self.signals = signals
+
+    def run(self):
+        self.signals.checked.emit(self.image_path, modification_time(self.image_path))
+
+
+class _PruneJob(QtCore.QRunnable):
+    def __init__(self, disk_cache_dir: Path, max_bytes: int):
+        super().__init__()
+        self.disk_cache_dir = disk_cache_dir
+        self.max_bytes = max_bytes
+
+    def run(self):
+        prune_disk_cache(self.disk_cache_dir, self.max_bytes)
+
+
+class ThumbnailCache(QtCore.QObject):
+    """
+    Scaled down versions of the item images. The images are decoded at the requested size on worker
+    threads, kept in a memory LRU bounded by `max_bytes` and persisted to a disk cache bounded by
+    `max_disk_bytes`, so they are decoded only once across restarts. `pixmap` never blocks, nor touches
+    the disk: when the thumbnail isn't ready it schedules the decoding and `thumbnailReady` is emitted
+    once it is. The images shown are checked for modifications on the worker threads at most every
+    `RECHECK_INTERVAL_MS`, a modified image keeps its old thumbnail until the new one is decoded.
+    """
+
+    # the disk cache is pruned again after this many thumbnails were decoded
+    PRUNE_INTERVAL = 256
+    RECHECK_INTERVAL_MS = 5000
+
+    thumbnailReady = QtCore.Signal(str, int)
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_cache_dir: Optional[Path] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        use_disk_cache: bool = True,
+        pool: Optional[QtCore.QThreadPool] = None,
+    ):
+        super().__init__(parent)
+
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_cache_dir = None
+        if use_disk_cache:
+            self.disk_cache_dir = disk_cache_dir if disk_cache_dir is not None else default_disk_cache_dir()
+
+        self._pool = pool if pool is not None else image_thread_pool()
+        self._pixmaps: OrderedDict[tuple[str, int, int], QtGui.QPixmap] = OrderedDict()
+        self._bytes = 0
+        # modification time of each image when it was decoded
+        self._mtimes: dict[str, int] = {}
+        # when each image was last checked for modifications, in monotonic milliseconds
+        self._checked: dict[str, float] = {}
+        self._pending: set[tuple[str, int]] = set()
+        self._decoded_since_prune = 0
+        self._broken_image = icons.pixmap("broken-image32x32.png")
+
+        # not parented to the cache, the jobs still running keep it alive if the cache is deleted before them
+        self._signals = _DecodeSignals()
+        self._signals.decoded.connect(self.__decoded)
+        self._signals.checked.connect(self.__checked)
+
+        self.__prune_disk_cache()
+
+    @property
+    def broken_image(self) -> QtGui.QPixmap:
+        return self._broken_image
+
+    def pixmap(self, image_path: Optional[str], size: int) -> Optional[QtGui.QPixmap]:
+        if image_path is None:
+            return self._broken_image
+
+        key = (image_path, self._mtimes.get(image_path), size)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self.__check(image_path)
+            return pixmap
+
+        self.request(image_path, size)
+        return None
+
+    def request(self, image_path: str, size: int):
+        if (image_path, size) in self._pending:
+            return
+
+        self._pending.add((image_path, size))
+        self._pool.start(_DecodeJob(image_path, size, self.disk_cache_dir, self._signals))
+
+    def invalidate(self, image_path: str):
+        self._mtimes.pop(image_path, None)
+        self._checked.pop(image_path, None)
+        for key in [key for key in self._pixmaps if key[0] == image_path]:
+            self.__evict(key)
+
+    def __check(self, image_path: str):
+        now = time.monotonic() * 1000
+        if now - self._checked.get(image_path, 0) < self.RECHECK_INTERVAL_MS:
+            return
+
+        self._checked[image_path] = now
+        self._pool.start(_CheckJob(image_path, self._signals))
+
+    def __checked(self, image_path: str, mtime: int):
+        if image_path not in self._mtimes or self._mtimes[image_path] == mtime:
+            return
+
+        # modified since it was decoded, the sizes shown are decoded again
+        for key in [key for key in self._pixmaps if key[0] == image_path]:
+            self.request(image_path, key[2])
+
+    def __decoded(self, image_path: str, size: int, mtime: int, image: QtGui.QImage):
+        self._pending.discard((image_path, size))
+
+        pixmap = self._broken_image if image.isNull() else QtGui.QPixmap.fromImage(image)
+        key = (image_path, mtime, size)
+        # the thumbnails of an older version of the image, or this one decoded again
+        for old_key in [old_key for old_key in self._pixmaps if old_key[0] == image_path]:
+            if old_key[1] != mtime or old_key == key:
+                self.__evict(old_key)
+
+        self._mtimes[image_path] = mtime
+        self._checked[image_path] = time.monotonic() * 1000
+        self._pixmaps[key] = pixmap
+        self._bytes += self.__cost(pixmap)
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            self.__evict(next(iter(self._pixmaps)))
+
+        self._decoded_since_prune += 1
+        if self._decoded_since_prune >= ThumbnailCache.PRUNE_INTERVAL:
+            self.__prune_disk_cache()
+
+        self.thumbnailReady.emit(image_path, size)
+
+    def __prune_disk_cache(self):
+        self._decoded_since_prune = 0
+        if self.disk_cache_dir is not None:
+            self._pool.start(_PruneJob(self.disk_cache_dir, self.max_disk_bytes))
+
+    def __evict(self, key: tuple[str, int, int]):
+        pixmap = self._pixmaps.pop(key)
+        self._bytes -= self.__cost(pixmap)
+
+    @staticmethod
+    def __cost(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
@@ -0,0 +1,684 @@
+import atexit
+from decimal import Decimal
+from typing import Any, Optional, Union
+
+import shiboken6
+from PySide6 import QtCore, QtGui
+from PySide6.QtWidgets import (QAbstractItemView, QComboBox, QDoubleSpinBox,
+                               QHBoxLayout, QLabel, QListView, QSpinBox,
+                               QStyle, QStyledItemDelegate,
+                               QStyleOptionViewItem, QWidget)
+
+from tim_gui.api.columns import ItemColumns
+from tim_gui.api.models import Item, User
+from tim_gui.api.query import ItemQuery, SortKey
+from tim_gui.gui.chunking import ChunkedFeeder
+from tim_gui.gui.images import ThumbnailCache, thumbnail_cache
+from tim_gui.gui.utils import center_window, create_widgets_with_layout
+
+THUMBNAIL_SIZE = 64
+PREVIEW_SIZE = 256
+
+_shared_preview: Optional["PreviewImage"] = None
+
+
+class ItemsModel(QtCore.QAbstractListModel):
+    """
+    The rows are kept in `ItemColumns`, the `Item` of a row is only built when asked for with `ItemRole`
+    """
+
+    ItemRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, items: Optional[list[Item]] = None, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._items = ItemColumns()
+        self._rows_by_id: dict[int, int] = {}
+
+        if items:
+            self.add_items(items)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == ItemsModel.ItemRole:
+            return self._items.item(row)
+        if role == QtCore.Qt.DisplayRole:
+            return self._items.title(row)
+        if role == QtCore.Qt.ToolTipRole:
+            return self._items.description(row)
+        return None
+
+    def item(self, row: int) -> Item:
+        return self._items.item(row)
+
+    def row_of(self, item_id: int) -> Optional[int]:
+        return self._rows_by_id.get(item_id)
+
+    def rows_by_id(self) -> dict[int, int]:
+        return self._rows_by_id
+
+    def columns(self) -> ItemColumns:
+        return self._items
+
+    def add_items(self, items: list[Item]):
+        items = [item for item in items if item.id not in self._rows_by_id]
+        if not items:
+            return
+
+        first = len(self._items)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(items) - 1)
+        for row, item in enumerate(items, first):
+            self._items.append(item)
+            self._rows_by_id[item.id] = row
+        self.endInsertRows()
+
+    def insert_item(self, row: int, item: Item):
+        # an item already listed, e.g. loaded with its page meanwhile, is moved to `row`
+        if self._rows_by_id.get(item.id) == row:
+            self.update_item(item)
+            return
+        self.remove_item(item.id)
+        row = min(row, len(self._items))
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._items.insert(row, item)
+        self.__reindex(row)
+        self.endInsertRows()
+
+    def update_item(self, item: Item):
+        row = self._rows_by_id.get(item.id)
+        if row is None:
+            return
+
+        self._items.set(row, item)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_item(self, item_id: int):
+        row = self._rows_by_id.get(item_id)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._items.delete(row)
+        del self._rows_by_id[item_id]
+        self.__reindex(row)
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._items.clear()
+        self._rows_by_id.clear()
+        self.endResetModel()
+
+    def __reindex(self, start: int):
+        ids = self._items.ids()
+        for row in range(start, len(ids)):
+            self._rows_by_id[ids[row]] = row
+
+
+class ItemsProxyModel(QtCore.QAbstractProxyModel):
+    """
+    Flat proxy over an `ItemsModel` that shows only the items whose id is in the filter and that match
+    the `ItemQuery`, in its order. The row mapping is a plain list built from the filter and sorted on
+    key columns kept per source row, so re-sorting never calls back into Python once per comparison.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._filter_ids: Optional[set[int]] = None
+        self._query = ItemQuery()
+        # sort field -> the key of every source row, built the first time the rows are sorted by it
+        self._sort_keys: dict[str, list[Any]] = {}
+        # `None` while nothing is filtered or sorted, the rows are then mapped one to one
+        self._proxy_to_source: Optional[list[int]] = None
+        self._source_to_proxy: dict[int, int] = {}
+
+    def setSourceModel(self, model: ItemsModel):
+        self.beginResetModel()
+        super().setSourceModel(model)
+
+        model.rowsAboutToBeInserted.connect(self.__source_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self.__source_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self.__source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self.__source_rows_removed)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self.__source_model_reset)
+        model.dataChanged.connect(self.__source_data_changed)
+
+        self.__rebuild()
+        self.endResetModel()
+
+    def sourceModel(self) -> ItemsModel:
+        return super().sourceModel()
+
+    def is_filtered(self) -> bool:
+        return self.is_searching() or self._query.is_filtered()
+
+    def is_searching(self) -> bool:
+        return self._filter_ids is not None
+
+    def set_filter_ids(self, ids: Optional[set[int]]):
+        self.beginResetModel()
+        self._filter_ids = ids
+        self.__rebuild()
+        self.endResetModel()
+
+    def query(self) -> ItemQuery:
+        return self._query
+
+    def set_query(self, query: ItemQuery):
+        self._query = query
+        self.__relayout()
+
+    def index(self, row: int, column: int = 0, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if parent.isValid() or column != 0 or not 0 <= row < self.rowCount():
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: Optional[QtCore.QModelIndex] = None):
+        if index is None:
+            return QtCore.QObject.parent(self)
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self._proxy_to_source is None:
+            return self.sourceModel().rowCount()
+        return len(self._proxy_to_source)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self.rowCount() > 0
+
+    def mapToSource(self, proxy_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not proxy_index.isValid():
+            return QtCore.QModelIndex()
+
+        row = proxy_index.row()
+        if self._proxy_to_source is not None:
+            row = self._proxy_to_source[row]
+        return self.sourceModel().index(row)
+
+    def mapFromSource(self, source_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+
+        row = source_index.row()
+        if self._proxy_to_source is not None:
+            row = self._source_to_proxy.get(row)
+            if row is None:
+                return QtCore.QModelIndex()
+        return self.createIndex(row, 0)
+
+    def __rebuild(self):
+        model = self.sourceModel()
+        if model is None or (self._filter_ids is None and self._query.is_empty()):
+            self._proxy_to_source = None
+            self._source_to_proxy = {}
+            return
+
+        if self._filter_ids is None:
+            rows = list(range(model.rowCount()))
+        else:
+            rows = sorted(row for row in map(model.rows_by_id().get, self._filter_ids) if row is not None)
+        if self._query.is_filtered():
+            rows = model.columns().matching_rows(self._query, rows)
+        # a stable sort per key, from the last one to the first, the rows equal on every key stay in order
+        for key in reversed(self._query.sort):
+            rows.sort(key=self.__sort_keys(key.field).__getitem__, reverse=key.descending)
+
+        self._proxy_to_source = rows
+        self._source_to_proxy = dict(zip(rows, range(len(rows))))
+
+    def __sort_keys(self, field: str) -> list[Any]:
+        keys = self._sort_keys.get(field)
+        if keys is None:
+            keys = self._sort_keys[field] = self.sourceModel().columns().sort_keys(field)
+        return keys
+
+    def __relayout(self):
+        """
+        Rebuilds the mapping keeping the selection and the current item, as far as they're still shown
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent_indexes = self.persistentIndexList()
+        source_rows = [self.mapToSource(index).row() for index in persistent_indexes]
+        self.__rebuild()
+        self.changePersistentIndexList(
+            persistent_indexes, [self.mapFromSource(self.sourceModel().index(row)) for row in source_rows]
+        )
+        self.layoutChanged.emit()
+
+    def __source_rows_about_to_be_inserted(self, parent: QtCore.QModelIndex, first: int, last: int):
+        if self._proxy_to_source is None:
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def __source_rows_about_to_be_removed(self, parent: QtCore.QModelIndex, first: int, last: int):
+        if self._proxy_to_source is None:
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def __source_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int):
+        columns = self.sourceModel().columns()
+        for field, keys in self._sort_keys.items():
+            keys[first:first] = [columns.sort_key(field, row) for row in range(first, last + 1)]
+
+        if self._proxy_to_source is None:
+            self.endInsertRows()
+        else:
+            self.__rebuild()
+            self.endResetModel()
+
+    def __source_rows_removed(self, parent: QtCore.QModelIndex, first: int, last: int):
+        for keys in self._sort_keys.values():
+            del keys[first : last + 1]
+
+        if self._proxy_to_source is None:
+            self.endRemoveRows()
+        else:
+            self.__rebuild()
+            self.endResetModel()
+
+    def __source_model_reset(self):
+        self._sort_keys.clear()
+        self.__rebuild()
+        self.endResetModel()
+
+    def __source_data_changed(self, top_left: QtCore.QModelIndex, bottom_right: QtCore.QModelIndex, roles=()):
+        columns = self.sourceModel().columns()
+        for field, keys in self._sort_keys.items():
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                keys[row] = columns.sort_key(field, row)
+        if not self._query.is_empty():
+            # the item may have moved or stopped matching
+            self.__relayout()
+
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = self.mapFromSource(self.sourceModel().index(row))
+            if index.isValid():
+                self.dataChanged.emit(index, index, roles)
+
+
+class ItemDelegate(QStyledItemDelegate):
+    MARGIN = 9
+    ROW_HEIGHT = THUMBNAIL_SIZE + 2 * MARGIN
+    COLUMNS = (
+        ("Name:", lambda item: item.title),
+        ("Bar Code:", lambda item: item.bar_code),
+        ("Price:", lambda item: str(item.price)),
+        ("Quantity:", lambda item: str(item.quantity)),
+    )
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, thumbnails: Optional[ThumbnailCache] = None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails if thumbnails is not None else thumbnail_cache()
+
+    @staticmethod
+    def thumbnail_rect(row_rect: QtCore.QRect) -> QtCore.QRect:
+        return QtCore.QRect(
+            row_rect.left() + ItemDelegate.MARGIN,
+            row_rect.top() + ItemDelegate.MARGIN,
+            THUMBNAIL_SIZE,
+            THUMBNAIL_SIZE,
+        )
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return QtCore.QSize(option.rect.width(), ItemDelegate.ROW_HEIGHT)
+
+    def paint(self, painter: QtGui.QPainter, option: QStyleOptionViewItem, index: QtCore.QModelIndex):
+        item: Item = index.data(ItemsModel.ItemRole)
+        rect = option.rect
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, QtCore.Qt.green)
+        elif option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, QtCore.Qt.darkGray)
+
+        thumbnail_rect = self.thumbnail_rect(rect)
+        pixmap = self.thumbnail(item)
+        if not pixmap.isNull():
+            pixmap_rect = QtCore.QRect(QtCore.QPoint(0, 0), pixmap.size() / pixmap.devicePixelRatio())
+            pixmap_rect.moveCenter(thumbnail_rect.center())
+            painter.drawPixmap(pixmap_rect, pixmap)
+
+        left = thumbnail_rect.right() + ItemDelegate.MARGIN
+        column_width = max(0, (rect.right() - left - ItemDelegate.MARGIN) // len(ItemDelegate.COLUMNS))
+        line_height = option.fontMetrics.height()
+        top = rect.top() + (rect.height() - 2 * line_height) // 2
+
+        bold_font = QtGui.QFont(option.font)
+        bold_font.setBold(True)
+        bold_metrics = QtGui.QFontMetrics(bold_font)
+
+        painter.setPen(option.palette.color(QtGui.QPalette.Text))
+        for column, (header, value) in enumerate(ItemDelegate.COLUMNS):
+            x = left + column * column_width
+            painter.setFont(bold_font)
+            painter.drawText(
+                QtCore.QRect(x, top, column_width, line_height),
+                QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                bold_metrics.elidedText(header, QtCore.Qt.ElideRight, column_width),
+            )
+            painter.setFont(option.font)
+            painter.drawText(
+                QtCore.QRect(x, top + line_height, column_width, line_height),
+                QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                option.fontMetrics.elidedText(value(item), QtCore.Qt.ElideRight, column_width),
+            )
+        painter.restore()
+
+    def thumbnail(self, item: Item) -> QtGui.QPixmap:
+        # the thumbnail is decoded in the background, the row is repainted once it is ready
+        pixmap = self.thumbnails.pixmap(item.image_path, THUMBNAIL_SIZE)
+        return pixmap if pixmap is not None else QtGui.QPixmap()
+
+
+def shared_preview() -> "PreviewImage":
+    """
+    The hover preview popup used by every list, created the first time an image is hovered
+    """
+    global _shared_preview
+    if _shared_preview is None:
+        _shared_preview = PreviewImage()
+        QtCore.QCoreApplication.instance().aboutToQuit.connect(_destroy_shared_preview)
+        # a top-level widget must not outlive the QApplication
+        atexit.register(_destroy_shared_preview)
+    return _shared_preview
+
+
+def shared_preview_exists() -> bool:
+    return _shared_preview is not None
+
+
+def _destroy_shared_preview():
+    global _shared_preview
+    if _shared_preview is not None and shiboken6.isValid(_shared_preview):
+        shiboken6.delete(_shared_preview)
+    _shared_preview = None
+
+
+class PreviewImage(QWidget):
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.setWindowFlags(QtCore.Qt.Tool | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
+
+        self.preview_lbl = QLabel()
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.preview_lbl)
+
+        self.setLayout(layout)
+
+    def show_image(self, pixmap: QtGui.QPixmap):
+        self.preview_lbl.setPixmap(pixmap)
+        self.adjustSize()
+        center_window(self)
+        self.show()
+
+
+class ItemsList(QListView):
+    """
+    Inventory list backed by an `ItemsModel`, seen through an `ItemsProxyModel` for filtering. Rows are
+    painted by `ItemDelegate`, so the widget count stays constant no matter how many items are loaded.
+    Large pages are added to the model in chunks by a `ChunkedFeeder`, `rowsLoaded` is emitted once
+    every row is in.
+    """
+
+    reachedEnd = QtCore.Signal()
+    nearEnd = QtCore.Signal()
+    itemClicked = QtCore.Signal(Item)
+    rowsLoaded = QtCore.Signal()
+
+    # how many rows before the end of the list `nearEnd` starts being emitted
+    NEAR_END_ROWS = 50
+
+    # rows laid out per event loop iteration, keeps a model reset with lots of rows from blocking
+    LAYOUT_BATCH_SIZE = 500
+
+    def __init__(self, items: list[Item]):
+        super().__init__()
+
+        self.items_model = ItemsModel(parent=self)
+        self._feeder = ChunkedFeeder(self.items_model.add_items, parent=self)
+        self._feeder.finished.connect(self.rowsLoaded)
+        self.proxy_model = ItemsProxyModel(self)
+        self.proxy_model.setSourceModel(self.items_model)
+        self.setModel(self.proxy_model)
+        self.thumbnails = thumbnail_cache()
+        self.thumbnails.thumbnailReady.connect(self.__thumbnail_ready)
+        self.setItemDelegate(ItemDelegate(self, self.thumbnails))
+
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(ItemsList.LAYOUT_BATCH_SIZE)
+        # Ctrl and Shift select several items for the bulk operations
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+
+        self._previewed_index = QtCore.QPersistentModelIndex()
+
+        self.clicked.connect(self.__clicked_item)
+        self.verticalScrollBar().valueChanged.connect(self.__has_scroll_reached_end)
+        self.verticalScrollBar().valueChanged.connect(self.__is_near_end)
+        self.verticalScrollBar().rangeChanged.connect(self.__is_near_end)
+
+        self.add_items(items)
+
+    def __len__(self):
+        return self.items_model.rowCount()
+
+    def __has_scroll_reached_end(self, value):
+        # the results of a search are every matching item loaded, scrolling through them loads nothing, but
+        # more pages may hold more items matching the query
+        if value == self.verticalScrollBar().maximum() and not self.proxy_model.is_searching():
+            self.reachedEnd.emit()
+
+    def __is_near_end(self, *_):
+        if self.proxy_model.is_searching():
+            return
+
+        scroll_bar = self.verticalScrollBar()
+        remaining_rows = (scroll_bar.maximum() - scroll_bar.value()) / ItemDelegate.ROW_HEIGHT
+        if remaining_rows <= ItemsList.NEAR_END_ROWS:
+            self.nearEnd.emit()
+
+    def set_filter(self, ids: Optional[set[int]]):
+        """
+        Shows only the items whose id is in `ids`, or every item if `ids` is `None`
+        """
+        self.proxy_model.set_filter_ids(ids)
+
+    def query(self) -> ItemQuery:
+        return self.proxy_model.query()
+
+    def set_query(self, query: ItemQuery):
+        """
+        Sorts and filters the loaded items in memory, along with the filter of `set_filter`
+        """
+        self.proxy_model.set_query(query)
+
+    def pending(self) -> int:
+        """
+        How many of the items added aren't rows yet
+        """
+        return self._feeder.pending()
+
+    def flush(self):
+        self._feeder.flush()
+
+    def add_items(self, items: list[Item]):
+        self._feeder.add(items)
+
+    def insert_item(self, index: int, item: Item):
+        self.flush()
+        self.items_model.insert_item(index, item)
+
+    def add_item(self, item: Item):
+        self._feeder.add([item])
+
+    def update_item(self, item: Item):
+        self.flush()
+        self.items_model.update_item(item)
+
+    def remove_item(self, item_id: int):
+        self.flush()
+        self.items_model.remove_item(item_id)
+
+    def selected_item(self) -> Optional[Item]:
+        indexes = self.selectionModel().selectedIndexes()
+        return indexes[0].data(ItemsModel.ItemRole) if indexes else None
+
+    def selected_items(self) -> list[Item]:
+        return [index.data(ItemsModel.ItemRole) for index in self.selectionModel().selectedIndexes()]
+
+    def remove_selected_item(self):
+        item = self.selected_item()
+        if item is not None:
+            self.remove_item(item.id)
+
+    def clear_selection(self):
+        self.clearSelection()
+
+    def __clicked_item(self, index: QtCore.QModelIndex):
+        # a click extending the selection doesn't open the item
+        if not QtGui.QGuiApplication.keyboardModifiers() & (QtCore.Qt.ControlModifier | QtCore.Qt.ShiftModifier):
+            self.itemClicked.emit(index.data(ItemsModel.ItemRole))
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent):
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        if index.isValid() and ItemDelegate.thumbnail_rect(self.visualRect(index)).contains(pos):
+            if QtCore.QModelIndex(self._previewed_index) != index:
+                self._previewed_index = QtCore.QPersistentModelIndex(index)
+                self.__show_preview()
+        else:
+            self.__hide_preview()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event: QtCore.QEvent):
+        self.__hide_preview()
+        super().leaveEvent(event)
+
+    def hideEvent(self, event: QtGui.QHideEvent):
+        self.__hide_preview()
+        super().hideEvent(event)
+
+    def __show_preview(self):
+        item: Item = QtCore.QModelIndex(self._previewed_index).data(ItemsModel.ItemRole)
+        pixmap = self.thumbnails.pixmap(item.image_path, PREVIEW_SIZE)
+        if pixmap is not None:
+            shared_preview().show_image(pixmap)
+
+    def __thumbnail_ready(self, image_path: str, size: int):
+        if size == THUMBNAIL_SIZE:
+            self.viewport().update()
+        elif size == PREVIEW_SIZE and self._previewed_index.isValid():
+            item: Item = QtCore.QModelIndex(self._previewed_index).data(ItemsModel.ItemRole)
+            if item.image_path == image_path:
+                self.__show_preview()
+
+    def __hide_preview(self):
+        if self._previewed_index.isValid() and shared_preview_exists():
+            shared_preview().close()
+        self._previewed_index = QtCore.QPersistentModelIndex()
+
+
+class ItemQueryBar(QWidget):
+    """
+    Sort and range filters of the items list, `queryChanged` carries the `ItemQuery` on every change
+    """
+
+    queryChanged = QtCore.Signal(ItemQuery)
+
+    SORT_OPTIONS = (
+        ("Name (A-Z)", SortKey("title")),
+        ("Name (Z-A)", SortKey("title", True)),
+        ("Price (lowest)", SortKey("price")),
+        ("Price (highest)", SortKey("price", True)),
+        ("Quantity (lowest)", SortKey("quantity")),
+        ("Quantity (highest)", SortKey("quantity", True)),
+        ("Bar Code", SortKey("bar_code")),
+    )
+    # the value of the spin boxes shown as "Any", leaving that bound open
+    NO_BOUND = -1
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.sort_cbs = (QComboBox(), QComboBox())
+        for sort_cb, placeholder in zip(self.sort_cbs, ("Unsorted", "Then unsorted")):
+            sort_cb.addItem(placeholder, None)
+            for text, key in ItemQueryBar.SORT_OPTIONS:
+                sort_cb.addItem(text, key)
+            sort_cb.currentIndexChanged.connect(self.__changed)
+
+        self.min_price_sb, self.max_price_sb = QDoubleSpinBox(), QDoubleSpinBox()
+        self.min_quantity_sb, self.max_quantity_sb = QSpinBox(), QSpinBox()
+        for spin_box in (self.min_price_sb, self.max_price_sb, self.min_quantity_sb, self.max_quantity_sb):
+            spin_box.setRange(ItemQueryBar.NO_BOUND, 1_000_000_000)
+            spin_box.setValue(ItemQueryBar.NO_BOUND)
+            spin_box.setSpecialValueText("Any")
+            spin_box.valueChanged.connect(self.__changed)
+
+        self.owner_cb = QComboBox()
+        self.owner_cb.addItem("Any owner", None)
+        self.owner_cb.currentIndexChanged.connect(self.__changed)
+
+        self.setLayout(
+            create_widgets_with_layout(
+                QHBoxLayout,
+                QLabel("<b>Sort:</b>"),
+                *self.sort_cbs,
+                QLabel("<b>Price:</b>"),
+                self.min_price_sb,
+                QLabel("to"),
+                self.max_price_sb,
+                QLabel("<b>Quantity:</b>"),
+                self.min_quantity_sb,
+                QLabel("to"),
+                self.max_quantity_sb,
+                self.owner_cb,
+            )
+        )
+        self.layout().setContentsMargins(0, 0, 0, 0)
+
+    def add_owners(self, users: list[User]):
+        owners = {self.owner_cb.itemData(index) for index in range(1, self.owner_cb.count())}
+        for user in users:
+            if user.id not in owners:
+                self.owner_cb.addItem(user.name, user.id)
+
+    def query(self) -> ItemQuery:
+        def bound(spin_box: Union[QSpinBox, QDoubleSpinBox]) -> Optional[float]:
+            return None if spin_box.value() == ItemQueryBar.NO_BOUND else spin_box.value()
+
+        min_price, max_price = bound(self.min_price_sb), bound(self.max_price_sb)
+        return ItemQuery(
+            sort=tuple(key for key in (sort_cb.currentData() for sort_cb in self.sort_cbs) if key is not None),
+            min_price=None if min_price is None else Decimal(str(round(min_price, 2))),
+            max_price=None if max_price is None else Decimal(str(round(max_price, 2))),
+            min_quantity=bound(self.min_quantity_sb),
+            max_quantity=bound(self.max_quantity_sb),
+            owner_id=self.owner_cb.currentData(),
+        )
+
+    def __changed(self):
+        self.queryChanged.emit(self.query())
@@ -0,0 +1,126 @@
+import threading
+from typing import Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api import TimAPI
+from tim_gui.api.errors import EventsLost, RequestError
+from tim_gui.api.events import EventStream
+from tim_gui.api.models import ChangeEvent
+from tim_gui.gui.store import EntityStore
+
+
+class LiveUpdates(QtCore.QObject):
+    """
+    Applies the changes made on the server, e.g. from another terminal, to the store as they happen. The
+    `EventStream` is read in a thread of its own; the changes received are merged and applied at most
+    every `APPLY_INTERVAL_MS`, so a burst of them is drawn once. Only the items and users already loaded
+    are updated. When the connection is lost it's opened again from the last change received, after
+    `RETRY_MS` doubling up to `MAX_RETRY_MS` while it keeps failing.
+    """
+
+    APPLY_INTERVAL_MS = 100
+    RETRY_MS = 5_000
+    MAX_RETRY_MS = 60_000
+
+    statusChanged = QtCore.Signal(str)
+    # some changes were missed, the loaded data may be out of date
+    eventsLost = QtCore.Signal()
+    failed = QtCore.Signal(Exception)
+
+    # emitted from the thread reading the stream, delivered in the GUI thread through a queued connection
+    _received = QtCore.Signal()
+    _status = QtCore.Signal(str)
+    _lost = QtCore.Signal()
+    _failed = QtCore.Signal(Exception)
+
+    def __init__(self, api: TimAPI, store: EntityStore, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._store = store
+        self._stream = EventStream(api)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._events: list[ChangeEvent] = []
+
+        self._apply_timer = QtCore.QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(LiveUpdates.APPLY_INTERVAL_MS)
+        self._apply_timer.timeout.connect(self.apply_events)
+
+        self._received.connect(self._apply_timer.start)
+        self._status.connect(self.statusChanged)
+        self._lost.connect(self.eventsLost)
+        self._failed.connect(self.failed)
+        if parent is not None:
+            parent.destroyed.connect(self._stream.close)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__run, name="live-updates", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stream.close()
+
+    def revision(self) -> Optional[int]:
+        """
+        Of the last change received
+        """
+        return self._stream.revision
+
+    def apply_events(self):
+        with self._lock:
+            events, self._events = self._events, []
+
+        # only the last change of each item or user matters
+        latest = {(event.kind, event.id): event for event in events}
+        for (kind, id), event in latest.items():
+            if event.action == "deleted":
+                if kind == "item":
+                    self._store.remove_item(id)
+                else:
+                    self._store.remove_user(id)
+        self._store.update_items(
+            [event.item for event in latest.values() if event.kind == "item" and event.action == "changed"]
+        )
+        self._store.update_users(
+            [event.user for event in latest.values() if event.kind == "user" and event.action == "changed"]
+        )
+
+    def __run(self):
+        paused = False
+        retry_ms = LiveUpdates.RETRY_MS
+        while not self._stream.closed():
+            try:
+                for event in self._stream:
+                    with self._lock:
+                        self._events.append(event)
+                        first = len(self._events) == 1
+                    if first:
+                        self._received.emit()
+                    if paused:
+                        paused = False
+                        retry_ms = LiveUpdates.RETRY_MS
+                        self._status.emit("")
+                # closed
+                return
+            except EventsLost:
+                # going on from the current revision
+                self._stream.revision = None
+                self._lost.emit()
+                continue
+            except RequestError as e:
+                if e.status_code == 404:
+                    # the server has no live updates
+                    return
+            except Exception as e:
+                # e.g. a change that can't be read, reported once and retried like a lost connection
+                if not paused:
+                    self._failed.emit(e)
+
+            if not paused:
+                paused = True
+                self._status.emit("Live updates paused, reconnecting...")
+            self._stream.wait_closed(retry_ms / 1000)
+            retry_ms = min(retry_ms * 2, LiveUpdates.MAX_RETRY_MS)
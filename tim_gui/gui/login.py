@@ -0,0 +1,107 @@
+from typing import TYPE_CHECKING, Optional
+
+from PySide6.QtWidgets import (QLabel, QLineEdit, QMessageBox, QPushButton,
+                               QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from tim_gui.gui.custom_widgets import PasswordEdit
+from tim_gui.gui.startup import startup_report
+from tim_gui.gui.utils import create_widgets_with_layout
+from tim_gui.gui.workers import TaskRunner
+
+if TYPE_CHECKING:
+    from tim_gui.api import TimAPI
+
+
+class LoginWindow(QWidget):
+    """
+    Shown first, so it doesn't import the API or the other windows. The API can be set later with
+    `set_api`, signing in waits for it.
+    """
+
+    def __init__(self, api: Optional["TimAPI"] = None, width: int = 350, height: int = 350):
+        super().__init__()
+
+        self.api = api
+        self._tasks = TaskRunner(self)
+        self._signin_pending = False
+
+        self.setWindowTitle("T.I.M - Login")
+        self.setFixedSize(width, height)
+
+        self.login_lbl = QLabel("<b>Login:</b>")
+        self.password_lbl = QLabel("<b>Password:</b>")
+
+        self.login_lbl.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        self.password_lbl.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+
+        self.login_le = QLineEdit()
+        self.password_le = PasswordEdit()
+
+        self.signin_btn = QPushButton("Sign in")
+        self.signin_btn.clicked.connect(self.signin)
+
+        v_layout = create_widgets_with_layout(
+            QVBoxLayout,
+            QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Expanding),
+            self.login_lbl,
+            self.login_le,
+            self.password_lbl,
+            self.password_le,
+            QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Expanding),
+            self.signin_btn,
+        )
+        self.setLayout(v_layout)
+
+    def set_api(self, api: "TimAPI"):
+        self.api = api
+        if self._signin_pending:
+            self._signin_pending = False
+            self.signin()
+
+    def signin(self):
+        login_txt = self.login_le.text()
+        password_txt = self.password_le.text()
+
+        if not login_txt and not password_txt:
+            QMessageBox.critical(self, "ERRO!", "Campo de login e senha não podem estar vazios!")
+            return
+
+        if not login_txt:
+            QMessageBox.critical(self, "ERRO!", "Campo de login não pode estar vazio!")
+            return
+
+        if not password_txt:
+            QMessageBox.critical(self, "ERRO!", "Campo da senha não pode estar vazio!")
+            return
+
+        self.signin_btn.setEnabled(False)
+        if self.api is None:
+            # still loading, `set_api` signs in
+            self._signin_pending = True
+            return
+
+        self._tasks.submit(
+            self.api.login,
+            username=login_txt,
+            password=password_txt,
+            on_result=self.__signed_in,
+            on_error=self.__signin_failed,
+        )
+
+    def __signed_in(self, _):
+        startup_report.mark("signed in")
+        from tim_gui.gui.windows import MainWindow
+
+        self.close()
+
+        self.main_window = MainWindow(self.api)
+        self.main_window.showMaximized()
+
+    def __signin_failed(self, error: Exception):
+        from tim_gui.api.errors import ServerUnavailable
+
+        self.signin_btn.setEnabled(True)
+        if isinstance(error, ServerUnavailable):
+            QMessageBox.critical(self, "ERRO!", f"Não foi possível conectar ao servidor!\n{error}")
+        else:
+            QMessageBox.critical(self, "ERRO!", "login ou senha incorretos!")
@@ -0,0 +1,106 @@
+from typing import Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api.offline import OFFLINE_ERRORS, OfflineTimAPI, SyncReport
+from tim_gui.gui.store import EntityStore
+from tim_gui.gui.workers import TaskRunner
+
+
+class OfflineSync(QtCore.QObject):
+    """
+    Replays the changes made offline with `OfflineTimAPI.sync` every `SYNC_INTERVAL_MS` while there are
+    some or the server can't be reached, applying the results to the store. The changes queued are counted
+    every `STATUS_INTERVAL_MS` in the background, the mirror is shared with the requests.
+    """
+
+    SYNC_INTERVAL_MS = 10_000
+    STATUS_INTERVAL_MS = 2_000
+
+    statusChanged = QtCore.Signal(str)
+    conflictsFound = QtCore.Signal(list)
+    failed = QtCore.Signal(Exception)
+
+    def __init__(self, api: OfflineTimAPI, store: EntityStore, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
+        self._syncing = False
+        self._counting = False
+        self._status = ""
+        # the changes queued, when they were last counted
+        self.pending = 0
+
+        self._status_timer = QtCore.QTimer(self)
+        self._status_timer.setInterval(OfflineSync.STATUS_INTERVAL_MS)
+        self._status_timer.timeout.connect(self.refresh_status)
+
+        self._sync_timer = QtCore.QTimer(self)
+        self._sync_timer.setInterval(OfflineSync.SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self.sync)
+
+    def start(self):
+        self._status_timer.start()
+        self._sync_timer.start()
+        self.refresh_status()
+
+    def stop(self):
+        self._status_timer.stop()
+        self._sync_timer.stop()
+
+    def status(self) -> str:
+        if self._api.online and not self.pending:
+            return ""
+
+        status = "Online" if self._api.online else "Offline"
+        if self.pending:
+            status += f" — {self.pending} change{'s' if self.pending != 1 else ''} pending"
+        return status
+
+    def refresh_status(self):
+        if self._counting:
+            return
+
+        self._counting = True
+        self._tasks.submit(self._api.pending_count, on_result=self.__counted, on_error=self.__count_failed)
+
+    def __counted(self, pending: int):
+        self._counting = False
+        self.pending = pending
+
+        status = self.status()
+        if status != self._status:
+            self._status = status
+            self.statusChanged.emit(status)
+
+    def __count_failed(self, error: Exception):
+        self._counting = False
+        self.failed.emit(error)
+
+    def sync(self):
+        if self._syncing or (self._api.online and not self.pending):
+            return
+
+        self._syncing = True
+        self._tasks.submit(self._api.sync, on_result=self.__synced, on_error=self.__sync_failed)
+
+    def __synced(self, report: SyncReport):
+        self._syncing = False
+
+        for temporary_id in report.id_changes:
+            self._store.remove_item(temporary_id)
+        for id in report.deleted_ids:
+            self._store.remove_item(id)
+        self._store.put_items(report.items)
+
+        self.refresh_status()
+        if report.conflicts:
+            self.conflictsFound.emit(report.conflicts)
+
+    def __sync_failed(self, error: Exception):
+        self._syncing = False
+        self.refresh_status()
+        if not isinstance(error, OFFLINE_ERRORS):
+            self.failed.emit(error)
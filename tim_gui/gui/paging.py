@@ -0,0 +1,140 @@
+import time
+from typing import Callable, Optional
+
+from PySide6 import QtCore
+
+from tim_gui.api.models import Item
+from tim_gui.gui.workers import TaskRunner
+
+
+class ItemPager(QtCore.QObject):
+    """
+    Loads the items page by page in the background. It keeps track of how many items were really
+    loaded, keeps up to `prefetch_pages` requests in flight, delivers the pages in order even if they
+    arrive out of order and adapts the page size to the measured latency of the requests.
+    """
+
+    pageLoaded = QtCore.Signal(list)
+    failed = QtCore.Signal(Exception)
+
+    def __init__(
+        self,
+        fetch: Callable[..., list[Item]],
+        parent: Optional[QtCore.QObject] = None,
+        page_size: int = 100,
+        min_page_size: int = 50,
+        max_page_size: int = 1000,
+        prefetch_pages: int = 2,
+        target_latency: float = 0.3,
+    ):
+        super().__init__(parent)
+
+        self._fetch = fetch
+        self._tasks = TaskRunner(self)
+
+        self.page_size = page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.prefetch_pages = prefetch_pages
+        self.target_latency = target_latency
+
+        self._loaded_offset = 0
+        self._next_offset = 0
+        self._end_offset: Optional[int] = None
+        # offset -> limit of the requests in flight
+        self._pending: dict[int, int] = {}
+        # pages that arrived before the ones preceding them
+        self._buffer: dict[int, list[Item]] = {}
+        # bumped on errors so the results of requests made before it are dropped
+        self._generation = 0
+
+    @property
+    def loaded_offset(self) -> int:
+        return self._loaded_offset
+
+    @property
+    def exhausted(self) -> bool:
+        return self._end_offset is not None
+
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def fetch_more(self):
+        """
+        Makes sure the page after the loaded items is being fetched. Once every item was loaded,
+        it checks the server again for items created since then.
+        """
+        if self._pending:
+            return
+
+        self._end_offset = None
+        self._next_offset = self._loaded_offset
+        self.__request_page()
+
+    def cancel(self):
+        """
+        Drops the requests in flight, their pages are never delivered
+        """
+        self._generation += 1
+        self._tasks.cancel_all()
+        self._pending.clear()
+        self._buffer.clear()
+        self._next_offset = self._loaded_offset
+
+    def prefetch(self):
+        while len(self._pending) < self.prefetch_pages and not self.exhausted:
+            self.__request_page()
+
+    def __request_page(self):
+        offset, limit, generation = self._next_offset, self.page_size, self._generation
+        self._next_offset += limit
+        self._pending[offset] = limit
+
+        def fetch_page():
+            start = time.perf_counter()
+            items = self._fetch(skip=offset, limit=limit)
+            return items, time.perf_counter() - start
+
+        self._tasks.submit(
+            fetch_page,
+            on_result=lambda result: self.__page_fetched(generation, offset, limit, *result),
+            on_error=lambda error: self.__page_failed(generation, offset, error),
+        )
+
+    def __page_fetched(self, generation: int, offset: int, limit: int, items: list[Item], elapsed: float):
+        if generation != self._generation:
+            return
+
+        del self._pending[offset]
+        self.__adapt_page_size(elapsed)
+
+        if len(items) < limit:
+            end_offset = offset + len(items)
+            self._end_offset = end_offset if self._end_offset is None else min(self._end_offset, end_offset)
+        self._buffer[offset] = items
+
+        while self._loaded_offset in self._buffer:
+            page = self._buffer.pop(self._loaded_offset)
+            if not page:
+                break
+            self._loaded_offset += len(page)
+            self.pageLoaded.emit(page)
+
+        if self._end_offset is not None:
+            self._buffer = {offset: page for offset, page in self._buffer.items() if offset < self._end_offset}
+
+    def __page_failed(self, generation: int, offset: int, error: Exception):
+        if generation != self._generation:
+            return
+
+        self._generation += 1
+        self._pending.clear()
+        self._buffer.clear()
+        self._next_offset = self._loaded_offset
+        self.failed.emit(error)
+
+    def __adapt_page_size(self, elapsed: float):
+        if elapsed < self.target_latency / 2:
+            self.page_size = min(self.page_size * 2, self.max_page_size)
+        elif elapsed > self.target_latency:
+            self.page_size = max(self.page_size // 2, self.min_page_size)
@@ -0,0 +1,1083 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03+\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\
+\x0e\x1b\x00\x00\x01#PLTE\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe8\xa3\x04\
+\xaf\x00\x00\x00atRNS\x00 \xde\xcb\xe3\xff\xbd\
+\x06Z\xa9\xd4\xf0\xfd\xf1\xd8\xb2q\x15\xc2\x0e\x90\xed\x1a\
+e\xec\xf55\x08\xac:\x12\xcfw(\x07,\x819\x0f\
+\xd6\xd7\x1f\xf2/\x04\xc8\xc5\xf8\xeb\x1c\xe4\x9d\xafT\xfe\
+GI\xe2\xfc\x0d>\x1b\x9cL+\x88\x82\xe8\xb5j\x02\
+R\x9a\x0a\xc3Q\xf3\xad\x0b\xb8K\xb4\xa4z\x038\xfb\
+\xda]<\x80\xc0\xe9\xb9x6\xbb.\x14\x8a\xd8\x00\x00\
+\x014IDATx\x9c\xcd\x92YW\xc20\x10\x85\
+G4n-(\xd4\x0dj\x11\x82ZQh\x11\x17\xb4\
+X\x10Y\xdcw\xc5}\xf9\xff\xbf\xc2\x96LL!\xe7\
+\xe0\xf1\xf8\xe2\xbc\xdd\xfbM\xd2;\xd3\x00\xfc\xef\x1a\x08\
+\x0d\xf6\xe7Cd\xb8\xcb\x18\x19\x1d\x1bWT5\x1c\x99\
+\x98\x8c2\x1e\xd3\x02X\x9b\x9a&\xdf\xa5\xccH|v\
+N`\x12O\xf4r}\x9eH\x9c\x18\x82'\x17\x90\xa4\
+\xd2T\xcf,2N\xc2K\x9c/\x9b\x8c\xafdE~\
+\xbfV\xd7\x98\xcc\xe5\xf1|\x16\x0c\xcb.\xacsNH\
+1\xdai\xd8@\x99\x02#\x8e\xdf\xb7\xd1\xda\xf4\xf9\xd6\
+6\xaa4X<\x7f\x89\xe7\xdd\xf1\x1av\xb9\xa0`3\
+\xeeh\x94{\xa6\xd7\x10\xe1B\x87\x02\xcb\xaf@\x99{\
+\x96\xd7\xb0\xa7\xa2\xc8\x80\xcb\xf2U\xa0\x8a\x96\xb3\xef\x87\
+\xa8\xa1:\xc0\xf9\xea.4\xd0jv\xa6h5\x02\xfb\
+s\x94\x8a\x0b\x87x\xe9Q\x8b-\xe2\xf8\xa4{\xff\xa7\
+g\x8c\x9fS\xbe\xca\x8bK>\x7f\x89\x96\xaf\xae\xf1\xfc\
+\x8d.~F\xae\x96\x10\xfb\xc3\xba\xbd\x93\xdeO\xb0\xcc\
+{\xf9}\xb5\x05~x\xa42\x8f%\x9f\x9e_^\x9d\
+v\xf1\xed\xfd\xa3\xe7v\xf9\xfd\xfd\x96C\xe8\x07\x0e\xf9\
+\xcf\xfe\xfco\xf5\x05\xfe\xdf\x22@m\x92\x1b{\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x031\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0eu\x00\x00\x0eu\x01\xb9c\
+Q2\x00\x00\x01,PLTE\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\xd5\x0a\x07u\x00\x00\x00dtR\
+NS\x00\x014k\x8f\x9e\x9d\x8bf-J\xb0\xef\xff\
+\xe9\xa9>V\xd6\xccE\x1c\xbdZ<`\xbe\xaf\x12Q\
+\xee\xda2\xe6\xe5;s\xfb\x14\x1e\xf9Y|\xfe\xaa\xa8\
+H\xfdl\xab\x99\xcb\xfcNG@\x86\xf6/\x81[\xd8\
+\xdc\xa6{]O3\x8c\xf2\x22S\x96y\xd4=a~\
+z0\xf5B7I\xd9)\xa0\x8e\x0c9\xc1\xb3.1\
+\xe7\xdf\x80_mDR\x91^j\x00\x00\x01.ID\
+ATx\x9c\xdd\x92\xe7V\xc2@\x10\x85'6\x14\x8c\
+\xc4F@A\x09\x8a\xc1\x1a\x94\x88\xa0X\xa2\x88\x05\xbb\
+b\xef\xbe\xff;\xb8\xcb\x9d\x85\x93\x13^@\xe7O\xbe\
+\xb97\xbb\xb3\xb3\xb3D\xff-\xb4\xae\xee\x9e\xde\xbeP\
+\xff\x80\xd6\xd1\x0eG\x06u\x8e\xa1\xa8\x11\xb0\x87Gt\
+_\x8c\x8e\xf9\xec\xf1\x18\xe4\x88\x197\x12\x13\xe0\xc9d\
+\xdbOM5\xa5\xe94R\xc3j\xa6\x99\x19\xe5\xcff\
+\xe1\xcf)\xc1\xc6\x1f\xb9y\xa4\x0b\x8b\xd8S\xae7\x97\
+\x96S\xe2\xb3\x02\xc5IH?\xefp}\xc1\xab\x12\xd6\
+\x04\x14\xa0\xb9\xebD\xc5\x1c\x9f\xdb\x14\xebA\x1bD%\
+\x16\xcb\x9bd\xa9\xc6\xe2DQ\xd0\x16QE\xa9\xdb\xb4\
+\xa3P\xdc\xcd.h\x8f\xc8k\xdd\x07\xa5\xcb\x8c\xe2@\
+\xfb\xa0\x03\xa2*\x8b\x875\xa2#\x17\x1c\x13g;\x96\
+p\x22\xe0\x14Z\xb6.\xdb8sZ5\xa8~~!\
+\xbb\xe5\x0an\x98\xe7\x80F,[]\xd4%\xc6vu\
+\xad\x84\x9b\x0c\xfe\xb8E\xea\xc1\xbfk\xb4\x87\x91\xbc\xc7\
+\x9e\x85R\xc5\xabr\xfd\x87G\xdf<\x9f\x9eu_\xbc\
+\xbc\x06^\xc4[\xe8]\xb9\x1f\x9f\x8d\x80-C\xab\x15\
+\xbf\xbe\xf3\xde\x8f\xdd\xf9\xc9\xfd\xe5\xf8\x05!\x0d'\xe1\
+\x12r\xa1\x18\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x019\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\
+\x9bx\x00\x00\x00HPLTE\x00\x00\x00\x00\xff\x1e\
+\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\
+\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\
+\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\
+\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\xff\x1e\x00\
+\xff\x1e\xaf\x15\x0fU\x00\x00\x00\x18tRNS\x00\x01\
+\x94\xc9T\xaf\xff\xf4\xce\xe1\x1d\x98\xf5\xb3\x0a\xfd\xbf\xc4\
+\x0e\xca\xb0\x96\xa0\x1a\x911\x92\xa2\x00\x00\x00fID\
+ATx\x9c\xed\x90I\x12\x80 \x0c\x04\xe36\xee\xe0\
+\xee\xff\x7f\xaa\x05\x94\xc5\x01\x86\xa3\x1e\x9ckw*\xc9\
+\x88|<Y^\x94\x94W@\x9d\xe0h\x12\xbc\xed~\
+\xee\xd2\x0f\xa3\xa2\xf3\x1a\x98\x14\xe12\xc37\x02\xfb\x97\
+\xd53\x82\xf7yF\xe4\xfe\xc7\x88\xfe\xe7\x0c\xf2\xbf5\
+6\xd2\x8f1h\x7f\xd6 \xfd\x1a\x83\xf1\xdb\xd8\x8f\x93\
+\xf17s\x01\x85q\x06\xb8\x01\x03F\xb6\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x02\xaa\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x00\xf3PLTE\x00\x00\x00\x00\xff\x00\
+\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\
+\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\
+\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\
+\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\
+\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\
+\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\
+\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\
+\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\
+\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\
+\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\
+\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\
+\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\
+\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\
+\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\
+\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x85\xff\x15\
+L\x00\x00\x00QtRNS\x00\x0d\x9f\xed\xff\xa0\x0e\
+\x16\xd9\xec\xfe\xd4\x14\xda\xcc\x1f\xcb\xe3\x12\xcaw\x88\x5c\
+\xf9!\xebL\xf3=\xdc(\xe8l\x89\xf2\xb2\x06\x1e\xe2\
+o\xb3\x0a\xc0\x7f\xd2\xd8\x18\xfcZV\xder\x94ih\
+\xc1<d\x11#\xeeb\x9a _\x9b\xf0\x9e\xc7\xbf\xea\
+\xab\xc9\x9ca5\x0c\xdb\xa8k\x13\xdf\xdd1_\x00\x00\
+\x00\xf3IDATx\x9c\xd5\xd2\xd9V\xc20\x14\x85\
+\xe1]\xd8\x16\x092\x88\x95*2(\x0e(\xa0\xc5y\
+dTpB\xf1\xfd\x9f\xc6dY\xaf<\x89\xd7\x9c\x9b\
+t\xad\xefOr\x91\x02\xe2x\x89$\x93K\xbe\x8cz\
+R\xcbdZ1\xb3b\xf3,sy\xe4\x0b\xb6B\xfb\
+jQ\xaf\xfe\x1a3\xd2-\xda\xc9\xc0|\xf9\x05\xae\xcb\
+\xe7\x97\xc2\x9fbCm\x8a\xfbK(\xc7\xc5\x16\xa5\xfb\
+\x19\x96\xe3\xa2\xc2\xaap~1\xf8-jun\x0b\x0e\
+\xec\xc4E\x83\xbb{\x92\xef\x1f\xd0\x14M\xf2\xf0\xc8\xe2\
+\xad6\xc3f\xdd\xe1\x1e\x02\xba\xf6{@\xad\xf1\x8f\xbb\
+\xcf_@G\x87\xc7N?Q\x8c\xba\x0e\xc7)\xcfT\
+tnw\x5c\xf0\xf2J\xd1\xee\xb8\xe6\x0dtqks\
+\xa4y\x07]D]\x8b\xdf3k\x16]<\x88\x8e\x1e\
+\xfb\xc0`8\x1a\xffy\xffx\x1e\xf94\x99\xea\xbf\x83\
+\xeaYt\xbc\x18\xac\xbe\xbe\xbd\xcfD\x06>>\xe7\x95\
+/\x8b\x99\xf9\x06]\xa1%/2A\x09\xb6\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x01(\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0c&\x00\x00\x0c&\x016\xf4\
+\xe0\xbb\x00\x00\x00<PLTE\x00\x00\x00L\xafP\
+L\xafPL\xafPL\xafPL\xafPL\xafPL\
+\xafPL\xafPL\xafPL\xafPL\xafPL\xaf\
+PL\xafPL\xafPL\xafPL\xafPL\xafP\
+L\xafPL\xafP\x8c\xa6\x82\xba\x00\x00\x00\x14tR\
+NS\x00C\xe1\xff\xd9-\xd5\xbf\xec\xe3\xed\xfe\xfd\xce\
+.\xd2\xc6\xfc\xb5\x1f.(\xc1\xcf\x00\x00\x00eID\
+ATx\x9c\xed\xd3\xbb\x0e\x80 \x0c@\xd1By\xbf\
+D\xfc\xff\x7f\xd5.\x82\x83%q2\xc6\xbb\xd1\x9e\x09\
+\x02\xc0\x98\x90\x88J\xc3}\x06\x8f,\x03\x1c\x01\xcf\x80\
+\xf0\x83\xe7@\x18\x17\xce\x22\x81\xd4\xcf.\x17\x90\xc8\xb6\
+\x00\xbfG\x9c\x81\x08\x8a\x07\x15\xb4\xf5\xbdD\xb3u\x18\
+\xb4\xed\x157\xf9A0\xfdz\x99@c@Y0\xd6\
+\xeb\xfb\xec'$\x07)8\x91T\xe6\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01\xee\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x00\x0f\x88\x00\x00\x0f\x88\x01\x16\xc8\
+\xa5\x86\x00\x00\x00\x8aPLTE\x00\x00\x00\xf4C6\
+\xf4C6\xf4C6\xf4C6\xf4C6\xf4C6\xf4\
+C6\xf4C6\xf4C6\xf4C6\xf4C6\xf4C\
+6\xf4C6\xf4C6\xf4C6\xf4C6\xf4C6\
+\xf4C6\xf4C6\xf4C6\xf4C6\xf4C6\xf4\
+C6\xf4C6\xf4C6\xf4C6\xf4C6\xf4C\
+6\xf4C6\xf4C6\xf4C6\xf4C6\xf4C6\
+\xf4C6\xf4C6\xf4B6\xf4C6\xf4D5\xf4\
+C6\xf4C6\xf4C6\xf4C6\xf4C6\xf4C\
+6\xf4C6\xa5\xdf\xa3\x17\x00\x00\x00.tRNS\
+\x00~\xe3\xe8\x97\x06\x09\xa5\xeb\xdei\x93\xff\xb3\xc7y\
+\x82a\xed\xf7\xf2\xaf\x8d\x0e\xc9\x0a\xc8\xb4\xab\x8a\xf6\xee\
+\xb2\xe5\x87e\x01\x99\x01|\xf5\xfb\x94\xfc\xf0j5u\
+\x9f\x8b\x00\x00\x00\xc3IDATx\x9c\xb5\xd2\xd7\x12\
+\x820\x10\x85\xe1\x03j\xb0,\xd8\xb0`/\x88\xfd\xfd\
+_Ob#\xc9n\xc6+s\x95\xc9\xff\xcd0\xc3.\
+\x80 \xac\xd5\x1b`GE\xcdV[_:T\x9e\x98\
+\x09\x95\xe8\xf7.\xd0#\x92\xc4\xab\x13\xf51 I|\
+:\x85\x18\x92 \xbe\x9dR\x8c\x88\x8b\xaa\xd3\x18\x93)\
+\x13F\x8f\x15\xb80{\xa6\x1f\x1c\xc1\xba#\x84n\x0b\
+\xa9[B\xec\x92\xb0;\x17nw\x05\xef\xb6\x90:\xd4\
+\xac\x02si?\x12\xeb\x13\x9e\xfd\xf0\x0b\xb7{\xf7\xc3\
+#\xcc\xff\xcf\xa7\xef\xcc\xef\xc7~d\x7f\xd8\x0f,X\
+\xb7\xc4\x12+\xdeM\x91b\xfd\xbem\x948\xb9-v\
+R\xaf\xc4\x1e\xf9\xe1\xd9=\xfb\x11\x14@~<\x9d/\
+\xca\xed\xa5\x88\xae\xb7{\x81\x072,\x22\xa8\xb6R!\
+\x03\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x14\xd8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x046zTXtRaw prof\
+ile type exif\x00\x00x\
+\xda\xedVY\x96#)\x0c\xfc\xe7\x14s\x04$!\x96\
+\xe3\xb0\xbe77\x98\xe3O\x88Lg\xd9nWw\xbb\
+k\xbe\xe6Ub\xb3\x08\xa5\x08)@\x89\x9b\xff\xfc\xbd\
+\xdc_x\x98\x88]\xd0\x94c\x89\xd1\xe3\x09%\x14\xae\
+\xe8d\x7f<u\xd7\xe4\xc3\xae\xf7\xc3\xe7\x14\xc6\x0fr\
+wM0D\x82V\x8ea\x8e\xa7\xfeMN\x97\x81\xa3\
+\xa9\xe8\xe9\x9d\xa1\xdc\xcf\x89\xf68Q\xc2i??\x19\
+:\x17\x12Cd(\xc6i\xa8\x9c\x86\x84\x8f\x09:\x0d\
+\xd4\xc3-\x1fKN\xf7.\xb4y\xb4\xe3\xe6I>\xfe\
+\xce\xaa2\xb6\xaa\xa7r\xa2y\x1a\x87\x84\xe8\x0d\xc5:\
+\xc2<\x85\xc4\xa3\x169\x01\x88\xfd\xd9IEGQ\xb3\
+d(\x92\xe4\xa3\x8fZ%\x9eH\x10\x90Wq\xba\x1e\
+,\xe8\x96A\x0d/\x95\x1eX\xb9z\xf4Z\xee\x9e\xd9\
+\x0a|\xaa\xc8S\x90\xe3\xd5\xbe\x94;\xd2\xd7\xac\xec\xd0\
+\xdf\xad\x1c\xf2\xd9\xe3G\xf9\xe2\xc3\x94\xf3O\xd1\xb7\xff\
+Z#\xaf\xed3\xbc\xa8!\x22\xd4\xf1t\xea\xe6\xca\xee\
+A\xafa\x09[:;\xd8\x8b>\xe1\xaf0\x91v)\
+(\x19\xbb\xbac+\x0c\xdf}C\xe9T\x88A\xd7\xa2\
+@\x83*-\x9a\xbb\xed\xd4\x011\xf0t\x9c\xd0a\xee\
+,[\x98%q\xe1.\xc6_\xb0B\x8b\x93\x14\x19\xe0\
+\x91\xa5o\xda\x83\xf0\x85\x85\xf6\xb2\xc5w\xb7W\xcbX\
+y\x10Tq\xfc:\x16\xe6\xf7\x8b{\xf7\x85\xb5\xec(\
+\x10\xf9|\xc5\x0a\xb8\x98-\xd8\x80a\xccY\x0d50\
+B\xeb\x0c\xaa\xee\x00\xdf\xca\xf3c\xbc\x0a\x18T\x8b\xb2\
+\x1d\x91\x82\xc0\xb6\xc3DS\xfa\xc8\x04\xb2\x89\x16(*\
+\xda\xe3\x0cR\x1a\xa7\x01\x84\x08K+\xc0\x90\x80\x01\xb0\
+F\xa2\x14\xc9'\xe6D\x84@f\x10T\x01\x9d%p\
+\x03\x03\xa4\xca\x03 9\x88Dp\x83\x93\x84\xa5\xf1J\
+\xa2\xad\xca\xca\x10;\xc8\x91\xcc\xc0\x04N\x96$pS\
+\xa4\x82\xac\x10\x14\xfb'\x85\x8c=TU4\xa8j\xd4\
+\xa4Y\x8b\xd6(1D\x8d1\xa6hI\xb1&I\xc1\
+%M1\xa5\x94SI5K\x0eYs\xcc)\xe7\x5c\
+r-\x5c\x04ISK,\xa9\xe4RJ\xadX\xb3\xc2\
+r\xc5\xdb\x15\x0a\xb56n\xd2BS\xd7bK-\xb7\
+\xd2j\xc7\xf6\xe9\xa1k\x8f=\xf5\xdcK\xaf\x83\x87\x0c\
+\xe4\x8f\x11G\x1ay\x94Q'Ml\xa5\x19\xa6\xce8\
+\xd3\xcc\xb3\xcc\xba\xb0\xd5\x96\xb8\x15\x96\xae\xb8\xd2\xca\xab\
+\xacz\xb1v\xd2\xfaCy\x835:Y\xe3\xcd\x94)\
+\xa6\x8b5HS\xba\x99 K'j\x9c\x810|E\
+\x08\x8c'\xa3\x00\x1b\x9a\x8d3\x9f)\x046\xe6\x8c3\
+_\x18\xa7B\x19 \xd58\x1bd\x8c\x81\xc10\x89u\
+\xd1\x8d;\xc7\x07\xa3\xc6\xdc\x97xs)<\xf0\xc6\x7f\
+\xca\x9c3\xea\xded\xeeG\xde^\xb16\xec3\xd47\
+c\xc7)\xb4\xa0z\xc1\xe9[^j\x9e\xb9\xe2K\xe7\
+Q=\xb5\xee\xb3\x89w\xdb\xcf\x0cY\xf0\xdf2\xe5\xbe\
+\x8e\xe5\xdb\xd0\xff\xcaP\x8b\xb1Q}\xd7\x96;\xde\x0d\
+\xb1\xc9\xebwkWM\xd5\xae\x80&\xfb\xbcu\xdc\xea\
+\x84\xa59\xec2\x85\x96\xb9\xae\x86\xe4\x80\xd1\xca\xa6\x86\
+\xd3\xd5\xca\xf8\xa5)go\x07(\xaf\xd66\x84U\xcc\
+\x5c[\x06H\xe6\x86; \xe9k~\x00\x95\xb9\x96\xa9\
+f\x86\xeaJ[\xe4\xe6O\xf1?\xc1%\x5crj\xef\
+\x18 \x89\xe1\x0b\xd6\xa7\xe2\xc6B\xc8\x1d\xc3\xa5\x8eL\
+\xd8\x90I&\xee\xc6\xa9\xe3V\xab\x96\xeb\xba\x0d\xd1\xc7\
+\xef\xae\xd5\x9a0=\x86\xdd\x9d5u\x1d\x18\xe1;\xea\
+\xfd\xac\xae\xa9\x9ag\x88H[\xb3\xcd\xe0\xed\x93\xb3\x01\
+\xdf\x82\xb4L\xe6\xb7\xdf\x13*\xe6\xe4\xa5\xee\x11\xc3\xb9\
+C\xe1.\xfdV\x90\x93q\xc5h:\x92\x12 \xe6a\
+\x18\x16.\xcb\xa4ec\xd8\xc8\xee\xda\x13\xfa\xf6\xce\xc1\
+=x\x87\x8b\xb4y7\x1e\xbc[\xf0F\x22\xa8(\xb1\
+\xcd\xd9NV-h\x85^\xb2v\x84\xfa\x83\x0d\xde\x90\
+W\x1b\xf3F\xdc\xb9\xa9\xcc\xc9%\xeb\xa6j\x8a&\xa9\
+\xc6\xa83\x16-H\x9b\x8b_\xed:\xb0\xc8u\x9e\xbb\
+\xacY\xb0VFP\xe6\x18\xc7>\xfa\x14\xef\x8b\xf6\x82\
+\xfft\x0a`\xa8b\x97\xf4\xf9g'v\x94\xda\xe3w\
+b\xfb6\xf4\x05CHMy>l\xc8\xff\x04\xd3o\
+\x1a*vN\x17nO\xc5\xfd\x0b\xa95\xfa\xb6~$\
+\x98\x12\x00\x00\x01\x84iCCPICC pr\
+ofile\x00\x00x\x9c}\x91=H\xc3@\x1c\
+\xc5_[KE*\x0eV\x10\xed\x90\xa1:Y\x10\x15\
+q\xd4*\x14\xa1B\xa8\x15Zu0\xb9\xf4\x0b\x9a4\
+$).\x8e\x82k\xc1\xc1\x8f\xc5\xaa\x83\x8b\xb3\xae\x0e\
+\xae\x82 \xf8\x01\xe2\xe8\xe4\xa4\xe8\x22%\xfe/)\xb4\
+\x88\xf1\xe0\xb8\x1f\xef\xee=\xee\xde\x01\xfeF\x85\xa9f\
+\xd78\xa0j\x96\x91N&\x84lnU\x08\xbd\x22\x88\
+(\x060\x8c\x80\xc4L}N\x14S\xf0\x1c_\xf7\xf0\
+\xf1\xf5.\xce\xb3\xbc\xcf\xfd9z\x95\xbc\xc9\x00\x9f@\
+<\xcbt\xc3\x22\xde \x9e\xde\xb4t\xce\xfb\xc4\x11V\
+\x92\x14\xe2s\xe21\x83.H\xfc\xc8u\xd9\xe57\xce\
+E\x87\xfd<3bd\xd2\xf3\xc4\x11b\xa1\xd8\xc1r\
+\x07\xb3\x92\xa1\x12O\x11\xc7\x14U\xa3|\x7f\xd6e\x85\
+\xf3\x16g\xb5Rc\xad{\xf2\x17\x86\xf3\xda\xca2\xd7\
+iF\x91\xc4\x22\x96 B\x80\x8c\x1a\xca\xa8\xc0B\x9c\
+V\x8d\x14\x13i\xdaOx\xf8\x87\x1c\xbfH.\x99\x5c\
+e0r,\xa0\x0a\x15\x92\xe3\x07\xff\x83\xdf\xdd\x9a\x85\
+\xc9\x097)\x9c\x00\x82/\xb6\xfd1\x02\x84v\x81f\
+\xdd\xb6\xbf\x8fm\xbby\x02\x04\x9e\x81+\xad\xed\xaf6\
+\x80\x99O\xd2\xebm-v\x04\xf4m\x03\x17\xd7mM\
+\xde\x03.w\x80\xc1']2$G\x0a\xd0\xf4\x17\x0a\
+\xc0\xfb\x19}S\x0e\xe8\xbf\x05z\xd6\xdc\xdeZ\xfb8\
+}\x002\xd4U\xea\x0688\x04F\x8b\x94\xbd\xee\xf1\
+\xee\xee\xce\xde\xfe=\xd3\xea\xef\x07A\x8br\x93g\x17\
+\x03N\x00\x00\x0d\x1aiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<?xpacket begin=\
+\x22\xef\xbb\xbf\x22 id=\x22W5M0Mp\
+CehiHzreSzNTczkc\
+9d\x22?>\x0a<x:xmpmeta\
+ xmlns:x=\x22adobe:\
+ns:meta/\x22 x:xmpt\
+k=\x22XMP Core 4.4.\
+0-Exiv2\x22>\x0a <rdf:\
+RDF xmlns:rdf=\x22h\
+ttp://www.w3.org\
+/1999/02/22-rdf-\
+syntax-ns#\x22>\x0a  <\
+rdf:Description \
+rdf:about=\x22\x22\x0a   \
+ xmlns:xmpMM=\x22ht\
+tp://ns.adobe.co\
+m/xap/1.0/mm/\x22\x0a \
+   xmlns:stEvt=\x22\
+http://ns.adobe.\
+com/xap/1.0/sTyp\
+e/ResourceEvent#\
+\x22\x0a    xmlns:dc=\x22\
+http://purl.org/\
+dc/elements/1.1/\
+\x22\x0a    xmlns:GIMP\
+=\x22http://www.gim\
+p.org/xmp/\x22\x0a    \
+xmlns:tiff=\x22http\
+://ns.adobe.com/\
+tiff/1.0/\x22\x0a    x\
+mlns:xmp=\x22http:/\
+/ns.adobe.com/xa\
+p/1.0/\x22\x0a   xmpMM\
+:DocumentID=\x22gim\
+p:docid:gimp:f6d\
+9863d-8ee9-4fa0-\
+b1ba-7d74ede5498\
+c\x22\x0a   xmpMM:Inst\
+anceID=\x22xmp.iid:\
+8009be0f-aca6-43\
+cc-9fd7-33f877ac\
+bd12\x22\x0a   xmpMM:O\
+riginalDocumentI\
+D=\x22xmp.did:ce6bb\
+083-4c76-4dcc-b0\
+52-7197b8d86c8b\x22\
+\x0a   dc:Format=\x22i\
+mage/png\x22\x0a   GIM\
+P:API=\x222.0\x22\x0a   G\
+IMP:Platform=\x22Li\
+nux\x22\x0a   GIMP:Tim\
+eStamp=\x2216537733\
+40253264\x22\x0a   GIM\
+P:Version=\x222.10.\
+30\x22\x0a   tiff:Orie\
+ntation=\x221\x22\x0a   x\
+mp:CreatorTool=\x22\
+GIMP 2.10\x22>\x0a   <\
+xmpMM:History>\x0a \
+   <rdf:Seq>\x0a   \
+  <rdf:li\x0a      \
+stEvt:action=\x22sa\
+ved\x22\x0a      stEvt\
+:changed=\x22/\x22\x0a   \
+   stEvt:instanc\
+eID=\x22xmp.iid:27d\
+e7f7b-e742-4cd9-\
+94de-8e980115210\
+5\x22\x0a      stEvt:s\
+oftwareAgent=\x22Gi\
+mp 2.10 (Linux)\x22\
+\x0a      stEvt:whe\
+n=\x222022-05-28T18\
+:29:00-03:00\x22/>\x0a\
+    </rdf:Seq>\x0a \
+  </xmpMM:Histor\
+y>\x0a  </rdf:Descr\
+iption>\x0a </rdf:R\
+DF>\x0a</x:xmpmeta>\
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+\x0a<?xpacket end=\x22\
+w\x22?>\xd4\x18\xa1\xfb\x00\x00\x00\x06bKGD\
+\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pH\
+Ys\x00\x00\x12t\x00\x00\x12t\x01\xdef\x1fx\x00\
+\x00\x00\x07tIME\x07\xe6\x05\x1c\x15\x1d\x00;g\
+8\xef\x00\x00\x01mIDATX\xc3\xed\x97\xb1n\
+\xc20\x10@\x9f\xdd\xa80d(\xc23?\xd0O`\
+\xeeR\xc1\xd0\x89?\xa5ba\xa5#\x0bjw\xba2\
+\xb00\x00\xc2\x1dz\x91 9G6R\xebV\xc2\xd2\
+E\xb2\xa2\xf3{>9\x8eMQ\x14w\xc0\x04X\x02\
+\x07\xc0\xffp\x1c\x845\x116\x13`\xf7\x0b\xe0z\xec\
+\x84\xcd2\x03\xbc\x8a\xa5\x91\x92\x14\xe4iG#&\xd9\
+\x9a%s\xbb\x09\xfcK\x81\xfd\x95\xac\xbd\xb6\xe0S\x04\
+<\xf0\x06\x8c\x80\x8fD\xf8'\xf0\x02\xcc4\x89m\xc4\
+\x86q\x02\x16\xc0@r\x1e\x81\xf7\xc8\xcdf\x0d\x0c{\
+\xbd\x9e\x01\x1c0\x95\xf1\xaa\xf7\x8c\x81M\x02\x9c\x04\x89\
+50\xec\xf7\xfb\xe6,\xefR\xa2\xdb\xed\x1a)\xeb&\
+\x01\x1e#\xa1\xc15\x09B\x12\x0d\xb8s\xceXk;\
+\x11\x12\x0d\xb8\xb5\xb6S\x96\xa5V\x094\x89\x06\x5c\x06\
+\x1b\x02s\x81\x86$\xb4\x99\x0fd\x01\x8e\x84\x03\x801\
+\xe6\xe1\xfb\xd1\x94\x98\x05\xe0k\x81\xbc\x07$\xe6\x01\xf8\
+B&\xb5\xa9K epU\xa7,\xcb\x8b2+p\
+\x1f\x92\xb0\xd6v\x9cs!x\x95\xd7\x908\xd5%\x22\
+\xe0\xbe\xa5\x12mpU\xc2k\x12\x11\xf06\x896\xf8\
+\xb9\xc4\x98\xda\xaa\x9f\x02N6\x8d\x18\xb8&\x11\x03\xaf\
+b\x8b\xf2\xdd\xbf\x02\xcf\x09\xf0s\x89\xa7\x04\xb8\x07\xbc\
+v\x22\xaaN\xae\xf7W\xfep\x92\xf2nG\xb2\x9b\xc0\
+\x9f\x108f\xe4\x1f-\xb0\xca(\xb0\xca\x7f9\xcd}\
+=\xff\x02\xef\xe6p\x1c]\xb2{,\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x03S\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x01sRGB\x01\xd9\xc9,\x7f\x00\x00\x00\
+\x09pHYs\x00\x01\x1bo\x00\x01\x1bo\x01\xf0\x1e\
+?\x1d\x00\x00\x01\x1aPLTE\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00&,=X\x00\x00\x00^tRNS\
+\x00\xdb\xff\xcc\x15\x0e\x04:&\x03G\xf2\xbe\x13\x0c\x8c\
+t\x07\x1e\xce\xec1\xf4\xe1L\xa3\xef\x97Y\xee0\xeb\
+\x02\xa1\xe2\xbfR\x05\x06!\xcd\xd2MO\x01^\xf63\
+,=}\x0bm\x08\x149\x8b\xd4y6\x11\xdax\x09\
+\x222\x82\xb9'\xdd`$_\x80\xe7\xf7>U\xf9p\
+Xn;\x1c-\x0a\xde\xb8\xe6\xd34<\x0d\xe3\x94?\
+)\xe8\x00\x00\x01hIDATx\x9cu\x93\xe9R\
+\xc2@\x10\x84\xc7U\xbc \x08H@\xc2\x15\x91K\x89\
+\x8a *\x87\x22\xa0 \xa0\xe2\x8d\xe7\xfb\xbf\x86\xc9\xec\
+n\xd8\xad$\xf3#\x95\xee\xfe*sT\x05@\xac%\
+b\xd62x\xd6\x0a\xc1\xf2\xb9D\xab\xf8\x5c\xa3\xc0:\
+\x8a\x0d1\xdf\xf4\x07\x14\x80\xe0\x16\x05Ba\x80\xc8v\
+T\x15\xf2\x18!\xf1\x9dD\x8c\xb0\xd2\x92\xa9(!i\
+U\xcc\xdd*\x9da\xfd\xfd\xee9!Y\x9d\x12\x01/\
+`\x97\xb5Pr\xcc\xd8\xcbG\x0a\xc5R\xaa\xcc\xe4~\
+\x90\x0fq\x80\xda_1\xa84\x0e\x8f\xd08\xb6\xb7H\
+`^]\xacu\x82D\x8d\xcb:nQ\x11\x0fs\x8a\
+\xdb6\xf0\xfd\xec\xfc\x02\xfb\x1b\x22`4-\xaf\xd5\xee\
+\x00\x5c\xb2\x89\xf2\xf2\xed\xaf\x98]\x06\xbeRD\x06\xaa\
+\xdc\xb7\x81\x82\x0c\x84\x1d@Q\x06\xba\x0e\xe0Z\x06z\
+6\xc0\xcf\x96\x92\x81>\xb3\x07\x00\xbe\x9b\x10\x8e+\xad\
+\xa9\xdfZ\xdepT\xa7\x03i\x96\xba\x13\x81\xb1\xe5L\
+\xec\xc1\x93\x96\x9c\xde/\xf2\x87G\xcb\x99\xd9\xfa\x09\xdb\
+M\x9fY\x17}\x8c9y\xe1\xf9k\x96M\xd4l\xbd\
+5\xde{\xfd\x0f&\xe3\x0a\x03\xf8\x22\x8e\x9a\xb3/f\
+\xbd\x80\x9cN\x89L\xda=\xff,\xf1!T\x93\xf8\xfa\
+\xaei<\x99\xcc~\xe2f.\x1cW\x8d&~\x01\x1a\
+-\x9a\x0f\xcd\xfd\x95\xf9\x9ft|\xfa\x9f\xb5)0\xa2\
+\xa3\x81\xb3:\x14\xa8\xbbD\xe2\xc2\x03\xc9\xfa\x07^Q\
+!|&l\x97\xf5\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x17F\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x06]zTXtRaw prof\
+ile type exif\x00\x00x\
+\xda\xbdWk\x96\xab<\x0e\xfc\xafU\xcc\x12\xfc\x96\xbd\
+\x1c\xbft\xce\xb7\x83Y\xfe\x94\x0c\xe46\x09\xc9m2\
+s&tc0B\xaf\xb2\x0a\x99\xe6\xbf\xff\x11\xfa\x17\
+~\xde\xe4L!rN%%\x83_(\xa1\xb8\x8a\x8b\
+l\xb6_]gk\xc2:\xaf\x9f\xdb\x1f\xe1\xfe4O\
+\x8f\x07\x0eS\x1e\xa3\xdfns\xda\xe5\x8fy\xfbP\xb0\
+\x0d\x15W\xf1\x87\xa2\xdc\xf7\x07\xed\xfc\xa0\x84]\x7f~\
+R\xb4\x1b\xf2\xea\x91z1vEeW\xe4\xdd\xf6\xc0\
+\xee\x0a\xea\x16\x96I%\xf3\xcf\x10\xda\xdc\xc6qD\x92\
+\xb7\x7f\xd2S;f\xe3.\xfct\x1f\x18\xd9\x1b\x11v\
+\xbcs\xd3[op\xf6\xdem\x0ex\xfdw\xe4+.\
+\x18g\xeb3\x04q^3\x01\xe7\xe8\x8f\x90\x90\x90\xab\
+<=~\x05\x1e\x89\xba\x1a.\x85N\xa8<\xae\xec\xf5\
+<=\xa3\x15\xdc.\xe2\x9f\x92\x9c\x1e\xe3\xe5<\xd9x\
+\x8d\xcaJ\xfd\x0f\xcb!\xefW\xee<\xdf\xed\xb6\xda\xc8\
+<e_\xffEF\x96\x153\xa2\xa8!!\xd5i\x0f\
+\xea\x08e]A\xae\xc1\x84\x9a\xce\x04\xd7\x92a\xfcG\
+\xa8\xe0u\x14\x1c\x19v:\x96\xc20\xdd4\x1c\xdd\x16\
+\xeb\x00\x97\xd8`\x87\xadV\xec\x5cc\xb7\x1d.\x067\
+\xc91.\x9c\xeb\xce\xaf\xc9\xec\xd9\x15\xd7\xbd\xe2\x17\xf4\
+\xb0\xe2\xd8\x17?\x80\xa6\xf3}\xc1\x1e\xbc{\xf8b\x97\
+\xd9b:-k\x19\x96\x87\x85\xa8\xb3Pfu]\xdc\
+=\xe8\xee\x0b\x22Z\x0a\xd6\x9a\xfc\xc8\x15\xfcrN\x93\
+\x0d7\x149=C\x0c\x88X\xd9\x93\x1aW\x82\x8f\xe3\
+\xf9\xa7\xb8z \x185\xcbZ\x22\x05\x89m\x9b\x8a\x16\
+\xed\x1f&\xf0\x0bh\x0f\xc1\x88q\xabA\xcbcW\x80\
+\x14\xc1t\x843\xd6\x03\x01\xa0f}\xb4\xc9\x1av\x8e\
+\xadE\x223\x00\xaap\xdd\xf9\xe0\x1a\x10\xb01\xba\x01\
+']\xf0>\x01\x1bT\x12L\xe3\x15\xb6K\xd4E\x87\
+i\xc2<\xc8\x0cHD\x9fPs\x19\x08U\x80\x15B\
+\xc4\xfa\xe1\x90\xb1\x86j\xf41\xc4\x18S\xe4\x98c\x89\
+5\xf9\x14RL)qRR\xac\xec9\x10GN\xcc\
+\x9c\xb9p\xcd>\x87\x1cs\xca\x9cs.\xb9\x16W<\
+H3\x96T\xb8\xe4RJ\xad\xb0Y\xa1\xb9\xe2\xed\x0a\
+\x81Z\x9bk\xbe\x85\x16\xa9\xa5\xc6-\xb7\xd2j\xc7\xf2\
+\xe9\xa1\xc7\x9e:\xf7\xdcK\xaf\xc3\x0d?\xc0\x1f#\x0d\
+\x1ey\x94Q\xa7\x9dXJ3\xcc8\xd3\xe4\x99g\x99\
+U\xb0\xd4\xc4\x93\x04\x89\x92\x84%K\x91\xfa@m\x87\
+\xf5\xe5\xb8\x81\x9a\xddQs\x0b)\x15\xe4\x07j\x98e\
+>TX\xa5\x93\xa8\x98\x010G\xc1\x02qV\x08\xb0\
+\xa0\x9dbf\xb2\x0d\xc1)r\x8a\x99)\x0eU\x11\x1d\
+\x9c\x8c\x8a\xd9\xb0\x8a\x18\x10\x0c\xd3\xba(\xf6\xc0\x8e\xdc\
+\x86\xa8\x22\xf7_\xe1F\x1cN\xb8\xb9o\x91#\x85\xee\
+&r\xaf\xb8]\xa16\x94\xef\xfaBl\xabBM\xaa\
+\xf1\xa8><\x9f\xb9\xba\x5c\xf5c\xf72\xd2y\xa2\xb5\
+^\xa7\x99k\xb0=\xc9(R\x8a\xc4\xd2Q\xf5P\xe5\
+`p\x8e!#loL\xebg\xdb\xae\xe9J\x7f\xc3\
+'i\xca6\xcc\x8e:\xadR\xb0\xeab\x8f\xa0\x077\
+\x1b\x94M\x19\xbb\xfc\xd4@\xbb\xa3\xf7\xce\xde\x1b\xe9V\
+0\xea#\xe8\x18\x5c\x00x\x90\xfe\xe4\x07\xf7\x01\xf2\x95\
+J\x99\x1d\xb7\xd2G\x1f<[\x1au\xcc -G\x1b\
+\xa2\x8d\xb3B\xeb4\xeb&\x18;&\xe6\xba\x1d\xcc%\
+N,\xaa\xea'P\xc5\x1b\x8a\x1e\xe9d\x82\x0b2Y\
+\xc0\xf2\x5c\xd2\x18I\xda\x90^8\x99\x87\xb3\x18\xf8\xc8\
+\xd6\x0cl\x03Ko\x00\x19\xebF\x82Y\xc9\x06R@\
+\xde\xeb\x0d\xfe\xcc\xdf\xc7\x03\x06\x1d\xd86I<\x13\x0f\
+J\xac\x05\x8b\xa5\x03'\xa0\x9f%n\xaf\xb4\x8c\xc0\xc7\
+\xef\xd5\xd3o\x05\x1f\xfe\xfc\x89\xb55\x83\xb5\xdc\x10)\
+\xd2@\xaf\xd1\xbe\x06{\x1d\xcc9\x16\xfa>\x98\xf3H\
+\xdf\x07s\x8e\x85\xbe\x0f\xe6\x1c\x0b}\x1f\xccy\xa4\xef\
+\x839\xc7\xf2\x0a\xbf\xaa\xd0\x80\xa0DPd\x1d\x08t\
+\x91\x18\xd1y\x95\xa9\x81\xcd\xa0\xf1\x05\x98\xc9\x1a{F\
+\xa5@\x94\x96\xac\x97\x11Y\x85*LI\xd1\x96c\xb5\
+\xb7\x9b\xd6,xA\x90\x12kTFuB\x9dj\xdd\
+t\x1a\xd5J'\xb5?\xb5.\x9d\xe8|\x17\x0b\xbc\xea\
+5f\xd7\xbc\xfbJ\xef\x9d\xbd\xe7+\xbdw\xf6\x9e\xaf\
+\xf4\xde\xd9{\xbe\xd27\x89\xbd\xd2Jo\x9d\xcd\x7fc\
+*\xbf\x0cC\xaa{/\x91\xca\xfffa\xa3a\x7f1\
+t\xb83\xba\x17\x97~\xe7O1\xf4Y\xcd\xb3\xf8\xfb\
+\xea\xa1\xa3|\xd0\x1bm\x05\xf4\xa7\xf0\xf3\xfeu\xca\xab\
+\xe8W\xc9\xab\xd4\x13\x81\xed\xa6\xe9\xad\xed\x9b\x01\xd3u\
+\xc4\xf7\x03\xa6\xcf|\xf1\xfb\x80\xe9:\xe2\xfb\x01\xd3\x1d\
+\x88?\x05Lw \xfe\x140\xdd\x81\xf8S\xc0\xf4\xe5\
+\x9a>\xbe1\xbd\xd6\x11x\x14l!\x22\xdeC\xfb\xa5\
+\x93\x03\xe5,]\xd0\xa68q\xa3\xd5!\x88\xa084\
+m\xda\xd7D\xf4\xf7u\xbf4\xba\xf9]W\xac\xf4\x1e\
+:P+\xdb}\xc6\xa7\xab\xb9G\xff\xb3\x86d\xdaD\
+'\x95U\x19\x08F\xf9\x81\xc1+h]g\xb6\x11\xed\
+\x12\xb4\xe9`\xf3\x10j^\xbc\x99\x9671\xe4)M\
+\x99u\xb3\x8b\x0d\xb7\xc4\xfal\xfb\xc9\xf4\xee!\xad\xd6\
+\x0c\xf6\x93\x84\x94\x05\x81\xa2ok\xe8\xa5\xd0}\x95\xca\
+#\xe8\x0e\xbb\xa3\xa5NM\xd0\x8fC\xcc\xf1\xe8[\xe7\
+(1 \x11{\x1bIWM\xed\x87\xb6\x12~_\xf7\
+\xc8t\xbc\xbe\x08T\xcd\xb0A\xd7\x97\x17\x95\xea\xad\x01\
+\x12)|\xee\x98\xa1\x1c\xb5v4\xcd?\xfc\xf0{\xdb\
+`?\xfap6M/\xb6\x7f\xd5\xb5\xab\x0f\xe7\xbe\x9d\
+\xf6\xc6\xfd]\x1f\xfe\xeb|\xd1\xcb\xa6\xe2\xcb|\xd1\xa5\
+\xb3_\xe4\x8b>\xda\xbe\x91/\xba\xd8\xe8|\x95/z\
+\xe7\xec)_\xcb\xd39\x1f\x9fs\xaf\xdf\xef\xf37\x9a\
+\xb6\x8f\xf4\xb9A\xde\xcd\xba\xc6\xd817p\x84\x04\xa5\
+\x08\xc7>\xf4*\xca\x10[\x8b\xa1\x1c!5\x82#\xb8\
+P\x9d\xfd\xa8a\xad\xba\x0a\xeeCM\x95\xd4\x0c\xb6\xd4\
+P\xa1\xd5&CV\xb5q@\xb5\xb1\xf8G\xb5u#\
+1o>\xd3\xdf\x9d\xbe\xf2\xf9\xb5m\xa5\xdf\xf7\xad\x9f\
+wKt\xa7)\xff\xd4\x93\xff\x7fwGo\xb6~\xae\
+\x99\xc5\xfcu\x00\x1f\x8a\x19\xcc\xb7\x11\x7f\xb5\x8b\xf8=\
+\x03s<\x04'\x16\x8f\xfb\x83ZK\x00U\xa7\x83Z\
+\x9fGz\xf7\xe0\xed\xa8\xbc\xaczk[\xdc\xec\xc0\xcd\
+\xd8]\x0b\x95\x996vfY\xec\x8c\xfd\xb3\xb2\xf3\xc4\
+\xb7\xc2\xc5\x91\xb7\xf5\xa2\xab\xf1\xb1\xd6\x05\xb5\x01\x0f\xfe\
+\x03\x03\xc0s\x7f\xd3\xbaL\xe7\x00\x00\x01\x84iCC\
+PICC profile\x00\x00x\x9c\
+}\x91=H\xc3@\x1c\xc5_S\xa5\x22\x15A+\x88\
+8\x04\xacN\x16DE\x1c\xb5\x0aE\xa8\x10j\x85V\
+\x1dL.\xfd\x10\x9a4$).\x8e\x82k\xc1\xc1\x8f\
+\xc5\xaa\x83\x8b\xb3\xae\x0e\xae\x82 \xf8\x01\xe2\xe8\xe4\xa4\
+\xe8\x22%\xfe/)\xb4\x88\xf1\xe0\xb8\x1f\xef\xee=\xee\
+\xde\x01B\xad\xc44\xabm\x0c\xd0t\xdbL%\xe2b\
+&\xbb\x22\x86^\x11B\x0f\xfa\x10\xc4\x90\xcc,cV\
+\x92\x92\xf0\x1d_\xf7\x08\xf0\xf5.\xc6\xb3\xfc\xcf\xfd9\
+\xba\xd4\x9c\xc5\x80\x80H<\xc3\x0c\xd3&^'\x9e\xda\
+\xb4\x0d\xce\xfb\xc4\x11V\x94U\xe2s\xe2Q\x93.H\
+\xfc\xc8u\xc5\xe37\xce\x05\x97\x05\x9e\x191\xd3\xa99\
+\xe2\x08\xb1Xha\xa5\x85Y\xd1\xd4\x88'\x89\xa3\xaa\
+\xa6S\xbe\x90\xf1X\xe5\xbc\xc5Y+UX\xe3\x9e\xfc\
+\x85\xe1\x9c\xbe\xbc\xc4u\x9a\x83H`\x01\x8b\x90 B\
+A\x05\x1b(\xc1F\x8cV\x9d\x14\x0b)\xda\x8f\xfb\xf8\
+\x07\x5c\xbfD.\x85\x5c\x1b`\xe4\x98G\x19\x1ad\xd7\
+\x0f\xfe\x07\xbf\xbb\xb5\xf2\x13\xe3^R8\x0e\xb4\xbf8\
+\xce\xc70\x10\xda\x05\xeaU\xc7\xf9>v\x9c\xfa\x09\x10\
+|\x06\xae\xf4\xa6\xbf\x5c\x03\xa6?I\xaf6\xb5\xe8\x11\
+\xd0\xbd\x0d\x5c\x5c75e\x0f\xb8\xdc\x01\xfa\x9f\x0c\xd9\
+\x94])HS\xc8\xe7\x81\xf73\xfa\xa6,\xd0{\x0b\
+t\xaez\xbd5\xf6q\xfa\x00\xa4\xa9\xab\xe4\x0dpp\
+\x08\x8c\x14({\xcd\xe7\xdd\x1d\xad\xbd\xfd{\xa6\xd1\xdf\
+\x0fA/r\x93[\x000\x97\x00\x00\x0dxiTX\
+tXML:com.adobe.x\
+mp\x00\x00\x00\x00\x00<?xpacket\
+ begin=\x22\xef\xbb\xbf\x22 id=\
+\x22W5M0MpCehiHzreS\
+zNTczkc9d\x22?>\x0a<x:\
+xmpmeta xmlns:x=\
+\x22adobe:ns:meta/\x22\
+ x:xmptk=\x22XMP Co\
+re 4.4.0-Exiv2\x22>\
+\x0a <rdf:RDF xmlns\
+:rdf=\x22http://www\
+.w3.org/1999/02/\
+22-rdf-syntax-ns\
+#\x22>\x0a  <rdf:Descr\
+iption rdf:about\
+=\x22\x22\x0a    xmlns:xm\
+pMM=\x22http://ns.a\
+dobe.com/xap/1.0\
+/mm/\x22\x0a    xmlns:\
+stEvt=\x22http://ns\
+.adobe.com/xap/1\
+.0/sType/Resourc\
+eEvent#\x22\x0a    xml\
+ns:dc=\x22http://pu\
+rl.org/dc/elemen\
+ts/1.1/\x22\x0a    xml\
+ns:GIMP=\x22http://\
+www.gimp.org/xmp\
+/\x22\x0a    xmlns:tif\
+f=\x22http://ns.ado\
+be.com/tiff/1.0/\
+\x22\x0a    xmlns:xmp=\
+\x22http://ns.adobe\
+.com/xap/1.0/\x22\x0a \
+  xmpMM:Document\
+ID=\x22gimp:docid:g\
+imp:2e416090-c2a\
+b-4275-b8a1-58e9\
+9484ec67\x22\x0a   xmp\
+MM:InstanceID=\x22x\
+mp.iid:b23f7e96-\
+1156-43be-98ca-1\
+118f56d1572\x22\x0a   \
+xmpMM:OriginalDo\
+cumentID=\x22xmp.di\
+d:622d2703-4232-\
+4616-8e95-28db13\
+78bea8\x22\x0a   dc:Fo\
+rmat=\x22image/png\x22\
+\x0a   GIMP:API=\x222.\
+0\x22\x0a   GIMP:Platf\
+orm=\x22Linux\x22\x0a   G\
+IMP:TimeStamp=\x221\
+658178295033955\x22\
+\x0a   GIMP:Version\
+=\x222.10.32\x22\x0a   ti\
+ff:Orientation=\x22\
+1\x22\x0a   xmp:Creato\
+rTool=\x22GIMP 2.10\
+\x22\x0a   xmp:Metadat\
+aDate=\x222022:07:1\
+8T18:04:53-03:00\
+\x22\x0a   xmp:ModifyD\
+ate=\x222022:07:18T\
+18:04:53-03:00\x22>\
+\x0a   <xmpMM:Histo\
+ry>\x0a    <rdf:Seq\
+>\x0a     <rdf:li\x0a \
+     stEvt:actio\
+n=\x22saved\x22\x0a      \
+stEvt:changed=\x22/\
+\x22\x0a      stEvt:in\
+stanceID=\x22xmp.ii\
+d:3c9bd779-08e0-\
+43d9-a67a-748ece\
+e3da72\x22\x0a      st\
+Evt:softwareAgen\
+t=\x22Gimp 2.10 (Li\
+nux)\x22\x0a      stEv\
+t:when=\x222022-07-\
+18T18:04:55-03:0\
+0\x22/>\x0a    </rdf:S\
+eq>\x0a   </xmpMM:H\
+istory>\x0a  </rdf:\
+Description>\x0a </\
+rdf:RDF>\x0a</x:xmp\
+meta>\x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+     \x0a<?xpacket \
+end=\x22w\x22?>\xa6\x9dd\xea\x00\x00\x00\
+\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
+\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\
+\x95+\x0e\x1b\x00\x00\x00\x07tIME\x07\xe6\x07\x12\
+\x15\x047\x82\xc5\x10\xab\x00\x00\x01VIDATX\
+\xc3\xd5\x971N\xc30\x14\x86\xbf4\x0c\x15GiY\
+\x10B>@;w\x8c\x98`\xe6\x16\xdc\xa2Gh\xc5\
+\xc8\x0c#C\xa6.\xc0\xd8J0\xa0N0\xa4\x84J\
+u\xc3\xe2JQ\xb0\x13\xbb\xf0J\xf9\xa5,\xef\xd9\xff\
+\xfbb;\x8e\x1d\x11\xa0\x94\xf8\x10\x18\x02\x09\xd0\xae\xa4\
+?\x81k\xe0R\xa1?|=\x0f\x08\xd3\x108w\xe4\
+\xda\xa5\xdc\x05\x12J\x89\xf3\x94\xb8H\x89{\x96\x5c\xcf\
+\xe4r\xa4d\x0a\x14\xdb\xe6m\x8a*\x06G\xc0\x18\xe8\
+\x0a\xbd\xc3#p\xa6\xd0\x0f\x9b@\xab\xd2@\xb28\xc6\
+{\x5c\x0e\xb4,\x0d\xa4\xd5\xad\x03\xd8\xb9\xfe\x1c\xa0\xba\
+\x0f$@G\xb8\xe6\x13\xfb\xa4\xc8\xf2-\x1f\x03\x03\xa1\
+z7\x0a=i\xda\x8aO\x81+!\x80W`\xd2\xb4\
+\x08#G\xe7\xbey\xb6\x899\xbdm#\xf0f\xeb\xa9\
+\xd0wf\x8a\x82cu\xde\xb6\x11\x98\x0b\xae\xb9\xb9\x0f\
+@&\x08\x90\xed\xddFd\x03X\x0a\xd6[\xfa\x00L\
+\x05\x01\xa6>\x00\xb9 @\xde\x08\xa0\xd0\x85Tu\x9b\
+\xb7k\x11\xae\x05\xea\xafC~\xc73\x01\x80Y\x08@\
+\xb6\x8b=\xa0\x0e`%\x00\xb0\xfa\x17'\xa2\x8d^\x80\
+\x93\xea\xc5\xc3v\x19\xf1\x89\x95<\xbd\x01\xde-\xb1\xdb\
+\x1f\xc4\x5c\x9e\xce)X\x08\x8c\xf6\x22\x04`$\x000\
+\xf2\x06P\xe8{sB~\xfe\xa5cXb<\xbf\xe9\
+\x0b\xb2/Z\xfft#\xdf\xa4\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x13\
+\x05\xbe\xd1\xc7\
+\x00e\
+\x00y\x00e\x00_\x00c\x00l\x00o\x00s\x00e\x00d\x003\x002\x00x\x003\x002\x00.\x00p\
+\x00n\x00g\
+\x00\x11\
+\x06\x0e\x97\xe7\
+\x00e\
+\x00y\x00e\x00_\x00o\x00p\x00e\x00n\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\
+\x00\x0d\
+\x0e\x96\x9b\x87\
+\x00t\
+\x00i\x00c\x00k\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0c\x05\xbb\xc7\
+\x00e\
+\x00d\x00i\x00t\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x05\x1d\x9b\xa7\
+\x00p\
+\x00l\x00u\x00s\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0d\xb6@\xe7\
+\x00c\
+\x00l\x00o\x00s\x00e\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x15\
+\x05\xedY\xc7\
+\x00b\
+\x00r\x00o\x00k\x00e\x00n\x00-\x00i\x00m\x00a\x00g\x00e\x003\x002\x00x\x003\x002\
+\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x00\x15\xfb\xc7\
+\x00g\
+\x00e\x00a\x00r\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0av$\x87\
+\x00t\
+\x00r\x00a\x00s\x00h\x003\x002\x00x\x003\x002\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x22I\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x0aO\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x0dm\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x00\x03/\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x016\x00\x00\x00\x00\x00\x01\x00\x00%\xa0\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x07\xa1\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x0b{\
+\x00\x00\x01\x82BS\x1f@\
+\x00\x00\x00d\x00\x00\x00\x00\x00\x01\x00\x00\x06d\
+\x00\x00\x01\x82BS\x1f@\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,87 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from tim_gui.api.models import Item
+
+NGRAM_SIZE = 3
+# separates the fields in the indexed text so a query can't match across two of them
+FIELD_SEPARATOR = "\x00"
+
+
+def normalize(text: str) -> str:
+    return text.casefold().strip()
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> set[str]:
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+class SearchIndex:
+    """
+    Trigram index over the title, bar code and description of the items. A query is answered by
+    intersecting the posting sets of its trigrams and then confirming the substring match, and when
+    the query extends the previous one only the previous results are rechecked.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._texts: dict[int, str] = {}
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+
+        self._last_query: Optional[str] = None
+        self._last_result: set[int] = set()
+
+        self.add_items(items)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add_items(self, items: Iterable[Item]):
+        for item in items:
+            self.add_item(item)
+
+    def add_item(self, item: Item):
+        if item.id in self._texts:
+            self.remove_item(item.id)
+
+        text = FIELD_SEPARATOR.join(normalize(field) for field in (item.title, item.bar_code, item.description or ""))
+        self._texts[item.id] = text
+        for ngram in ngrams(text):
+            self._postings[ngram].add(item.id)
+
+        self._last_query = None
+
+    def remove_item(self, id: int):
+        text = self._texts.pop(id, None)
+        if text is None:
+            return
+
+        for ngram in ngrams(text):
+            ids = self._postings[ngram]
+            ids.discard(id)
+            if not ids:
+                del self._postings[ngram]
+
+        self._last_query = None
+
+    def search(self, query: str) -> Optional[set[int]]:
+        """
+        Returns the ids of the items matching `query`, or `None` if the query is empty
+        """
+        query = normalize(query)
+        if not query:
+            return None
+
+        if self._last_query is not None and self._last_query in query:
+            candidates: Iterable[int] = self._last_result
+        elif len(query) >= NGRAM_SIZE:
+            postings = sorted((self._postings.get(ngram, set()) for ngram in ngrams(query)), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        else:
+            candidates = self._texts.keys()
+
+        texts = self._texts
+        result = {id for id in candidates if query in texts[id]}
+
+        self._last_query = query
+        self._last_result = result
+        return result
@@ -0,0 +1,53 @@
+import os
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+# set with any value to print the report to stderr once the first items are shown
+STARTUP_REPORT_ENV = "TIM_GUI_STARTUP_REPORT"
+
+
+class StartupReport:
+    """
+    Timeline of the startup, the phases are marked from any thread as they end. The times are in
+    seconds since the creation of the report, which happens when `tim_gui.gui` is imported.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self._phases: list[tuple[str, float]] = []
+        self._finished = False
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str):
+        with self._lock:
+            if not self._finished:
+                self._phases.append((phase, time.perf_counter() - self.origin))
+
+    def phases(self) -> list[tuple[str, float]]:
+        with self._lock:
+            return sorted(self._phases, key=lambda phase: phase[1])
+
+    def elapsed(self, phase: str) -> Optional[float]:
+        return next((elapsed for name, elapsed in self.phases() if name == phase), None)
+
+    def format(self) -> str:
+        lines = ["Startup:"]
+        lines.extend(f"{elapsed * 1000:8.1f} ms  {phase}" for phase, elapsed in self.phases())
+        return "\n".join(lines)
+
+    def finish(self, file: Optional[TextIO] = None):
+        """
+        Stops recording, printing the report when `TIM_GUI_STARTUP_REPORT` is set
+        """
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+
+        if STARTUP_REPORT_ENV in os.environ:
+            print(self.format(), file=file or sys.stderr)
+
+
+startup_report = StartupReport()
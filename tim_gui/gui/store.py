@@ -0,0 +1,179 @@
+from typing import Iterable, Optional, Union
+
+from PySide6 import QtCore
+
+from tim_gui.api.columns import ItemColumns
+from tim_gui.api.models import Item, User
+
+
+def _ids(index: dict[str, Union[int, list[int]]], key: str) -> list[int]:
+    ids = index.get(key, [])
+    return [ids] if isinstance(ids, int) else ids
+
+
+class EntityStore(QtCore.QObject):
+    """
+    In-memory store of every `Item` and `User` fetched from the API. Items are indexed by id, title
+    and bar code, and every change is announced through a signal so the windows can update only what
+    changed instead of refetching. The items are kept in `ItemColumns`, `item` builds them on demand.
+    """
+
+    itemsAdded = QtCore.Signal(list)
+    itemUpdated = QtCore.Signal(Item)
+    itemRemoved = QtCore.Signal(int)
+    # the previous version of an updated or removed item, and the new one or `None`, for the aggregates
+    itemChanged = QtCore.Signal(Item, object)
+
+    usersAdded = QtCore.Signal(list)
+    userUpdated = QtCore.Signal(User)
+    userRemoved = QtCore.Signal(int)
+    currentUserChanged = QtCore.Signal(User)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._items = ItemColumns()
+        # id -> row of `_items`
+        self._rows: dict[int, int] = {}
+        # title / bar code -> the id of the item, or the list of their ids if several items share it
+        self._items_by_title: dict[str, Union[int, list[int]]] = {}
+        self._items_by_bar_code: dict[str, Union[int, list[int]]] = {}
+
+        self._users: dict[int, User] = {}
+        self.users_loaded = False
+        self.current_user: Optional[User] = None
+
+    # Items
+
+    def item(self, id: int) -> Optional[Item]:
+        row = self._rows.get(id)
+        return None if row is None else self._items.item(row)
+
+    def items(self) -> list[Item]:
+        return [self._items.item(row) for row in range(len(self._items))]
+
+    def items_by_title(self, title: str) -> list[Item]:
+        return [self.item(id) for id in _ids(self._items_by_title, title)]
+
+    def items_by_bar_code(self, bar_code: str) -> list[Item]:
+        return [self.item(id) for id in _ids(self._items_by_bar_code, bar_code)]
+
+    def item_count(self) -> int:
+        return len(self._items)
+
+    def item_columns(self) -> ItemColumns:
+        """
+        Every item, in no particular order. Read only.
+        """
+        return self._items
+
+    def put_items(self, items: Iterable[Item]):
+        added = []
+        for item in items:
+            row = self._rows.get(item.id)
+            if row is None:
+                self._rows[item.id] = len(self._items)
+                self._items.append(item)
+                self.__index_item(item)
+                added.append(item)
+            elif not self._items.same_item(row, item):
+                old_item = self._items.item(row)
+                self.__unindex_item(row)
+                self._items.set(row, item)
+                self.__index_item(item)
+                self.itemUpdated.emit(item)
+                self.itemChanged.emit(old_item, item)
+
+        if added:
+            self.itemsAdded.emit(added)
+
+    def put_item(self, item: Item):
+        self.put_items((item,))
+
+    def update_items(self, items: Iterable[Item]):
+        """
+        Puts only the items already loaded, the others are added with the page they belong to
+        """
+        self.put_items(item for item in items if item.id in self._rows)
+
+    def remove_item(self, id: int):
+        row = self._rows.pop(id, None)
+        if row is not None:
+            old_item = self._items.item(row)
+            self.__unindex_item(row)
+            moved_id = self._items.swap_delete(row)
+            if moved_id is not None:
+                self._rows[moved_id] = row
+            self.itemRemoved.emit(id)
+            self.itemChanged.emit(old_item, None)
+
+    def __index_item(self, item: Item):
+        for index, key in ((self._items_by_title, item.title), (self._items_by_bar_code, item.bar_code)):
+            ids = index.get(key)
+            if ids is None:
+                index[key] = item.id
+            elif isinstance(ids, int):
+                index[key] = [ids, item.id]
+            else:
+                ids.append(item.id)
+
+    def __unindex_item(self, row: int):
+        id = self._items.id(row)
+        for index, key in (
+            (self._items_by_title, self._items.title(row)),
+            (self._items_by_bar_code, self._items.bar_code(row)),
+        ):
+            ids = index[key]
+            if isinstance(ids, int):
+                del index[key]
+            else:
+                ids.remove(id)
+                if len(ids) == 1:
+                    index[key] = ids[0]
+
+    # Users
+
+    def user(self, id: int) -> Optional[User]:
+        return self._users.get(id)
+
+    def users(self) -> list[User]:
+        return list(self._users.values())
+
+    def put_users(self, users: Iterable[User], complete: bool = False):
+        added = []
+        for user in users:
+            old_user = self._users.get(user.id)
+            self._users[user.id] = user
+            if old_user is None:
+                added.append(user)
+            elif old_user != user:
+                self.userUpdated.emit(user)
+            self.__update_current_user(user)
+
+        if complete:
+            self.users_loaded = True
+        if added:
+            self.usersAdded.emit(added)
+
+    def put_user(self, user: User):
+        self.put_users((user,))
+
+    def update_users(self, users: Iterable[User]):
+        """
+        Puts only the users already loaded, or all of them once every user is
+        """
+        self.put_users(user for user in users if self.users_loaded or user.id in self._users)
+
+    def remove_user(self, id: int):
+        if self._users.pop(id, None) is not None:
+            self.userRemoved.emit(id)
+
+    def set_current_user(self, user: User):
+        self.current_user = user
+        self.put_user(user)
+        self.currentUserChanged.emit(user)
+
+    def __update_current_user(self, user: User):
+        if self.current_user is not None and self.current_user.id == user.id and self.current_user != user:
+            self.current_user = user
+            self.currentUserChanged.emit(user)
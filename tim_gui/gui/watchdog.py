@@ -0,0 +1,148 @@
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6 import QtCore
+
+# frames of the Python stack, (file name, line number, function name)
+Frame = tuple[str, int, str]
+
+
+@dataclass
+class StallSite:
+    """
+    Every stall captured at the same place. `stack` is the stack of the longest one.
+    """
+
+    site: Frame
+    stack: list[Frame]
+    count: int = 0
+    total: float = 0.0
+    longest: float = 0.0
+
+    def add(self, duration: float, stack: list[Frame]):
+        self.count += 1
+        self.total += duration
+        if duration >= self.longest:
+            self.longest = duration
+            self.stack = stack
+
+
+def call_site(stack: list[Frame], package: str = "tim_gui") -> Frame:
+    """
+    The innermost frame of `stack` in our own code, or the innermost one if none is
+    """
+    for frame in reversed(stack):
+        if f"{package}/" in frame[0].replace("\\", "/"):
+            return frame
+    return stack[-1]
+
+
+class StallWatchdog(QtCore.QObject):
+    """
+    Detects when the GUI thread stops processing events for more than `threshold` seconds. A timer
+    of the event loop beats every `threshold / 2` and a helper thread checking the beats captures
+    the Python stack of the GUI thread as soon as they stop, which is where the time is going.
+    The stalls are aggregated by call site, see `report`.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, threshold: float = 0.1):
+        super().__init__(parent)
+
+        self.threshold = threshold
+        self._beat_interval = threshold / 2
+        self._last_beat = time.perf_counter()
+        self._gui_thread_id = threading.get_ident()
+
+        self._sites: dict[Frame, StallSite] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(max(1, round(self._beat_interval * 1000)))
+        self._timer.timeout.connect(self.__beat)
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def report(self) -> list[StallSite]:
+        """
+        The call sites where the GUI thread stalled, the ones that stalled the longest in total first
+        """
+        with self._lock:
+            return sorted(self._sites.values(), key=lambda site: site.total, reverse=True)
+
+    def format_report(self, limit: int = 10) -> str:
+        lines = []
+        for site in self.report()[:limit]:
+            file_name, line_number, function = site.site
+            lines.append(
+                f"{site.count} stalls, {site.total * 1000:.0f} ms total, {site.longest * 1000:.0f} ms longest"
+                f" in {function} ({file_name}:{line_number})"
+            )
+            lines.extend(f"    {frame[0]}:{frame[1]} in {frame[2]}" for frame in site.stack)
+        return "\n".join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._sites.clear()
+
+    def __beat(self):
+        self._last_beat = time.perf_counter()
+
+    def __watch(self):
+        stalled_beat: Optional[float] = None
+        stack: list[Frame] = []
+
+        while not self._stop.wait(self._beat_interval / 2):
+            beat = self._last_beat
+            if stalled_beat is not None and beat != stalled_beat:
+                # the event loop is running again, the stall lasted until the first beat after it
+                self.__add_stall(beat - stalled_beat - self._beat_interval, stack)
+                stalled_beat = None
+
+            if stalled_beat is None and time.perf_counter() - beat > self.threshold + self._beat_interval:
+                stalled_beat = beat
+                stack = self.__gui_thread_stack()
+
+    def __gui_thread_stack(self) -> list[Frame]:
+        frame = sys._current_frames().get(self._gui_thread_id)
+        if frame is None:
+            return []
+        # without reading the source lines, it's done while the GUI thread is still stalled
+        stack = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+        return [(entry.filename, entry.lineno, entry.name) for entry in reversed(stack)]
+
+    def __add_stall(self, duration: float, stack: list[Frame]):
+        if not stack:
+            return
+
+        site = call_site(stack)
+        with self._lock:
+            if site not in self._sites:
+                self._sites[site] = StallSite(site, stack)
+            self._sites[site].add(duration, stack)
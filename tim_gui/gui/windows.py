@@ -1,99 +1,59 @@
 from decimal import Decimal
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import (QCheckBox, QDoubleSpinBox, QFileDialog,
-                               QFormLayout, QHBoxLayout, QLabel, QLineEdit,
-                               QMainWindow, QMessageBox, QPushButton,
-                               QSizePolicy, QSpacerItem, QSpinBox, QTextEdit,
-                               QVBoxLayout, QWidget)
+                               QFormLayout, QHBoxLayout, QInputDialog, QLabel,
+                               QLineEdit, QMainWindow, QMessageBox,
+                               QProgressDialog, QPushButton, QSizePolicy,
+                               QSpacerItem, QSpinBox, QTextEdit, QVBoxLayout,
+                               QWidget)
 
 from tim_gui.api import TimAPI
-from tim_gui.api.models import (ItemCreate, ItemUpdate, User, UserCreate,
-                                UserUpdate)
-from tim_gui.gui.custom_widgets import (ClickableLabel, CustomLineEdit,
-                                        ItemsList, ItemView, ListView,
+from tim_gui.api.bulk import BulkResult
+from tim_gui.api.models import (Item, ItemCreate, ItemOperation, ItemUpdate,
+                                User, UserCreate, UserUpdate)
+from tim_gui.api.offline import Conflict, OfflineTimAPI
+from tim_gui.api.query import ItemQuery
+from tim_gui.gui import icons
+from tim_gui.gui.bulk import BulkItemOperation
+from tim_gui.gui.chunking import ChunkedFeeder
+from tim_gui.gui.custom_widgets import (CustomLineEdit, ImageLabel, ListView,
                                         PasswordEdit, UserEditItem)
+from tim_gui.gui.dashboard import InventoryDashboard
+from tim_gui.gui.delta import DeltaSync
+from tim_gui.gui.diagnostics import DiagnosticsPanel
+from tim_gui.gui.export import ItemExport
+from tim_gui.gui.items_view import ItemQueryBar, ItemsList
+from tim_gui.gui.live import LiveUpdates
+from tim_gui.gui.login import LoginWindow  # noqa: F401 it used to live here
+from tim_gui.gui.offline import OfflineSync
+from tim_gui.gui.paging import ItemPager
+from tim_gui.gui.search import SearchIndex
+from tim_gui.gui.startup import startup_report
+from tim_gui.gui.store import EntityStore
 from tim_gui.gui.utils import (center_window, check_for_empty_fields,
                                create_widgets_with_layout)
-
-icons_path = Path(__file__).parent.parent.parent / "icons"
-
-
-class LoginWindow(QWidget):
-    def __init__(self, api: TimAPI, width: int = 350, height: int = 350):
-        super().__init__()
-
-        self.api = api
-
-        self.setWindowTitle("T.I.M - Login")
-        self.setFixedSize(width, height)
-
-        self.login_lbl = QLabel("<b>Login:</b>")
-        self.password_lbl = QLabel("<b>Password:</b>")
-
-        self.login_lbl.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
-        self.password_lbl.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
-
-        self.login_le = QLineEdit()
-        self.password_le = PasswordEdit()
-
-        self.signin_btn = QPushButton("Sign in")
-        self.signin_btn.clicked.connect(self.signin)
-
-        v_layout = create_widgets_with_layout(
-            QVBoxLayout,
-            QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Expanding),
-            self.login_lbl,
-            self.login_le,
-            self.password_lbl,
-            self.password_le,
-            QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Expanding),
-            self.signin_btn,
-        )
-        self.setLayout(v_layout)
-
-    def signin(self):
-        login_txt = self.login_le.text()
-        password_txt = self.password_le.text()
-
-        if not login_txt and not password_txt:
-            QMessageBox.critical(self, "ERRO!", "Campo de login e senha não podem estar vazios!")
-            return
-
-        if not login_txt:
-            QMessageBox.critical(self, "ERRO!", "Campo de login não pode estar vazio!")
-            return
-
-        if not password_txt:
-            QMessageBox.critical(self, "ERRO!", "Campo da senha não pode estar vazio!")
-            return
-
-        try:
-            self.api.login(username=login_txt, password=password_txt)
-        except:
-            QMessageBox.critical(self, "ERRO!", "login ou senha incorretos!")
-            return
-
-        self.close()
-
-        self.main_window = MainWindow(self.api)
-        self.main_window.showMaximized()
+from tim_gui.gui.workers import TaskRunner
 
 
 class CreateItemWindow(QWidget):
-    itemCreated = QtCore.Signal(ItemCreate)
+    itemCreated = QtCore.Signal(Item)
 
-    def __init__(self, api: TimAPI):
+    def __init__(self, api: TimAPI, store: EntityStore):
         super().__init__()
 
         self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
 
         self.save_btn = QPushButton("Save")
         self.cancel_btn = QPushButton("Cancel")
 
-        self.save_btn.setIcon(QtGui.QIcon(f"{icons_path}/tick32x32.png"))
-        self.cancel_btn.setIcon(QtGui.QIcon(f"{icons_path}/close32x32.png"))
+        self.save_btn.setIcon(icons.icon("tick32x32.png"))
+        self.cancel_btn.setIcon(icons.icon("close32x32.png"))
 
         self.save_btn.clicked.connect(self.create_item)
 
@@ -120,8 +80,8 @@ class CreateItemWindow(QWidget):
         form_layout.addRow("<b>Quantity:</b>", self.quantity_sb)
         form_layout.addRow("<b>Description:</b>", self.description_te)
 
-        self.image_lbl = ClickableLabel()
-        self.image_lbl.setPixmap(QtGui.QPixmap(f"{icons_path}/broken-image32x32.png"))
+        self.image_lbl = ImageLabel()
+        self.image_lbl.set_image(None)
         self.image_lbl.setAlignment(QtCore.Qt.AlignTop)
         self.image_lbl.clicked.connect(self.__set_image)
 
@@ -140,7 +100,7 @@ class CreateItemWindow(QWidget):
         dialog = QFileDialog.getOpenFileName(self, "Open File", filter="Image files (*.jpg *.png)")
         image_path = dialog[0]
         if image_path:
-            self.image_lbl.setPixmap(QtGui.QPixmap(image_path).scaled(128, 128))
+            self.image_lbl.set_image(image_path)
 
     def create_item(self):
         empty_fields = check_for_empty_fields(self.name_le, self.barcode_le)
@@ -159,35 +119,43 @@ class CreateItemWindow(QWidget):
         item = ItemCreate(
             title=title, price=Decimal(price), quantity=quantity, bar_code=bar_code, description=description
         )
-        self._api.create_item(
-            self._api.get_user_me().id,
-            item,
+        self.save_btn.setEnabled(False)
+        current_user = self._store.current_user
+        self._tasks.submit(
+            lambda: self._api.create_item((current_user or self._api.get_user_me()).id, item),
+            on_result=self.__item_created,
+            on_error=self.__request_failed,
         )
 
+    def __item_created(self, item: Item):
         self.itemCreated.emit(item)
-
+        self._store.put_item(item)
         self.close()
 
+    def __request_failed(self, error: Exception):
+        self.save_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", str(error))
+
 
 class EditItemWindow(QWidget):
     aboutToClose = QtCore.Signal()
     itemDeleted = QtCore.Signal()
 
-    def __init__(self, item_view: ItemView, api: TimAPI) -> None:
+    def __init__(self, item: Item, api: TimAPI, store: EntityStore) -> None:
         super().__init__()
 
-        item = item_view.item
-        self.item_view = item_view
         self.item_id = item.id
         self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
 
         self.delete_btn = QPushButton("Delete")
         self.save_btn = QPushButton("Save")
         self.cancel_btn = QPushButton("Cancel")
 
-        self.save_btn.setIcon(QtGui.QIcon(f"{icons_path}/tick32x32.png"))
-        self.cancel_btn.setIcon(QtGui.QIcon(f"{icons_path}/close32x32.png"))
-        self.delete_btn.setIcon(QtGui.QIcon(f"{icons_path}/trash32x32.png"))
+        self.save_btn.setIcon(icons.icon("tick32x32.png"))
+        self.cancel_btn.setIcon(icons.icon("close32x32.png"))
+        self.delete_btn.setIcon(icons.icon("trash32x32.png"))
         self.delete_btn.setStyleSheet("color: red")
 
         self.save_btn.clicked.connect(self.save_edit)
@@ -219,10 +187,9 @@ class EditItemWindow(QWidget):
         form_layout.addRow("<b>Quantity:</b>", self.quantity_sb)
         form_layout.addRow("<b>Description:</b>", self.description_te)
 
-        image_path = f"{icons_path}/broken-image32x32.png" if item.image_path is None else item.image_path
-        self.image_lbl = ClickableLabel()
+        self.image_lbl = ImageLabel()
         self.image_lbl.setToolTip("Select image...")
-        self.image_lbl.setPixmap(QtGui.QPixmap(image_path))
+        self.image_lbl.set_image(item.image_path)
         self.image_lbl.setAlignment(QtCore.Qt.AlignTop)
         self.image_lbl.clicked.connect(self.__set_image)
 
@@ -250,15 +217,21 @@ class EditItemWindow(QWidget):
         dialog = QFileDialog.getOpenFileName(self, "Open File", filter="Image files (*.jpg *.png)")
         self.image_path = dialog[0]
         if self.image_path:
-            self.image_lbl.setPixmap(QtGui.QPixmap(self.image_path).scaled(128, 128))
+            self.image_lbl.set_image(self.image_path)
 
     def delete_item(self):
         button = QMessageBox.warning(self, "Delete item", "Confirm deletion?", QMessageBox.No, QMessageBox.Yes)
 
         if button == QMessageBox.Yes:
-            self._api.delete_item(self.item_id)
-            self.close()
-            self.itemDeleted.emit()
+            self.delete_btn.setEnabled(False)
+            self._tasks.submit(
+                self._api.delete_item, self.item_id, on_result=self.__item_deleted, on_error=self.__request_failed
+            )
+
+    def __item_deleted(self, _: Item):
+        self.close()
+        self.itemDeleted.emit()
+        self._store.remove_item(self.item_id)
 
     def save_edit(self):
         empty_fields = check_for_empty_fields(self.name_le, self.barcode_le)
@@ -271,7 +244,9 @@ class EditItemWindow(QWidget):
         bar_code = self.barcode_le.text()
         description = self.description_te.toPlainText()
 
-        item_updated = self._api.update_item(
+        self.save_btn.setEnabled(False)
+        self._tasks.submit(
+            self._api.update_item,
             self.item_id,
             ItemUpdate(
                 title=title,
@@ -281,26 +256,35 @@ class EditItemWindow(QWidget):
                 description=description,
                 image_path=self.image_path,
             ),
+            on_result=self.__item_updated,
+            on_error=self.__request_failed,
         )
 
-        self.item_view.update(item_updated)
-
+    def __item_updated(self, item: Item):
+        self._store.put_item(item)
         self.close()
 
+    def __request_failed(self, error: Exception):
+        self.save_btn.setEnabled(True)
+        self.delete_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", str(error))
+
 
 class CreateUserWindow(QWidget):
     userCreated = QtCore.Signal()
 
-    def __init__(self, api: TimAPI):
+    def __init__(self, api: TimAPI, store: EntityStore):
         super().__init__()
 
         self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
 
         self.create_btn = QPushButton("Create")
         self.cancel_btn = QPushButton("Cancel")
 
-        self.create_btn.setIcon(QtGui.QIcon(f"{icons_path}/tick32x32.png"))
-        self.cancel_btn.setIcon(QtGui.QIcon(f"{icons_path}/close32x32.png"))
+        self.create_btn.setIcon(icons.icon("tick32x32.png"))
+        self.cancel_btn.setIcon(icons.icon("close32x32.png"))
 
         self.create_btn.clicked.connect(self.__create_user)
         self.cancel_btn.clicked.connect(self.close)
@@ -336,26 +320,38 @@ class CreateUserWindow(QWidget):
         if empty_fields:
             return
 
-        self._api.create_user(
+        self.create_btn.setEnabled(False)
+        self._tasks.submit(
+            self._api.create_user,
             UserCreate(
                 name=self.name_le.text(),
                 email=self.email_le.text(),
                 is_admin=self.is_admin_cb.isChecked(),
                 password=self.password_le.text(),
-            )
+            ),
+            on_result=self.__user_created,
+            on_error=self.__request_failed,
         )
 
+    def __user_created(self, user: User):
+        self._store.put_user(user)
         self.userCreated.emit()
         self.close()
 
+    def __request_failed(self, error: Exception):
+        self.create_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", str(error))
+
 
 class BasicUserEditWindow(QWidget):
     userUpdated = QtCore.Signal()
 
-    def __init__(self, api: TimAPI, user: User, width: int = 500, height: int = 500):
+    def __init__(self, api: TimAPI, user: User, store: EntityStore, width: int = 500, height: int = 500):
         super().__init__()
 
         self._api = api
+        self._store = store
+        self._tasks = TaskRunner(self)
         self.current_user = user
 
         self.save_btn = QPushButton("Save")
@@ -366,8 +362,8 @@ class BasicUserEditWindow(QWidget):
         self.cancel_btn.clicked.connect(self.close)
         self.save_btn.clicked.connect(self.__update_user)
 
-        self.save_btn.setIcon(QtGui.QIcon(f"{icons_path}/tick32x32.png"))
-        self.cancel_btn.setIcon(QtGui.QIcon(f"{icons_path}/close32x32.png"))
+        self.save_btn.setIcon(icons.icon("tick32x32.png"))
+        self.cancel_btn.setIcon(icons.icon("close32x32.png"))
 
         self.name_le = CustomLineEdit(self.current_user.name)
         self.email_le = CustomLineEdit(self.current_user.email)
@@ -418,23 +414,40 @@ class BasicUserEditWindow(QWidget):
             or self.current_user.is_admin != is_admin
             or password
         ):
-            self._api.update_user(
-                self.current_user.id, UserUpdate(name=name, email=email, password=password, is_admin=is_admin)
+            self.save_btn.setEnabled(False)
+            self._tasks.submit(
+                self._api.update_user,
+                self.current_user.id,
+                UserUpdate(name=name, email=email, password=password, is_admin=is_admin),
+                on_result=self.__user_updated,
+                on_error=self._request_failed,
             )
+        else:
+            self.__user_updated(self.current_user)
 
+    def __user_updated(self, user: User):
+        self._store.put_user(user)
         self.userUpdated.emit()
         self.close()
 
+    def _request_failed(self, error: Exception):
+        self.save_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", str(error))
+
 
 class AdminUserEditWindow(BasicUserEditWindow):
-    def __init__(self, api: TimAPI, user: User):
-        super().__init__(api, user)
+    def __init__(self, api: TimAPI, user: User, store: EntityStore):
+        super().__init__(api, user, store)
 
         # Hide the "Is Admin:" label and it's checkbox
         self._form_layout.itemAt(6).widget().hide()
         self.is_admin_cb.hide()
 
         self.list_view = ListView()
+        self._user_rows: dict[int, UserEditItem] = {}
+        # a row is a few widgets, many users are added over several frames
+        self._user_feeder = ChunkedFeeder(self.__insert_user_rows, parent=self)
+        self._unplaced_rows: list[UserEditItem] = []
         self._main_layout.insertWidget(1, QLabel("<b>All users:</b>"))
         self._main_layout.insertWidget(2, self.list_view)
 
@@ -445,25 +458,62 @@ class AdminUserEditWindow(BasicUserEditWindow):
 
         self.create_user_btn.clicked.connect(self.__open_create_user_window)
 
-        self.create_user_btn.setIcon(QtGui.QIcon(f"{icons_path}/plus32x32.png"))
+        self.create_user_btn.setIcon(icons.icon("plus32x32.png"))
 
+        self._store.usersAdded.connect(self.__add_users)
+        self._store.userUpdated.connect(self.__update_user_row)
+        self._store.userRemoved.connect(self.__remove_user_row)
+
+        self.list_view.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Maximum, QSizePolicy.Expanding))
         self.populate_user_list()
 
     def populate_user_list(self):
-        for user in self._api.get_users():
-            if user.id == self.current_user.id:
+        if self._store.users_loaded:
+            self.__add_users(self._store.users())
+        else:
+            self._tasks.submit(self._api.get_users, on_result=self.__users_fetched, on_error=self._request_failed)
+
+    def __users_fetched(self, users: list[User]):
+        self._store.put_users(users, complete=True)
+        self.__add_users(self._store.users())
+
+    def __add_users(self, users: list[User]):
+        self._user_feeder.add(users)
+
+    def __insert_user_rows(self, users: list[User]):
+        for user in users:
+            if user.id == self.current_user.id or user.id in self._user_rows:
                 continue
 
             user_edit = UserEditItem(user)
             user_edit.editUser.connect(self.__edit_user)
             user_edit.deleteUser.connect(self.__delete_user)
-            self.list_view.addWidget(user_edit)
-
-        self.list_view.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Maximum, QSizePolicy.Expanding))
+            self._user_rows[user.id] = user_edit
+            self._unplaced_rows.append(user_edit)
+
+        # laying out the list takes longer the more rows it has, the rows are placed in batches doubling
+        # in size so it's only done a few times
+        placed_rows = len(self._user_rows) - len(self._unplaced_rows)
+        if len(self._unplaced_rows) >= max(placed_rows, 20) or not self._user_feeder.pending():
+            # keep the spacer at the end of the list
+            self.list_view.insertWidgets(self.list_view.count() - 1, self._unplaced_rows)
+            self._unplaced_rows = []
+
+    def __update_user_row(self, user: User):
+        self._user_feeder.flush()
+        user_edit = self._user_rows.get(user.id)
+        if user_edit is not None:
+            user_edit.set_user(user)
+
+    def __remove_user_row(self, id: int):
+        self._user_feeder.flush()
+        user_edit = self._user_rows.pop(id, None)
+        if user_edit is not None:
+            self.list_view.removeWidget(user_edit)
+            user_edit.deleteLater()
 
     def __edit_user(self, user: User):
-        self._edit_user_window = BasicUserEditWindow(self._api, user, height=200)
-        self._edit_user_window.userUpdated.connect(self.__update_user_list)
+        self._edit_user_window = BasicUserEditWindow(self._api, user, self._store, height=200)
         self._edit_user_window.show()
 
     def __delete_user(self, user: User):
@@ -472,23 +522,21 @@ class AdminUserEditWindow(BasicUserEditWindow):
         )
 
         if button == QMessageBox.Yes:
-            self._api.delete_user(user.id)
-            self.__update_user_list()
+            self._tasks.submit(
+                self._api.delete_user,
+                user.id,
+                on_result=lambda _: self._store.remove_user(user.id),
+                on_error=self._request_failed,
+            )
 
     def __open_create_user_window(self):
-        self._create_user_window = CreateUserWindow(self._api)
-        self._create_user_window.userCreated.connect(self.__update_user_list)
+        self._create_user_window = CreateUserWindow(self._api, self._store)
         self._create_user_window.show()
 
-    # TODO: maybe avoid a request to the api when updating the list
-    def __update_user_list(self):
-        self.list_view.clear()
-        self.populate_user_list()
-
 
 class NormalUserEditWindow(BasicUserEditWindow):
-    def __init__(self, api: TimAPI, user: User):
-        super().__init__(api, user, height=200)
+    def __init__(self, api: TimAPI, user: User, store: EntityStore):
+        super().__init__(api, user, store, height=200)
 
         # Hide the "Is Admin:" label and it's checkbox
         self._form_layout.itemAt(6).widget().hide()
@@ -498,26 +546,103 @@ class NormalUserEditWindow(BasicUserEditWindow):
 class MainWindow(QMainWindow):
     MINIMUM_WIDTH = 500
     MINIMUM_HEIGHT = 500
+    SEARCH_DEBOUNCE_MS = 150
 
-    def __init__(self, api: TimAPI):
+    def __init__(self, api: TimAPI, store: Optional[EntityStore] = None):
         super().__init__()
 
         self._api = api
-        self.items_list = ItemsList(api.items())
-        self.items_list.reachedEnd.connect(self.__fetch_more_data)
+        self._tasks = TaskRunner(self)
+        self.store = store if store is not None else EntityStore(self)
+
+        # its first sync only gets the revision of the server, the loaded items are synced from then on
+        self.delta_sync = DeltaSync(api, self.store, self)
+        self.delta_sync.failed.connect(self.__request_failed)
+        self.delta_sync.start()
+
+        self.pager = ItemPager(api.items, self)
+        self.pager.pageLoaded.connect(self.store.put_items)
+        self.pager.failed.connect(self.__request_failed)
+        self.pager.pageLoaded.connect(self.__first_page_loaded, QtCore.Qt.SingleShotConnection)
+
+        # fetched while the window is built, the results are only delivered once it's done
+        self.pager.fetch_more()
+        if self.store.current_user is None:
+            self._tasks.submit(self._api.get_user_me, on_result=self.store.set_current_user)
+
+        # loads the first pages of the sort and filters of `query_bar` while not every item is loaded
+        self._query_pager: Optional[ItemPager] = None
+        self._query_timer = QtCore.QTimer(self)
+        self._query_timer.setSingleShot(True)
+        self._query_timer.setInterval(MainWindow.SEARCH_DEBOUNCE_MS)
+        self._query_timer.timeout.connect(self.__fetch_query_pages)
+
+        self.items_list = ItemsList([])
+        self.items_list.reachedEnd.connect(lambda: self.__active_pager().fetch_more())
+        self.items_list.nearEnd.connect(lambda: self.__active_pager().prefetch())
+        self.store.itemsAdded.connect(self.items_list.add_items)
+        self.store.itemUpdated.connect(self.items_list.update_item)
+        self.store.itemRemoved.connect(self.items_list.remove_item)
+
+        self.search_index = SearchIndex()
+        # indexing a large page takes longer than listing it, it's spread over several frames as well
+        self._indexer = ChunkedFeeder(self.search_index.add_items, parent=self)
+        self._indexer.finished.connect(self.__refresh_search)
+        self.store.itemsAdded.connect(self._indexer.add)
+        self.store.itemUpdated.connect(self.__index_item)
+        self.store.itemRemoved.connect(self.__unindex_item)
+        for signal in (self.store.itemUpdated, self.store.itemRemoved):
+            signal.connect(self.__refresh_search)
+
         self.searchbar = QLineEdit()
         self.searchbar.setPlaceholderText("Search...")
 
-        self.items_list.clicked.connect(self.open_edit_window)
-        self.searchbar.textChanged.connect(self.search)
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(MainWindow.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(lambda: self.search(self.searchbar.text()))
+
+        self.items_list.itemClicked.connect(self.open_edit_window)
+        self.searchbar.textChanged.connect(self._search_timer.start)
+
+        self.query_bar = ItemQueryBar()
+        self.query_bar.queryChanged.connect(self.set_item_query)
+        self.store.usersAdded.connect(self.query_bar.add_owners)
+        self.store.currentUserChanged.connect(lambda user: self.query_bar.add_owners([user]))
+        if self.store.current_user is not None:
+            self.query_bar.add_owners([self.store.current_user])
+        if self.store.users_loaded:
+            self.query_bar.add_owners(self.store.users())
 
         self.create_new_item_btn = QPushButton("Add new Item")
-        self.create_new_item_btn.setIcon(QtGui.QIcon(f"{icons_path}/plus32x32.png"))
+        self.create_new_item_btn.setIcon(icons.icon("plus32x32.png"))
         self.create_new_item_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self.create_new_item_btn.clicked.connect(self.open_create_window)
 
+        self.bulk_delete_btn = QPushButton("Delete selected")
+        self.bulk_delete_btn.setIcon(icons.icon("trash32x32.png"))
+        self.bulk_delete_btn.clicked.connect(self.bulk_delete)
+        self.bulk_adjust_btn = QPushButton("Adjust quantity")
+        self.bulk_adjust_btn.clicked.connect(self.bulk_adjust_quantity)
+        self.bulk_withdraw_btn = QPushButton("Withdraw")
+        self.bulk_withdraw_btn.clicked.connect(self.bulk_withdraw)
+        self.bulk_buttons = (self.bulk_delete_btn, self.bulk_adjust_btn, self.bulk_withdraw_btn)
+        for button in self.bulk_buttons:
+            button.setEnabled(False)
+            button.setToolTip("Select the items with Ctrl or Shift")
+        self.items_list.selectionModel().selectionChanged.connect(self.__selection_changed)
+
+        self.export_btn = QPushButton("Export")
+        self.export_btn.setToolTip("Export the whole inventory to a CSV or JSON Lines file")
+        self.export_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
+        self.export_btn.clicked.connect(self.export_inventory)
+
+        self.dashboard_btn = QPushButton("Dashboard")
+        self.dashboard_btn.setToolTip("Stock value, value by owner and the items to reorder")
+        self.dashboard_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
+
         self.config_user_btn = QPushButton()
-        self.config_user_btn.setIcon(QtGui.QIcon(f"{icons_path}/gear32x32.png"))
+        self.config_user_btn.setIcon(icons.icon("gear32x32.png"))
         self.config_user_btn.setToolTip("Edit user")
         self.config_user_btn.clicked.connect(self.__open_edit_user_window)
 
@@ -526,11 +651,15 @@ class MainWindow(QMainWindow):
             create_widgets_with_layout(
                 QVBoxLayout,
                 self.searchbar,
+                self.query_bar,
                 self.items_list,
                 create_widgets_with_layout(
                     QHBoxLayout,
                     self.create_new_item_btn,
+                    *self.bulk_buttons,
                     QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Maximum),
+                    self.dashboard_btn,
+                    self.export_btn,
                     self.config_user_btn,
                 ),
             ),
@@ -541,37 +670,220 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(central_widget)
 
-    def __fetch_more_data(self):
-        print(f"adding more items, current len: {len(self.items_list)}")
-        self.items_list.add_items(self._api.items(skip=len(self.items_list) + 100))
-
-    def open_edit_window(self, item_view: ItemView):
-        self.edit_window = EditItemWindow(item_view, self._api)
-        self.edit_window.aboutToClose.connect(lambda: item_view.clear_selection())
-        self.edit_window.itemDeleted.connect(lambda: self.items_list.remove_selected_item())
+        # hidden panel with the latencies of the requests, toggled with Ctrl+Shift+D
+        self.diagnostics_panel = DiagnosticsPanel(api.request.histogram(), self)
+        self.diagnostics_shortcut = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self)
+        self.diagnostics_shortcut.activated.connect(self.diagnostics_panel.toggle)
+
+        self.dashboard = InventoryDashboard(self.store, self)
+        self.dashboard_btn.clicked.connect(self.dashboard.toggle)
+
+        self.offline_sync = None
+        if isinstance(api, OfflineTimAPI):
+            self.offline_sync = OfflineSync(api, self.store, self)
+            self.offline_sync.statusChanged.connect(self.statusBar().showMessage)
+            self.offline_sync.conflictsFound.connect(self.__sync_conflicts_found)
+            self.offline_sync.failed.connect(self.__request_failed)
+            self.offline_sync.start()
+
+        # the changes made from other terminals, pushed by the server
+        self.live_updates = LiveUpdates(api, self.store, self)
+        self.live_updates.statusChanged.connect(self.statusBar().showMessage)
+        self.live_updates.failed.connect(self.__request_failed)
+        # the changes missed are fetched instead
+        self.live_updates.eventsLost.connect(self.delta_sync.sync)
+        self.live_updates.start()
+
+        startup_report.mark("main window built")
+
+    def __request_failed(self, error: Exception):
+        QMessageBox.critical(self, "Error", str(error))
+
+    def __first_page_loaded(self, _: list[Item]):
+        startup_report.mark("first items shown")
+        startup_report.finish()
+
+    def open_edit_window(self, item: Item):
+        self.edit_window = EditItemWindow(item, self._api, self.store)
+        self.edit_window.aboutToClose.connect(self.items_list.clear_selection)
         self.edit_window.show()
 
     def open_create_window(self):
-        self.create_window = CreateItemWindow(self._api)
+        self.create_window = CreateItemWindow(self._api, self.store)
+        # new items go to the top of the list, the store won't add them again
         self.create_window.itemCreated.connect(lambda item: self.items_list.insert_item(0, item))
         self.create_window.show()
 
     def __open_edit_user_window(self):
-        user = self._api.get_user_me()  # TODO: avoid a request to the api here
+        if self.store.current_user is not None:
+            self.__show_edit_user_window(self.store.current_user)
+        else:
+            self._tasks.submit(
+                self._api.get_user_me, on_result=self.__current_user_fetched, on_error=self.__request_failed
+            )
+
+    def __current_user_fetched(self, user: User):
+        self.store.set_current_user(user)
+        self.__show_edit_user_window(user)
+
+    def __show_edit_user_window(self, user: User):
         if user.is_admin:
-            self.edit_user_window = AdminUserEditWindow(self._api, user)
+            self.edit_user_window = AdminUserEditWindow(self._api, user, self.store)
         else:
-            self.edit_user_window = NormalUserEditWindow(self._api, user)
+            self.edit_user_window = NormalUserEditWindow(self._api, user, self.store)
 
         self.edit_user_window.show()
 
+    def __selection_changed(self):
+        selected = self.items_list.selectionModel().hasSelection()
+        for button in self.bulk_buttons:
+            button.setEnabled(selected)
+
+    def bulk_delete(self):
+        items = self.items_list.selected_items()
+        button = QMessageBox.warning(
+            self, "Delete items", f"Confirm deletion of {len(items)} items?", QMessageBox.No, QMessageBox.Yes
+        )
+        if button == QMessageBox.Yes:
+            self.__run_bulk_operation([ItemOperation(op="delete", id=item.id) for item in items], "Deleting items...")
+
+    def bulk_adjust_quantity(self):
+        items = self.items_list.selected_items()
+        amount, ok = QInputDialog.getInt(
+            self, "Adjust quantity", "Amount added to the quantity of each item:", 0, -2_147_483_647, 2_147_483_647
+        )
+        if ok and amount:
+            self.__run_bulk_operation(
+                [ItemOperation(op="update", id=item.id, quantity=max(item.quantity + amount, 0)) for item in items],
+                "Adjusting quantities...",
+            )
+
+    def bulk_withdraw(self):
+        items = self.items_list.selected_items()
+        quantity, ok = QInputDialog.getInt(self, "Withdraw", "Quantity withdrawn from each item:", 1, 1, 2_147_483_647)
+        if ok:
+            self.__run_bulk_operation(
+                [ItemOperation(op="withdraw", id=item.id, quantity=quantity) for item in items], "Withdrawing items..."
+            )
+
+    def __run_bulk_operation(self, operations: list[ItemOperation], label: str):
+        operation = BulkItemOperation(self._api, self.store, operations, self)
+
+        progress_dialog = QProgressDialog(label, "Cancel", 0, len(operations), self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(300)
+        progress_dialog.canceled.connect(operation.cancel)
+
+        def finished():
+            progress_dialog.reset()
+            progress_dialog.deleteLater()
+            operation.deleteLater()
+
+        operation.progress.connect(lambda done, _: progress_dialog.setValue(done))
+        operation.finished.connect(finished)
+        operation.finished.connect(self.__bulk_operation_finished)
+        operation.failed.connect(finished)
+        operation.failed.connect(self.__request_failed)
+        operation.start()
+
+    def __bulk_operation_finished(self, result: BulkResult):
+        self.items_list.clear_selection()
+
+        failed = result.failed()
+        if not failed and not result.cancelled:
+            return
+
+        lines = [f"{len(failed)} of {len(result.results)} operations failed."]
+        if result.cancelled:
+            lines.append(f"{result.cancelled} operations were cancelled.")
+        lines.extend(f"Item {operation_result.id}: {operation_result.detail}" for operation_result in failed[:10])
+        if len(failed) > 10:
+            lines.append("...")
+        QMessageBox.warning(self, "Bulk operation", "\n".join(lines))
+
+    def export_inventory(self):
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export inventory", "inventory.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+
+        format = "jsonl" if selected_filter.startswith("JSON") else "csv"
+        if not Path(path).suffix:
+            path += f".{format}"
+        export = ItemExport(self._api, Path(path), format, self)
+
+        # the total isn't known beforehand, the dialog only shows the count
+        progress_dialog = QProgressDialog("Exporting items...", "Cancel", 0, 0, self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(300)
+        progress_dialog.canceled.connect(export.cancel)
+
+        def finished(count: Optional[int] = None):
+            progress_dialog.reset()
+            progress_dialog.deleteLater()
+            export.deleteLater()
+            self.export_btn.setEnabled(True)
+            if count is not None and not export.cancelled:
+                QMessageBox.information(self, "Export", f"{count} items exported to {path}")
+
+        export.progress.connect(lambda count: progress_dialog.setLabelText(f"Exporting items... {count}"))
+        export.finished.connect(finished)
+        export.failed.connect(lambda _: finished())
+        export.failed.connect(self.__request_failed)
+        self.export_btn.setEnabled(False)
+        export.start()
+
+    def __sync_conflicts_found(self, conflicts: list[Conflict]):
+        lines = [f"{len(conflicts)} changes made offline were dropped, the items were kept as on the server."]
+        lines.extend(
+            f'{conflict.operation.kind.capitalize()} of "{conflict.operation.base["title"]}": {conflict.detail}'
+            for conflict in conflicts[:10]
+        )
+        if len(conflicts) > 10:
+            lines.append("...")
+        QMessageBox.warning(self, "Synchronization", "\n".join(lines))
+
+    def __index_item(self, item: Item):
+        self._indexer.flush()
+        self.search_index.add_item(item)
+
+    def __unindex_item(self, id: int):
+        self._indexer.flush()
+        self.search_index.remove_item(id)
+
+    def set_item_query(self, query: ItemQuery):
+        """
+        Sorts and filters the loaded items right away, and fetches the first pages of the query from the
+        server when some items aren't loaded yet, as they may come before the loaded ones
+        """
+        self.items_list.set_query(query)
+        self._query_timer.start()
+
+    def __fetch_query_pages(self):
+        if self._query_pager is not None:
+            self._query_pager.cancel()
+            self._query_pager.deleteLater()
+            self._query_pager = None
+
+        query = self.items_list.query()
+        if query.is_empty() or self.pager.exhausted:
+            return
+
+        self._query_pager = ItemPager(partial(self._api.items, query=query), self)
+        self._query_pager.pageLoaded.connect(self.store.put_items)
+        self._query_pager.failed.connect(self.__request_failed)
+        self._query_pager.fetch_more()
+
+    def __active_pager(self) -> ItemPager:
+        return self._query_pager if self._query_pager is not None else self.pager
+
     def search(self, query: str):
-        # For some reason when searching the scroll moves to the end, thus, fetching more data,
-        # this prevents it from happening
-        self.items_list.scroll_area.verticalScrollBar().setValue(0)
-
-        for widget in self.items_list.child_widgets:
-            if query.lower() in widget.item.title.lower():
-                widget.show()
-            else:
-                widget.hide()
+        self._search_timer.stop()
+        self.items_list.set_filter(self.search_index.search(query))
+        self.items_list.scrollToTop()
+
+    def __refresh_search(self):
+        # the results of the current query may have changed with the items
+        if self.searchbar.text():
+            self._search_timer.start()
@@ -0,0 +1,125 @@
+import threading
+from typing import Any, Callable, Optional
+
+from PySide6 import QtCore, QtWidgets
+
+API_MAX_THREADS = 4
+
+_api_thread_pool: Optional[QtCore.QThreadPool] = None
+
+
+def api_thread_pool() -> QtCore.QThreadPool:
+    """
+    Thread pool shared by every window to run the `TimAPI` calls off the GUI thread
+    """
+    global _api_thread_pool
+    if _api_thread_pool is None:
+        _api_thread_pool = QtCore.QThreadPool()
+        _api_thread_pool.setMaxThreadCount(API_MAX_THREADS)
+    return _api_thread_pool
+
+
+class TaskSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(Exception)
+    done = QtCore.Signal()
+
+    # emitted from the worker thread, they are delivered in the GUI thread through a queued connection
+    _result = QtCore.Signal(object)
+    _error = QtCore.Signal(Exception)
+
+    def __init__(self, task: "Task"):
+        super().__init__()
+        self._task = task
+        self._result.connect(self.__deliver_result)
+        self._error.connect(self.__deliver_error)
+
+    def __deliver_result(self, result: Any):
+        if not self._task.is_cancelled():
+            self.finished.emit(result)
+        self.done.emit()
+
+    def __deliver_error(self, error: Exception):
+        if not self._task.is_cancelled():
+            self.failed.emit(error)
+        self.done.emit()
+
+
+class Task(QtCore.QRunnable):
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = threading.Event()
+        self.signals = TaskSignals(self)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self):
+        if self.is_cancelled():
+            self.signals._result.emit(None)
+            return
+
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            self.signals._error.emit(e)
+        else:
+            self.signals._result.emit(result)
+
+
+class TaskRunner(QtCore.QObject):
+    """
+    Submits jobs to the API thread pool on behalf of a window. Every job still pending when the
+    window is closed (or destroyed) is cancelled, so its result is never delivered.
+    """
+
+    def __init__(self, parent: QtCore.QObject, pool: Optional[QtCore.QThreadPool] = None):
+        super().__init__(parent)
+
+        self._pool = pool if pool is not None else api_thread_pool()
+        self._tasks: set[Task] = set()
+
+        # only windows are closed, the filter isn't installed on the other objects as it sees all their events
+        if isinstance(parent, QtWidgets.QWidget):
+            parent.installEventFilter(self)
+        tasks = self._tasks
+        parent.destroyed.connect(lambda: [task.cancel() for task in tasks])
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        **kwargs,
+    ) -> Task:
+        task = Task(fn, *args, **kwargs)
+        if on_result is not None:
+            task.signals.finished.connect(on_result)
+        if on_error is not None:
+            task.signals.failed.connect(on_error)
+        task.signals.done.connect(lambda: self._tasks.discard(task))
+
+        self._tasks.add(task)
+        self._pool.start(task)
+        return task
+
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def cancel_all(self):
+        for task in self._tasks:
+            task.cancel()
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if watched is self.parent() and event.type() == QtCore.QEvent.Close:
+            self.cancel_all()
+        return super().eventFilter(watched, event)